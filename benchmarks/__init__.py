@@ -0,0 +1 @@
+# Benchmarks for SpaceFight. Each module can be run with python -m benchmarks.<name>
@@ -0,0 +1,219 @@
+"""
+Scenario benchmarks for the combat hot paths.
+
+Builds the level with N characters and M enemies and times the enemy, character and draw
+paths in isolation and together as a full tick. Every run is appended to a results file,
+and compared against a stored baseline to flag regressions.
+
+    python -m benchmarks.combat
+    python -m benchmarks.combat --counts 10,100 --save-baseline
+"""
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.scenario import create_headless_game, build_level, PLAYABLE_CHARACTERS
+from managers import EnemySwarm
+
+import pygame
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+RESULTS_PATH = BENCHMARK_DIR / "results.json"
+BASELINE_PATH = BENCHMARK_DIR / "baseline.json"
+
+DEFAULT_COUNTS = [10, 100, 1000, 5000]
+HISTORY_LIMIT = 50  # Runs kept in the results file
+
+# A measurement is a regression when its median is this much slower than the baseline,
+# and by at least MIN_REGRESSION_MS so tiny timings don't flag on noise
+REGRESSION_THRESHOLD = 0.20
+MIN_REGRESSION_MS = 0.05
+
+
+def time_call(func, iterations):
+    """
+    Time a function over a number of iterations.
+    Args:
+        func (callable): The function to time
+        iterations (int): How many times to call it
+    Returns:
+        dict: Median, p95 and mean time per call in ms
+    """
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return {
+        "median_ms": statistics.median(times),
+        "p95_ms": times[min(len(times) - 1, int(len(times) * 0.95))],
+        "mean_ms": statistics.fmean(times),
+    }
+
+
+def run_scenario(game, character_count, enemy_count, iterations):
+    """
+    Time every hot path for one scenario.
+    Args:
+        game (Game): The game instance
+        character_count (int): Number of selected characters
+        enemy_count (int): Number of enemies
+        iterations (int): Calls per measurement
+    Returns:
+        dict: Measurement name -> timings
+    """
+    dt = game.fixed_dt
+    enemy_manager = game.enemy_manager
+    character_manager = game.character_manager
+
+    def find_all_targets():
+        if isinstance(enemy_manager, EnemySwarm):
+            enemy_manager._find_nearest_targets()
+            return
+        for enemy in enemy_manager.enemies:
+            enemy_manager._find_nearest_target(enemy)
+
+    def handle_collision():
+        attacker = character_manager.active_characters[0]
+        attack_rect = attacker.attack_range.get_rect(midleft=attacker.rect.center)
+        enemy_manager.handle_collision(attack_rect, 0)
+
+    def full_tick():
+        game.update(dt)
+        game.draw()
+
+    # Each measurement gets a freshly built level so they don't affect each other
+    measurements = {
+        "EnemyManager.update": lambda: enemy_manager.update(dt),
+        "EnemyManager.handle_collision": handle_collision,
+        "EnemyManager._find_nearest_target": find_all_targets,
+        "CharacterManager.update_characters": lambda: character_manager.update_characters(dt),
+        "LevelScreen.draw": lambda: game.current_screen.draw(),
+        "full_tick": full_tick,
+    }
+
+    results = {}
+    for name, func in measurements.items():
+        build_level(game, character_count, enemy_count)
+        results[name] = time_call(func, iterations)
+    return results
+
+
+def find_regressions(results, baseline):
+    """
+    Compare a run against the baseline.
+    Args:
+        results (dict): Enemy count -> measurement -> timings of this run
+        baseline (dict): The same for the baseline run
+    Returns:
+        list: Lines describing every regression
+    """
+    regressions = []
+    for count, measurements in results.items():
+        for name, timings in measurements.items():
+            base = baseline.get(count, {}).get(name)
+            if not base:
+                continue
+            slower_by = timings["median_ms"] - base["median_ms"]
+            if slower_by > MIN_REGRESSION_MS and slower_by > base["median_ms"] * REGRESSION_THRESHOLD:
+                regressions.append(
+                    f"{name} with {count} enemies: {timings['median_ms']:.3f} ms, "
+                    f"baseline {base['median_ms']:.3f} ms (+{slower_by / base['median_ms']:.0%})"
+                )
+    return regressions
+
+
+def load_json(path, default):
+    """
+    Load a JSON file.
+    Args:
+        path (Path): The file to read
+        default: Returned when the file doesn't exist
+    """
+    if not path.exists():
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    """
+    Run the benchmarks.
+    Returns:
+        int: Exit code, 1 when a regression against the baseline was found
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the SpaceFight combat hot paths.")
+    parser.add_argument("--characters", type=int, default=2, choices=range(1, len(PLAYABLE_CHARACTERS) + 1))
+    parser.add_argument(
+        "--counts",
+        default=",".join(str(count) for count in DEFAULT_COUNTS),
+        help="comma separated enemy counts",
+    )
+    parser.add_argument(
+        "--enemy-backend", choices=["sprites", "swarm"], default="sprites", help="enemy backend to time"
+    )
+    parser.add_argument("--iterations", type=int, default=30, help="calls per measurement")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    game = create_headless_game(args.enemy_backend)
+    counts = [int(count) for count in args.counts.split(",")]
+
+    results = {}
+    for count in counts:
+        print(f"{args.characters} characters, {count} enemies")
+        results[str(count)] = run_scenario(game, args.characters, count, args.iterations)
+        for name, timings in results[str(count)].items():
+            print(f"  {name:<36} median {timings['median_ms']:9.3f} ms   p95 {timings['p95_ms']:9.3f} ms")
+    pygame.quit()
+
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "characters": args.characters,
+        "enemy_backend": args.enemy_backend,
+        "iterations": args.iterations,
+        "results": results,
+    }
+
+    history = load_json(RESULTS_PATH, {"runs": []})
+    history["runs"] = (history["runs"] + [run])[-HISTORY_LIMIT:]
+    with open(RESULTS_PATH, "w") as f:
+        json.dump(history, f, indent=2)
+    print(f"Results appended to {RESULTS_PATH}")
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(run, f, indent=2)
+        print(f"Baseline saved to {BASELINE_PATH}")
+        return 0
+
+    baseline = load_json(BASELINE_PATH, None)
+    if baseline is None:
+        print("No baseline stored yet, run with --save-baseline to create one")
+        return 0
+    if baseline.get("characters") != args.characters:
+        print(f"Baseline was run with {baseline.get('characters')} characters, not comparing")
+        return 0
+    if baseline.get("enemy_backend", "sprites") != args.enemy_backend:
+        print(f"Baseline was run with the {baseline.get('enemy_backend', 'sprites')} enemy backend, not comparing")
+        return 0
+
+    regressions = find_regressions(results, baseline["results"])
+    for line in regressions:
+        print(f"REGRESSION: {line}")
+    if not regressions:
+        print("No regressions against the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""
+Memory benchmark for the sprite entities.
+
+Measures how much memory every Character and Enemy keeps, and how much temporary memory
+their update allocates each tick, with tracemalloc. Surfaces are allocated by SDL and
+don't show up here, only Python objects do.
+
+CPython doesn't count allocations that are freed again right away, so temporaries are
+measured as the peak memory during one entity's update above what was allocated before it.
+An update that allocates nothing, not even a temporary Vector2, peaks at 0 bytes.
+
+    python -m benchmarks.memory
+    python -m benchmarks.memory --enemies 500 --ticks 120
+"""
+import os
+import sys
+import argparse
+import contextlib
+import statistics
+from array import array
+import tracemalloc
+
+from benchmarks.scenario import create_headless_game, build_level, PLAYABLE_CHARACTERS
+from characters import Regar
+from enemy import Enemy, EnemyState
+from input_state import MOVE_DOWN, MOVE_RIGHT, NO_INPUT, InputSnapshot, action_bit
+
+import pygame
+
+
+def instance_size(entity):
+    """
+    Get the size of an entity object itself, with its attribute dict if it has one.
+    Args:
+        entity (Character): The character or enemy
+    Returns:
+        int: Size in bytes
+    """
+    size = sys.getsizeof(entity)
+    if hasattr(entity, "__dict__"):
+        size += sys.getsizeof(entity.__dict__)
+    return size
+
+
+def retained_per_entity(create, count):
+    """
+    Measure the memory an entity keeps after it was created.
+    Args:
+        create (callable): Creates one entity
+        count (int): Number of entities to create, the result is their average
+    Returns:
+        float: Bytes per entity
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [create() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return (after - before) / count
+
+
+def update_allocations(entities, update, ticks):
+    """
+    Measure the temporary memory of every entity update and what is still allocated after the ticks.
+    Args:
+        entities (list): The entities to update
+        update (callable): Updates one entity for one tick
+        ticks (int): Number of ticks to run
+    Returns:
+        dict: Mean and max temporary bytes per entity update, bytes still allocated per tick
+    """
+    # Allocated up front, so storing the measurements doesn't count as retained memory
+    peaks = array("q", bytes(8 * ticks * len(entities)))
+    index = 0
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    for _ in range(ticks):
+        for entity in entities:
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            update(entity)
+            peaks[index] = tracemalloc.get_traced_memory()[1] - current
+            index += 1
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return {
+        "temporary_mean_bytes": statistics.fmean(peaks) if peaks else 0.0,
+        "temporary_max_bytes": max(peaks, default=0),
+        "retained_bytes_per_tick": retained / ticks,
+    }
+
+
+def main(argv=None):
+    """
+    Run the memory benchmark.
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description="Measure the memory of the SpaceFight entities.")
+    parser.add_argument("--characters", type=int, default=2, choices=range(1, len(PLAYABLE_CHARACTERS) + 1))
+    parser.add_argument("--enemies", type=int, default=200, help="enemies in the level")
+    parser.add_argument("--ticks", type=int, default=60, help="ticks to measure the updates over")
+    args = parser.parse_args(argv)
+
+    game = create_headless_game("sprites")
+    build_level(game, args.characters, args.enemies)
+    dt = game.fixed_dt
+
+    # Give every enemy a target and let them walk into attacking range first
+    for _ in range(30):
+        game.update(dt)
+    enemies = list(game.enemy_manager.enemies)
+    characters = list(game.character_manager.active_characters)
+
+    print(f"Entity memory ({args.enemies} created)")
+    print(f"  {'Enemy':<24} object {instance_size(enemies[0]):6} bytes, "
+          f"retained {retained_per_entity(lambda: Enemy(game, (0, 0)), args.enemies):9.1f} bytes")
+    print(f"  {'Character':<24} object {instance_size(characters[0]):6} bytes, "
+          f"retained {retained_per_entity(lambda: Regar(game), args.enemies):9.1f} bytes")
+
+    print(f"Allocations per update ({args.ticks} ticks, {len(enemies)} enemies, {len(characters)} characters)")
+    pursuing = [enemy for enemy in enemies if enemy.state == EnemyState.PURSUING and enemy.target]
+    attacking = [enemy for enemy in enemies if enemy.state == EnemyState.ATTACKING and enemy.target]
+    moving = InputSnapshot(sum(
+        action_bit(character.player_number, action)
+        for character in characters
+        for action in (MOVE_DOWN, MOVE_RIGHT)
+    ))
+    for name, entities, actions, update in (
+        ("Enemy.update", enemies, NO_INPUT, lambda enemy: enemy.update(dt)),
+        # Only the movement, without redrawing the sprite
+        ("Enemy._pursue_target", pursuing, NO_INPUT, lambda enemy: enemy._pursue_target(0.0)),
+        ("Enemy._perform_attack", attacking, NO_INPUT, lambda enemy: enemy._perform_attack(dt)),
+        ("Character.move", characters, NO_INPUT, lambda character: character.move(dt)),
+        # Moving characters also check if their movement should be logged
+        ("Character.move moving", characters, moving, lambda character: character.move(dt)),
+        # Advancing the animation and picking its frame
+        ("Character.update_sprite", characters, moving, lambda character: character.update_sprite()),
+        ("Enemy.update_sprite", enemies, NO_INPUT, lambda enemy: enemy.update_sprite()),
+    ):
+        game.input = actions
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            stats = update_allocations(entities, update, args.ticks)
+        print(
+            f"  {name:<24} temporary mean {stats['temporary_mean_bytes']:7.1f} bytes, "
+            f"max {stats['temporary_max_bytes']:5} bytes, "
+            f"retained {stats['retained_bytes_per_tick']:7.1f} bytes per tick"
+        )
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
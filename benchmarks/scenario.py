@@ -0,0 +1,68 @@
+import os
+import sys
+import random
+from pathlib import Path
+
+# Benchmarks run from the repository root like the game does, assets are loaded by relative path
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import pygame
+import config
+from enemy import EnemyState
+
+PLAYABLE_CHARACTERS = [name for name in config.CHARACTER_STATS if name != "Enemy"]
+
+
+def create_headless_game(enemy_backend=config.ENEMY_BACKEND):
+    """
+    Create a Game without a window or audio, like main.py --headless does.
+    Args:
+        enemy_backend (str): "sprites" or "swarm", see ENEMY_BACKEND in config.py
+    Returns:
+        Game: The game instance
+    """
+    os.chdir(REPO_ROOT)
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+
+    from game import Game
+
+    return Game(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, headless=True, enemy_backend=enemy_backend)
+
+
+def build_level(game, character_count, enemy_count, seed=0):
+    """
+    Put the game in the level with some characters and a fixed set of enemies already on screen.
+    Random spawning is switched off so every run measures the same fight.
+    Args:
+        game (Game): The game instance
+        character_count (int): Number of selected characters, 1 to 4
+        enemy_count (int): Number of enemies to place
+        seed (int): Seed for the enemy positions
+    """
+    game.start_level(PLAYABLE_CHARACTERS[:character_count])
+    game.seed_random(seed)
+
+    # Characters that die would end the level halfway through the measurements
+    for character in game.character_manager.active_characters:
+        character.health = character.max_health = 10**9
+
+    enemy_manager = game.enemy_manager
+    enemy_manager.clear()
+    enemy_manager.max_enemies = enemy_count
+    enemy_manager.waves.stop()
+    # Always measure the full quality, whatever the machine's frame times are
+    game.quality.reset()
+    game.quality.enabled = False
+
+    rng = random.Random(seed)
+    bounds = config.LEVEL_BOUNDS
+    for _ in range(enemy_count):
+        position = (
+            rng.uniform(bounds["left_x"], bounds["right_x"]),
+            rng.uniform(bounds["floor_y"], bounds["ceiling_y"]),
+        )
+        enemy_manager.spawn_enemy(position, EnemyState.PURSUING)
@@ -1,8 +1,19 @@
+import itertools
+import math
 import pygame
 from game_states import GameState
 import logging
 from typing import Optional, Tuple, List
-from config import CHARACTER_STATS, ATTACK_SETTINGS
+from config import CHARACTER_STATS, ATTACK_SETTINGS, RENDER_SETTINGS, SIMULATION_HZ
+from game_logging import log_event, MOVEMENT, COMBAT
+from input_state import ATTACK, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT, MOVE_UP
+from animation import get_animation_set
+from render_layers import ACTORS, EFFECTS
+
+_swing_ids = itertools.count(1)  # Every attack swing gets its own ID, see DamageBuffer
+
+HIT_FLASH_TICKS = max(1, round(RENDER_SETTINGS["hit_flash_duration"] * SIMULATION_HZ))
+
 
 class Character(pygame.sprite.Sprite):
     """
@@ -11,6 +22,18 @@ class Character(pygame.sprite.Sprite):
         pygame.sprite.Sprite: parent class
     """
 
+    # Attributes live in slots instead of a per-instance dict, which keeps thousands of
+    # enemies small and their attribute lookups fast (Sprite itself still has a dict)
+    __slots__ = (
+        "name", "health", "speed", "strength", "color", "game",
+        "image", "animations", "animation", "animation_frame", "animation_next_tick",
+        "facing_right", "hit_flash_until", "rect",
+        "position", "previous_position", "direction", "player_number",
+        "attacking", "attack_timer", "swing_id", "attack_cooldown", "attack_range",
+        "max_health", "is_dying", "visible", "animation_complete", "blink_count",
+        "death_blink_duration", "death_total_time", "max_blinks", "death_blink_timer",
+    )
+
     def __init__(self, name, game):
         """
         method to control the attributes of the characters
@@ -28,30 +51,31 @@ class Character(pygame.sprite.Sprite):
         self.color = stats["color"]
         self.game = game
         
-        # Create character sprite
-        self.image = pygame.Surface((50, 100))
-        self.image.fill(self.color)
+        # Create character sprite, the frames are shared by every character with the same sheet
+        self.animations = get_animation_set(name, self.color)
+        self.animation = self.animations.idle
+        self.animation_frame = 0
+        self.animation_next_tick = 0  # Tick the next frame of the animation is due on
         self.facing_right = True
-        
-        # Direction indicator
-        self.direction_indicator = pygame.Surface((10, 10))
-        self.direction_indicator.fill((0, 255, 0))
-        
-        self.update_sprite()
+        self.hit_flash_until = 0  # Tick the hit flash ends on
+        self.is_dying = False
+
+        self.image = self.animation.frames[0][self.facing_right]
         self.rect = self.image.get_rect()
         self.position = pygame.math.Vector2(self.rect.topleft)
+        self.previous_position = pygame.math.Vector2(self.position)  # Position at the previous simulation step
         self.direction = pygame.math.Vector2()
         self.player_number = None
         
         # Attack properties
         self.attacking = False
         self.attack_timer = 0
+        self.swing_id = None
         self.attack_cooldown = ATTACK_SETTINGS["cooldown"]
         self.attack_range = pygame.Surface(ATTACK_SETTINGS["range_size"])
         self.attack_range.fill(ATTACK_SETTINGS["range_color"])
         
         self.max_health = stats["health"]
-        self.is_dying = False
         self.visible = True
         self.animation_complete = False
         self.blink_count = 0
@@ -64,51 +88,96 @@ class Character(pygame.sprite.Sprite):
     def take_damage(self, amount: int) -> None:
         """Take damage"""
         self.health = max(0, self.health - amount)
+        self.hit_flash_until = self.game.tick_count + HIT_FLASH_TICKS
         if self.health <= 0 and not self.is_dying:
             self.is_dying = True
             self.death_blink_timer = self.death_blink_duration
             self.animation_complete = False
             self.blink_count = 0
 
+    def reset_interpolation(self):
+        """
+        Snap the previous position to the current one.
+        Call this after placing a character directly so it doesn't slide from its old spot.
+        """
+        self.previous_position.x = self.position.x
+        self.previous_position.y = self.position.y
+
+    def get_render_rect(self) -> pygame.Rect:
+        """
+        Get the rect to draw the character at, interpolated between the last two simulation steps
+        Returns:
+            pygame.Rect: The rect to draw at
+        """
+        render_rect = self.rect.copy()
+        alpha = self.game.interpolation_alpha
+        render_rect.topleft = (
+            int(self.previous_position.x + (self.position.x - self.previous_position.x) * alpha),
+            int(self.previous_position.y + (self.position.y - self.previous_position.y) * alpha),
+        )
+        return render_rect
+
+    def choose_animation(self):
+        """
+        Get the animation for the character's current state.
+        Returns:
+            Animation: One of the character's animations
+        """
+        animations = self.animations
+        if self.is_dying:
+            return animations.death
+        if self.attacking:
+            return animations.attack
+        if self.direction.x or self.direction.y:
+            return animations.walk
+        return animations.idle
+
     def update_sprite(self):
         """
-        method to update the sprite
+        method to update the sprite, advances the animation of the current state and picks its
+        pre-drawn frame. Calling it again on the same tick doesn't advance the animation twice.
         """
-        self.image.fill(self.color)
-        if self.facing_right:
-            self.image.blit(self.direction_indicator, (40, 45))
-        else:
-            self.image.blit(self.direction_indicator, (0, 45))
+        animation = self.choose_animation()
+        tick = self.game.tick_count
+        if animation is not self.animation:
+            self.animation = animation
+            self.animation_frame = 0
+            self.animation_next_tick = tick + animation.frame_ticks
+        elif tick >= self.animation_next_tick:
+            self.animation_frame = animation.next_frame(self.animation_frame)
+            self.animation_next_tick = tick + animation.frame_ticks
+
+        frames = animation.hit_flash if tick < self.hit_flash_until else animation.frames
+        self.image = frames[self.animation_frame][self.facing_right]
 
     def move(self, dt: float) -> None:
         """Move character
+        The direction and position are updated in place, moving doesn't create any vectors.
         Args:
             dt: time between frames
         """
-        keys = pygame.key.get_pressed()
-        if self.player_number == 1:
-            self.direction.x = keys[pygame.K_d] - keys[pygame.K_a]
-            self.direction.y = keys[pygame.K_s] - keys[pygame.K_w]
-        elif self.player_number == 2:
-            self.direction.x = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
-            self.direction.y = keys[pygame.K_DOWN] - keys[pygame.K_UP]
-
-        if self.direction.x > 0:
+        actions = self.game.input
+        direction = self.direction
+        direction.x = actions.axis(self.player_number, MOVE_LEFT, MOVE_RIGHT)
+        direction.y = actions.axis(self.player_number, MOVE_UP, MOVE_DOWN)
+
+        if direction.x > 0:
             self.facing_right = True
-        elif self.direction.x < 0:
+        elif direction.x < 0:
             self.facing_right = False
 
-        if self.direction.length() > 0:
-            self.direction = self.direction.normalize()
+        length = math.hypot(direction.x, direction.y)
+        if length > 0:
+            direction.x /= length
+            direction.y /= length
+            position = self.position
+            position.x += direction.x * self.speed * dt
+            position.y += direction.y * self.speed * dt
+        self.rect.x = int(self.position.x)
+        self.rect.y = int(self.position.y)
 
-        movement = self.direction * self.speed * dt
-        self.position += movement
-        self.rect.topleft = int(self.position.x), int(self.position.y)
-
-        self.update_sprite()
-
-        if self.direction.length() > 0:
-            print(f"{self.name} is moving to {self.position}")
+        if __debug__ and length > 0:
+            log_event(MOVEMENT, "moving", character=self.name, x=round(self.position.x), y=round(self.position.y))
 
     def attack(self, dt: float) -> None:
         """Perform attack
@@ -118,24 +187,20 @@ class Character(pygame.sprite.Sprite):
         if not self.game.is_in_state(GameState.LEVEL):
             return
 
-        if self.player_number == 1:
-            # player 1 attack with left/right mouse buttons
-            mouse = pygame.mouse.get_pressed()
-            is_attacking = mouse[0] or mouse[2]  # left or right mouse button
-        elif self.player_number == 2:
-            # player 2 attacks with K_RCTRL (right ctrl) and K_RSHIFT (right shift)
-            keys = pygame.key.get_pressed()
-            is_attacking = keys[pygame.K_RCTRL] or keys[pygame.K_RSHIFT]
+        # The attack inputs of every player are bound in INPUT_BINDINGS
+        is_attacking = self.game.input.pressed(self.player_number, ATTACK)
 
         if is_attacking and not self.attacking and self.attack_timer <= 0:
             self.attacking = True
             self.attack_timer = self.attack_cooldown
+            self.swing_id = next(_swing_ids)
             if self.game and hasattr(self.game, 'sound_manager'):
                 try:
                     self.game.sound_manager.play_sound("punch")
                 except AttributeError:
                     logging.warning("Sound manager not available")
-            print(f"{self.name} (player {self.player_number}) is attacking")
+            if __debug__:
+                log_event(COMBAT, "attacking", character=self.name, player=self.player_number)
 
         if self.attacking:
             attack_rect = self.attack_range.get_rect()
@@ -147,7 +212,7 @@ class Character(pygame.sprite.Sprite):
             # Collision detection
             if self.game.is_in_state(GameState.LEVEL):
                 if hasattr(self.game, 'enemy_manager'):
-                    self.game.enemy_manager.handle_collision(attack_rect, self.strength)
+                    self.game.enemy_manager.handle_collision(attack_rect, self.strength, self.swing_id)
                 else:
                     logging.warning("Enemy manager not available")
 
@@ -162,6 +227,10 @@ class Character(pygame.sprite.Sprite):
         Args:
             dt: time between frames
         """
+        # Copied by component, Vector2.update allocates while parsing its argument
+        self.previous_position.x = self.position.x
+        self.previous_position.y = self.position.y
+
         if self.is_dying:
             self.death_total_time -= dt
             self.death_blink_timer -= dt
@@ -174,35 +243,51 @@ class Character(pygame.sprite.Sprite):
             if self.blink_count >= self.max_blinks or self.death_total_time <= 0:
                 self.animation_complete = True
                 self.visible = False
+            self.update_sprite()
             return
 
         self.move(dt)
         self.attack(dt)
+        self.update_sprite()
 
-        if self.is_dying:
-            # Blink effect using death_blink_speed
-            current_time = pygame.time.get_ticks() / 1000  # Convert to seconds
-            if int(current_time / self.death_blink_speed) % 2 == 0:
-                self.image.fill(self.color)
-            else:
-                self.image.fill((0, 0, 0))  # Blink to black
-
-    def draw(self, screen):
+    def draw(self, screen) -> List[pygame.Rect]:
         """Draw method with death animation support
         Args:
             screen: screen to draw on
+        Returns:
+            list: The screen areas that were drawn to
+        """
+        if not self.visible or (self.is_dying and self.animation_complete):
+            return []
+
+        render_rect = self.get_render_rect()
+        drawn_rects = [screen.blit(self.image, render_rect)]
+        if self.attacking:
+            attack_rect = self.attack_range.get_rect()
+            if self.facing_right:
+                attack_rect.midleft = render_rect.center
+            else:
+                attack_rect.midright = render_rect.center
+            drawn_rects.append(screen.blit(self.attack_range, attack_rect))
+        return drawn_rects
+
+    def queue_draw(self, render_queue) -> None:
+        """Add the character to a level's render queue, in front of everything higher up the screen
+        Args:
+            render_queue (RenderQueue): The queue to add to
         """
         if not self.visible or (self.is_dying and self.animation_complete):
             return
 
-        screen.blit(self.image, self.rect)
+        render_rect = self.get_render_rect()
+        render_queue.add_sorted(ACTORS, self, render_rect.bottom, self.image, render_rect)
         if self.attacking:
             attack_rect = self.attack_range.get_rect()
             if self.facing_right:
-                attack_rect.midleft = (self.rect.centerx, self.rect.centery)
+                attack_rect.midleft = render_rect.center
             else:
-                attack_rect.midright = (self.rect.centerx, self.rect.centery)
-            screen.blit(self.attack_range, attack_rect)
+                attack_rect.midright = render_rect.center
+            render_queue.add(EFFECTS, self.attack_range, attack_rect)
 
     def set_player_number(self, number):
         """
@@ -220,6 +305,8 @@ class Regar(Character):
         Character: parent class
     """
 
+    __slots__ = ()
+
     def __init__(self, game):
         """
         method to control the attributes of the character
@@ -240,6 +327,8 @@ class Susan(Character):
         Character: parent class
     """
 
+    __slots__ = ()
+
     def __init__(self, game):
         """
         method to control the attributes of the character
@@ -260,6 +349,8 @@ class Emily(Character):
         Character: parent class
     """
 
+    __slots__ = ()
+
     def __init__(self, game):
         """
         method to control the attributes of the character
@@ -280,6 +371,8 @@ class Bart(Character):
         Character: parent class
     """
 
+    __slots__ = ()
+
     def __init__(self, game):
         """
         method to control the attributes of the character
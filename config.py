@@ -1,7 +1,12 @@
 # Display settings
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720 
-FPS = 60
+FPS = 60  # Render frame cap, 0 renders as fast as the display allows
+
+# Simulation settings. The game logic always advances in fixed steps of 1 / SIMULATION_HZ
+# so gameplay doesn't depend on how fast frames are drawn.
+SIMULATION_HZ = 120
+MAX_FRAME_TIME = 0.25  # Longest frame (in seconds) the simulation will try to catch up on
 
 # I find I have to define enemies first for the procdeural generation to work
 ENEMY_STATS = {
@@ -71,6 +76,11 @@ DEATH_ANIMATION = {
 }
 
 # Enemy spawn settings
+# Enemy simulation backend. "sprites" makes every enemy its own sprite (EnemyManager),
+# "swarm" simulates them all at once in NumPy arrays (EnemySwarm), for levels with thousands
+# of enemies. The swarm needs numpy installed, without it the game falls back to sprites.
+ENEMY_BACKEND = "sprites"
+
 ENEMY_SPAWN = {
     "max_enemies": 10,
     "spawn_cooldown": 3.0,
@@ -84,6 +94,26 @@ ENEMY_SPAWN = {
     ]
 }
 
+# Wave spawning, see WaveScheduler. The waves of every level are in assets/waves.json
+WAVE_SETTINGS = {
+    "path": "assets/waves.json",
+    "frame_budget_ms": 1000 / 60,  # Spawns wait while frames take longer than this
+    "max_spawns_per_tick": 2
+}
+
+# Enemy AI scheduling, see AIScheduler
+AI_SETTINGS = {
+    "enabled": True,  # False runs targeting and the full state machine for every enemy every tick
+    "retarget_interval": 8,  # Ticks between nearest player searches of an enemy
+    "near_distance": 400,  # Enemies closer than this to their target update every tick
+    "far_update_interval": 4  # Ticks between updates of enemies farther away
+}
+
+# Spatial hash settings, the grid used for collision and targeting queries
+SPATIAL_HASH_SETTINGS = {
+    "cell_size": 100  # About one enemy tall, so an attack box touches only a few cells
+}
+
 # Level boundaries
 LEVEL_BOUNDS = {
     "floor_y": 447,
@@ -92,12 +122,36 @@ LEVEL_BOUNDS = {
     "right_x": 1058
 }
 
+# Enemy navigation grid, see FlowField
+FLOW_FIELD_SETTINGS = {
+    "cell_size": 25,
+    # Area enemies walk in once inside the level, as left, top, right, bottom of their position
+    "area": (
+        LEVEL_BOUNDS["left_x"],
+        LEVEL_BOUNDS["floor_y"] - 100,
+        LEVEL_BOUNDS["right_x"],
+        LEVEL_BOUNDS["ceiling_y"]
+    ),
+    "obstacles": []  # Walls as (x, y, width, height), enemies path around them
+}
+
 # Sound settings
 SOUND_SETTINGS = {
     "default_music_volume": 0.5,
     "default_sound_volume": 0.5
 }
 
+# Music is streamed from disk, never decoded up front. The file of the track most likely to
+# play next is read into memory in the background so switching screens doesn't wait on the disk.
+MUSIC_SETTINGS = {
+    "crossfade_ms": 750,  # Fade out of the old track and fade in of the new one
+    "next_track": {
+        "main_menu": "character_select",  # The story has no music file yet
+        "story": "character_select",
+        "character_select": "battle"
+    }
+}
+
 SOUND_REGISTRY = {
     'music': {
         'main_menu': 'main_menu.mp3',
@@ -112,6 +166,103 @@ SOUND_REGISTRY = {
     }
 }
 
+# Asset cache settings
+ASSET_SETTINGS = {
+    "memory_budget_mb": 64,  # Decoded image data kept cached before the least recently used is dropped
+    "loader_threads": 4
+}
+
+# Assets the loading screen waits for before showing the main menu.
+# Backgrounds are scaled to the screen size.
+PRELOAD_ASSETS = {
+    "backgrounds": [
+        "assets/art/main_menu_background.png",
+        "assets/art/level_one.webp"
+    ],
+    "data": [
+        "assets/story.json",
+        "assets/waves.json"
+    ]
+}
+
+# Render settings
+RENDER_SETTINGS = {
+    "dirty_rects": True,  # Only redraw and present the parts of the level that changed
+    "max_dirty_rects": 200,  # Above this many rects a full flip is cheaper
+    "health_bar_steps": 50,  # Health levels an enemy health bar shows, one per pixel of its width
+    "hit_flash_duration": 0.1,  # Seconds a character shows its hit flash frame after taking damage
+    "hit_flash_color": (255, 255, 255)
+}
+
+# Sprite sheet animations, see animation.py. A sheet has one row per animation in this order,
+# every frame frame_size and facing right. Characters without a sheet get placeholder frames
+# drawn in their color.
+ANIMATION_SETTINGS = {
+    "frame_size": (50, 100),
+    "animations": {
+        "idle": {"frames": 1, "frame_duration": 0.5, "loop": True},
+        "walk": {"frames": 4, "frame_duration": 0.1, "loop": True},
+        "attack": {"frames": 2, "frame_duration": 0.05, "loop": False},  # Holds the last frame
+        "death": {"frames": 1, "frame_duration": 0.5, "loop": True}
+    },
+    "sheets": {}  # Character name -> sprite sheet path, e.g. "Regar": "assets/art/regar.png"
+}
+
+# Adaptive quality, see QualityManager
+QUALITY_SETTINGS = {
+    "enabled": True,
+    "frame_budget_ms": 1000 / 60,  # A feature is switched off when a window of frames averages more than this
+    "window_frames": 60,  # Frames averaged before the quality level can change
+    "raise_below": 0.7,  # A feature comes back when the frames average less than this share of the budget
+    "raise_after_windows": 3,  # ... for this many windows in a row
+    "spawn_rate_multiplier": 0.5,  # How fast waves spawn once the spawn rate is lowered
+    "health_bar_distance": 400  # Enemies farther than this from their target lose their health bar first
+}
+
+# Controls, see InputManager. Player number -> action -> the inputs that hold it:
+# ("key", name) with pygame key names, ("mouse", button), ("joy_button", button),
+# ("joy_axis", axis, direction) and ("joy_hat", hat, x, y) on the player's own joystick
+INPUT_BINDINGS = {
+    1: {
+        "move_up": [("key", "w"), ("joy_axis", 1, -1), ("joy_hat", 0, 0, 1)],
+        "move_down": [("key", "s"), ("joy_axis", 1, 1), ("joy_hat", 0, 0, -1)],
+        "move_left": [("key", "a"), ("joy_axis", 0, -1), ("joy_hat", 0, -1, 0)],
+        "move_right": [("key", "d"), ("joy_axis", 0, 1), ("joy_hat", 0, 1, 0)],
+        "attack": [("mouse", 0), ("mouse", 2), ("joy_button", 0)]
+    },
+    2: {
+        "move_up": [("key", "up"), ("joy_axis", 1, -1), ("joy_hat", 0, 0, 1)],
+        "move_down": [("key", "down"), ("joy_axis", 1, 1), ("joy_hat", 0, 0, -1)],
+        "move_left": [("key", "left"), ("joy_axis", 0, -1), ("joy_hat", 0, -1, 0)],
+        "move_right": [("key", "right"), ("joy_axis", 0, 1), ("joy_hat", 0, 1, 0)],
+        "attack": [("key", "right ctrl"), ("key", "right shift"), ("joy_button", 0)]
+    }
+}
+
+INPUT_SETTINGS = {
+    "joystick_dead_zone": 0.5  # Stick axes count as held past this
+}
+
+# Profiler settings
+PROFILER_SETTINGS = {
+    "enabled": False,
+    "history": 600,  # Frames kept in the ring buffer, 10 seconds at 60 fps
+    "report_path": "profile_report.txt",
+    "overlay_frames": 240,  # Frames shown in the overlay graph
+    "frame_budget_ms": 1000 / 60
+}
+
+# Logging, see game_logging.py. Gameplay events are logged per category, each category
+# logs at most per_second events a second and only one of every `sample` events
+LOG_SETTINGS = {
+    "level": "INFO",
+    "format": "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+    "categories": {
+        "movement": {"enabled": True, "level": "DEBUG", "per_second": 2, "sample": 1},
+        "combat": {"enabled": True, "level": "INFO", "per_second": 10, "sample": 1}
+    }
+}
+
 # UI settings
 UI_SETTINGS = {
     "health_bar_width": 50,
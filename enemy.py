@@ -1,7 +1,9 @@
+import math
 import pygame
 from enum import Enum
 from characters import Character
 from config import ENEMY_STATS, ENEMY_ATTACK
+from game_logging import log_event, COMBAT
 
 class EnemyState(Enum):
     """Enum for tracking enemy AI states
@@ -21,6 +23,12 @@ class Enemy(Character):
         Character (Character): The base character class
     """
 
+    __slots__ = (
+        "attack_range_distance", "stun_duration", "flow_field",
+        "death_blink_speed", "death_duration", "state", "target", "stun_timer",
+        "ai_slot", "ai_pending_dt",
+    )
+
     def __init__(self, game, spawn_position):
         """
         Initialize an enemy
@@ -32,44 +40,73 @@ class Enemy(Character):
         
         # Override the stats from config after parent initialization
         stats = ENEMY_STATS
-        self.health = stats["health"]
         self.speed = stats["speed"]
         self.strength = stats["strength"]
         self.color = stats["color"]
-        
-        self.image.fill(self.color)
-        self.position = pygame.math.Vector2(spawn_position)
-        self.rect.topleft = (int(self.position.x), int(self.position.y))
-        
-        # State management
-        self.state = EnemyState.SPAWNING
-        self.target = None
+        self.position = pygame.math.Vector2()
         
         # Attack properties
         self.attack_range_distance = ENEMY_ATTACK["range_distance"]
         self.attack_range = pygame.Surface(ENEMY_ATTACK["range_size"])
         self.attack_range.fill(ENEMY_ATTACK["range_color"])
         self.attack_cooldown = ENEMY_ATTACK["cooldown"]
-        self.attack_timer = 0
-        self.attacking = False
         
         # Stun properties
         self.stun_duration = ENEMY_STATS["stun_duration"]
-        self.stun_timer = 0
+
+        # Navigation grid to follow towards the target, set by EnemyManager
+        self.flow_field = None
         
         # Death animation
         self.death_blink_speed = ENEMY_STATS["death_blink_speed"]
         self.death_duration = 0.5      # Half duration (was 1.0)
         self.death_blink_duration = 0.05  # Faster blinks
-        self.death_total_time = 0.5       # Shorter total duration
         self.max_blinks = 15              # More blinks in shorter time
 
+        self.reset(spawn_position)
+
+    def reset(self, spawn_position):
+        """
+        Put the enemy back in the state of a freshly spawned one, so a dead enemy can be
+        reused instead of creating a new one (see EnemyPool)
+        Args:
+            spawn_position (tuple): The x,y coordinates where the enemy spawns
+        """
+        self.health = self.max_health
+        self.position.update(spawn_position)
+        self.rect.topleft = (int(self.position.x), int(self.position.y))
+        self.reset_interpolation()
+        self.direction.update(0, 0)
+        self.facing_right = True
+        self.hit_flash_until = 0
+        
+        # State management
+        self.state = EnemyState.SPAWNING
+        self.target = None
+        self.attack_timer = 0
+        self.attacking = False
+        self.stun_timer = 0
+        self.ai_slot = 0  # Scheduling, see AIScheduler
+        self.ai_pending_dt = 0.0
+        
+        # Death animation
+        self.is_dying = False
+        self.visible = True
+        self.animation_complete = False
+        self.blink_count = 0
+        self.death_blink_timer = self.death_blink_duration
+        self.death_total_time = 0.5       # Shorter total duration
+        self.update_sprite()
+
     def update(self, dt):
         """
         Update enemy behavior based on current state
         Args:
             dt (float): Time delta since last update
         """
+        self.previous_position.x = self.position.x
+        self.previous_position.y = self.position.y
+
         # I will first check if dying and call on the super death animation
         if self.is_dying:
             super().update(dt)
@@ -81,6 +118,7 @@ class Enemy(Character):
             self.stun_timer -= dt
             if self.stun_timer <= 0:
                 self.state = EnemyState.PURSUING
+            self.update_sprite()  # The hit flash ends while stunned
             return
 
         # Update attack timer
@@ -99,9 +137,25 @@ class Enemy(Character):
             self._perform_attack(dt)
 
         # Update position and sprite
-        self.rect.topleft = (int(self.position.x), int(self.position.y))
+        self.rect.x = int(self.position.x)
+        self.rect.y = int(self.position.y)
         self.update_sprite()
 
+    def choose_animation(self):
+        """
+        Get the animation for the enemy's current state, EnemySwarm picks them the same way.
+        Returns:
+            Animation: One of the enemy's animations
+        """
+        animations = self.animations
+        if self.is_dying:
+            return animations.death
+        if self.state == EnemyState.STUNNED:
+            return animations.idle
+        if self.state == EnemyState.ATTACKING:
+            return animations.attack if self.attacking else animations.idle
+        return animations.walk
+
     def _is_outside_screen(self):
         """Check if enemy is outside the screen boundaries
         Returns:
@@ -137,25 +191,28 @@ class Enemy(Character):
         if not self.target:
             return
 
-        # Calculate direction to target
-        direction = pygame.math.Vector2(
-            self.target.position.x - self.position.x,
-            self.target.position.y - self.position.y,
-        )
-
         # Calculate distance to target
-        distance = direction.length()
+        offset_x = self.target.position.x - self.position.x
+        offset_y = self.target.position.y - self.position.y
+        distance = math.hypot(offset_x, offset_y)
 
         if distance > 0:
-            direction = direction.normalize()
-            self.facing_right = direction.x > 0
+            self.facing_right = offset_x > 0
 
             # If within attack range, switch to attacking state
             if distance <= self.attack_range_distance:
                 self.state = EnemyState.ATTACKING
-            else:
-                # Move towards target
-                self.position += direction * self.speed * dt
+                return
+
+            # Move towards target, around obstacles when the flow field knows the way.
+            # The direction vector is reused every tick so walking doesn't allocate.
+            direction = self.direction
+            position = self.position
+            if not (self.flow_field and self.flow_field.steer(self.target, position.x, position.y, direction)):
+                direction.x = offset_x / distance
+                direction.y = offset_y / distance
+            position.x += direction.x * self.speed * dt
+            position.y += direction.y * self.speed * dt
 
     def _perform_attack(self, dt):
         """Perform attack when in range
@@ -168,7 +225,7 @@ class Enemy(Character):
             self.state = EnemyState.PURSUING
             return
 
-        distance = (self.target.position - self.position).length()
+        distance = math.hypot(self.target.position.x - self.position.x, self.target.position.y - self.position.y)
 
         # If target moved out of range, switch back to pursuing
         if distance > self.attack_range_distance:
@@ -183,7 +240,8 @@ class Enemy(Character):
             # Deal damage to target
             if hasattr(self.target, "take_damage"):
                 self.target.take_damage(self.strength)
-                print(f"Enemy dealt {self.strength} damage to {self.target.name}")
+                if __debug__:
+                    log_event(COMBAT, "enemy_hit", damage=self.strength, target=self.target.name)
 
         # Reset attacking flag when cooldown is done
         if self.attack_timer <= 0:
@@ -192,7 +250,8 @@ class Enemy(Character):
                 self.attack_timer = self.attack_cooldown
                 if hasattr(self.target, "take_damage"):
                     self.target.take_damage(self.strength)
-                    print(f"Enemy dealt {self.strength} damage to {self.target.name}")
+                    if __debug__:
+                        log_event(COMBAT, "enemy_hit", damage=self.strength, target=self.target.name)
         else:
             if self.attacking and self.attack_timer <= self.attack_cooldown * 0.3:
                 self.attacking = False
@@ -1,5 +1,7 @@
 # Standard library
 import logging
+import random
+import time
 import traceback
 from typing import List, Optional, Tuple, Dict, Any
 
@@ -14,19 +16,26 @@ from screens import (
     StoryScreen,
     LevelScreen,
     PauseScreen,
-    GameOverScreen
+    GameOverScreen,
+    LoadingScreen
 )
 
 from managers import (
     SoundManager,
     CharacterManager,
     ScreenEffectsManager,
-    EnemyManager
+    EnemyManager,
+    EnemySwarm,
+    FrameProfiler,
+    ReplayManager,
+    AssetManager,
+    QualityManager,
+    InputManager
 )
+from input_state import NO_INPUT
 from characters import Character
 from game_states import GameState
-
-logging.basicConfig(level=logging.DEBUG)
+from config import FPS, SIMULATION_HZ, MAX_FRAME_TIME, PROFILER_SETTINGS, ENEMY_BACKEND
 
 
 class Game:
@@ -34,47 +43,73 @@ class Game:
     Main game class that handles the game loop, screen changes, and initialization.
     """
 
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, headless=False, profile=False, enemy_backend=ENEMY_BACKEND):
         """
         Initialize the game.
 
         Args:
             screen_width (int): The width of the screen.
             screen_height (int): The height of the screen.
+            headless (bool): Run without a window or audio. The caller must select SDL's
+                dummy video and audio drivers before pygame.init (see main.py).
+            profile (bool): Record per-phase frame times and write a report on exit.
+            enemy_backend (str): "sprites" or "swarm", see ENEMY_BACKEND in config.py.
         """
         try:
+            self.headless = headless
             pygame.init()
-            pygame.mixer.init()
+            if not self.headless:
+                pygame.mixer.init()
             self.SCREEN_WIDTH = screen_width
             self.SCREEN_HEIGHT = screen_height
             self.screen = pygame.display.set_mode(
                 (self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
             )
+            # Even headless we need a display surface, surfaces can't be convert()ed without one
             pygame.display.set_caption("SpaceFight")
             self.clock = pygame.time.Clock()
+            self.fixed_dt = 1.0 / SIMULATION_HZ
+            self.interpolation_alpha = 1.0  # How far drawing is between the last two simulation steps
+            self.frame_work_ms = 0.0  # Smoothed time a frame takes, not counting waiting for the frame cap
             self.running = True
-            self.current_screen = None
+            self.profiler = FrameProfiler(enabled=profile or PROFILER_SETTINGS["enabled"])
+
+            # Everything that affects gameplay reads time, randomness and input from here,
+            # so a fight can be replayed exactly (see ReplayManager)
+            self.tick_count = 0
+            self.rng = random.Random()  # Simulation randomness, e.g. spawn points
+            self.render_rng = random.Random()  # Cosmetic randomness, e.g. stars and screen shake
+            self.input_manager = InputManager()  # Maps keys, mouse and joysticks to player actions
+            self.input = NO_INPUT  # Actions held this tick, sampled once in update
+            self.replay = ReplayManager(self)
+            self.quality = QualityManager(self)  # Gives up effects when frames take too long
+            self.screen_stack: List[Screen] = []  # The top screen is the one running
             self.state = GameState.MAIN_MENU
 
             # initialize the game managers:
-            self.sound_manager = SoundManager()
+            self.enemy_backend = enemy_backend
+            self.asset_manager = AssetManager()  # Kept across resets so screens reopen without reloading
+            self.sound_manager = SoundManager(enabled=not self.headless, loader=self.asset_manager)
             self.character_manager = CharacterManager(self)
             self.selected_characters = []
             self.character_manager = CharacterManager(self)
-            self.enemy_manager = EnemyManager(self)
+            self.enemy_manager = self.create_enemy_manager()
             self.screen_effects = ScreenEffectsManager(
-                self.screen, self.SCREEN_WIDTH, self.SCREEN_HEIGHT
+                self.screen,
+                self.SCREEN_WIDTH,
+                self.SCREEN_HEIGHT,
+                rng=self.render_rng,
+                get_ticks=self.get_ticks,
+                quality=self.quality,
             )
 
             logging.info("Game initialized successfully.")
 
         except pygame.error as e:
             logging.error(f"Pygame error during initialization: {e}")
-            print(e)
             self.running = False
         except Exception as e:
             logging.error(f"An unexpected error occurred during initialization: {e}")
-            print(e)
             traceback.print_exc()
             self.running = False
 
@@ -100,78 +135,303 @@ class Game:
 
     def start(self):
         """
-        Start the game by setting the current screen to MainMenu and run the game loop.
+        Start the game by showing the loading screen, which moves on to the MainMenu, and run the game loop.
         """
-        self.current_screen = MainMenu(self)
+        self.change_screen(LoadingScreen(self))
         self.run()
 
+    def create_enemy_manager(self):
+        """
+        Create the enemy manager for the configured enemy backend.
+        Falls back to the sprite backend when the swarm one can't run because numpy is missing.
+
+        Returns:
+            EnemyManager or EnemySwarm: The enemy manager
+        """
+        if self.enemy_backend == "swarm":
+            try:
+                return EnemySwarm(self)
+            except ImportError as e:
+                logging.warning(f"{e}, falling back to sprite enemies")
+        elif self.enemy_backend != "sprites":
+            logging.warning(f"Unknown enemy backend {self.enemy_backend}, using sprite enemies")
+        return EnemyManager(self)
+
+    def start_level(self, character_names: List[str]) -> None:
+        """
+        Skip the menus and story and go straight into the level with the given characters.
+        Used by headless runs, which have nobody to click through the menus.
+
+        Args:
+            character_names (list): Names of the characters to play, player 1 first.
+        """
+        selected_characters = []
+        for name in character_names:
+            character = self.character_manager.get_character_by_name(name)
+            if character is None:
+                raise ValueError(f"Unknown character: {name}")
+            selected_characters.append(character)
+
+        self.set_selected_characters(selected_characters)
+        self.change_screen(LevelScreen(self))
+
+    def run_headless(self, ticks: int) -> Dict[str, float]:
+        """
+        Run the game loop for a fixed number of simulation steps as fast as the CPU allows.
+        There is no frame cap and every step is followed by one draw.
+
+        Args:
+            ticks (int): Number of simulation steps to run.
+
+        Returns:
+            dict: The number of ticks run, elapsed seconds and ticks per second.
+        """
+        ticks_run = 0
+        start_time = time.perf_counter()
+        try:
+            while self.running and ticks_run < ticks:
+                frame_start = time.perf_counter()
+                self.profiler.begin_frame()
+                with self.profiler.section("events"):
+                    self.handle_events()
+                with self.profiler.section("update"):
+                    self.update(self.fixed_dt)
+                self.interpolation_alpha = 1.0
+                with self.profiler.section("draw"):
+                    dirty_rects = self.draw()
+                with self.profiler.section("flip"):
+                    self.present(dirty_rects)
+                self.profiler.end_frame()
+                self.track_frame_work((time.perf_counter() - frame_start) * 1000)
+                ticks_run += 1
+        except Exception as e:
+            logging.error(f"An unexpected error occurred during the headless run: {e}")
+            traceback.print_exc()
+
+        elapsed = time.perf_counter() - start_time
+        stats = {
+            "ticks": ticks_run,
+            "seconds": elapsed,
+            "ticks_per_second": ticks_run / elapsed if elapsed > 0 else 0.0,
+        }
+        logging.info(
+            f"Headless run finished: {ticks_run} ticks in {elapsed:.2f}s "
+            f"({stats['ticks_per_second']:.1f} ticks/s)"
+        )
+        self.profiler.write_report()
+        self.replay.save()
+        self.asset_manager.shutdown()
+        return stats
+
+    def track_frame_work(self, milliseconds: float) -> None:
+        """
+        Add the time the last frame took to the smoothed frame time and the quality window.
+        Smoothing keeps a single slow frame from looking like the game is over budget.
+
+        Args:
+            milliseconds (float): Time spent on the frame, without waiting for the frame cap.
+        """
+        self.frame_work_ms += (milliseconds - self.frame_work_ms) * 0.1
+        self.quality.add_frame(milliseconds)
+
     def run(self):
         """
         The main game loop that handles events, update, and draw the screen.
+        Events are handled once per frame, the simulation is advanced in fixed steps of
+        self.fixed_dt, and drawing interpolates between the last two steps.
         """
         try:
+            accumulator = 0.0
             while self.running:
-                dt = self.clock.tick(60) / 1000.0  # convert to seconds
-                self.handle_events()
-                self.update(dt)
-                self.draw()
-                pygame.display.flip()
+                frame_time = self.clock.tick(FPS) / 1000.0  # convert to seconds
+                self.track_frame_work(self.clock.get_rawtime())
+                # A very long frame (window drag, loading hitch) would otherwise make us
+                # run hundreds of steps to catch up, so cap it
+                accumulator += min(frame_time, MAX_FRAME_TIME)
+
+                self.profiler.begin_frame()
+                with self.profiler.section("events"):
+                    self.handle_events()
+                with self.profiler.section("update"):
+                    while accumulator >= self.fixed_dt and self.running:
+                        self.update(self.fixed_dt)
+                        accumulator -= self.fixed_dt
+
+                self.interpolation_alpha = accumulator / self.fixed_dt
+                with self.profiler.section("draw"):
+                    dirty_rects = self.draw()
+                with self.profiler.section("flip"):
+                    self.present(dirty_rects)
+                self.profiler.end_frame()
             logging.info("Game loop exited gracefully.")
         except Exception as e:
             logging.error(f"An unexpected error occurred during the game loop: {e}")
-            print(e)
             traceback.print_exc()
         finally:
+            self.profiler.write_report()
+            self.replay.save()
+            self.asset_manager.shutdown()
             pygame.quit()
 
     def handle_events(self):
         """
         Handle game events, including quitting.
         """
-        events = pygame.event.get()
-        for event in events:
+        events = []  # Passed on to the current screen
+        for event in pygame.event.get():
+            self.input_manager.handle_event(event)
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 if self.state == GameState.LEVEL:
-                    self.change_screen(PauseScreen(self, self.current_screen))
+                    self.push_screen(PauseScreen(self))
+                elif self.state == GameState.PAUSE:
+                    self.pop_screen()
+                    continue  # The resumed screen shouldn't also handle this key
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()
+            events.append(event)
         
         if self.current_screen:
             self.current_screen.handle_events(events)
 
     def update(self, dt):
         """
-        Update the current screen.
+        Update the current screen by one simulation step.
         Args:
-            dt (float): Time since last update
+            dt (float): Fixed simulation step in seconds
         """
+        if self.replay.finished:
+            self.running = False
+            return
+
+        self.tick_count += 1
+        self.sound_manager.update(dt)
+        self.input = self.replay.sample_input(self.is_in_state(GameState.LEVEL))
         if self.current_screen:
             self.current_screen.update(dt)
 
-    def draw(self):
+    def get_ticks(self) -> int:
+        """
+        Get the simulated time since the game started, use this instead of pygame.time.get_ticks()
+        for anything that affects gameplay.
+
+        Returns:
+            int: Milliseconds of simulated time.
+        """
+        return int(self.tick_count * self.fixed_dt * 1000)
+
+    def seed_random(self, seed: int) -> None:
+        """
+        Seed the simulation and cosmetic random generators.
+
+        Args:
+            seed (int): The seed.
+        """
+        self.rng.seed(seed)
+        self.render_rng.seed(seed)
+
+    def draw(self) -> Optional[List[pygame.Rect]]:
         """
         Draw the current screen if it exists.
+
+        Returns:
+            list: The rects that changed, or None if the whole screen has to be presented.
         """
+        dirty_rects = None
         if self.current_screen:
-            self.current_screen.draw()
+            dirty_rects = self.current_screen.draw()
+        if self.profiler.show_overlay:
+            self.profiler.draw_overlay(self.screen)
+            dirty_rects = None
+        return dirty_rects
+
+    def present(self, dirty_rects: Optional[List[pygame.Rect]]) -> None:
+        """
+        Push the drawn frame to the display.
+
+        Args:
+            dirty_rects (list): Only update these parts of the display, None flips the whole screen.
+        """
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+
+    @property
+    def current_screen(self) -> Optional[Screen]:
+        """
+        The screen on top of the stack, the one being updated and drawn.
+
+        Returns:
+            Screen: The current screen, or None if the stack is empty.
+        """
+        return self.screen_stack[-1] if self.screen_stack else None
+
+    def push_screen(self, new_screen: Screen) -> None:
+        """
+        Put a screen on top of the current one. The current screen is suspended, it keeps its
+        state and assets and is resumed when the new screen is popped.
+        Args:
+            new_screen (Screen): The screen to show.
+        """
+        if self.current_screen:
+            self.current_screen.on_suspend()
+        self.screen_stack.append(new_screen)
+        new_screen.on_enter()
+        new_screen.request_full_redraw()
+        self._update_state()
+
+    def pop_screen(self) -> None:
+        """
+        Close the current screen and resume the one below it.
+        """
+        if not self.screen_stack:
+            return
+        self.screen_stack.pop().on_exit()
+        if self.current_screen:
+            self.current_screen.on_resume()
+            self.current_screen.request_full_redraw()
+        self._update_state()
 
     def change_screen(self, new_screen: Screen) -> None:
         """
-        Change the current screen to the new screen.
+        Change the current screen to the new screen. The current screen is closed and the new
+        one takes its place on the stack.
         Args:
             new_screen (Screen): The new screen to change to.
         """
-        self.current_screen = new_screen
-        if isinstance(new_screen, MainMenu):
+        if self.screen_stack:
+            self.screen_stack.pop().on_exit()
+        self.screen_stack.append(new_screen)
+        new_screen.on_enter()
+        new_screen.request_full_redraw()
+        self._update_state()
+
+    def clear_screens(self) -> None:
+        """
+        Close every screen on the stack, top first.
+        """
+        while self.screen_stack:
+            self.screen_stack.pop().on_exit()
+
+    def _update_state(self) -> None:
+        """
+        Set the game state to match the current screen.
+        """
+        screen = self.current_screen
+        if isinstance(screen, MainMenu):
             self.state = GameState.MAIN_MENU
-        elif isinstance(new_screen, CharacterSelector):
+        elif isinstance(screen, CharacterSelector):
             self.state = GameState.CHARACTER_SELECT
-        elif isinstance(new_screen, StoryScreen):
+        elif isinstance(screen, StoryScreen):
             self.state = GameState.STORY
-        elif isinstance(new_screen, LevelScreen):
+        elif isinstance(screen, LevelScreen):
             self.state = GameState.LEVEL
-        elif isinstance(new_screen, PauseScreen):
+        elif isinstance(screen, PauseScreen):
             self.state = GameState.PAUSE
+        elif isinstance(screen, GameOverScreen):
+            self.state = GameState.GAME_OVER
 
     def is_in_state(self, state: GameState) -> bool:
         """
@@ -191,22 +451,39 @@ class Game:
 
         self.sound_manager.stop_music()
         self.change_screen(GameOverScreen(self))
-        self.state = GameState.GAME_OVER
 
     def reset_game(self):
-        """Reset the entire game state to initial conditions"""
+        """
+        Reset the entire game state to initial conditions and go back to the main menu.
+        The main menu stays suspended at the bottom of the stack during a game, so it is
+        resumed instead of being built again. Sounds and cached assets are kept.
+        """
+        # Close every screen above the main menu without resuming the ones in between
+        while len(self.screen_stack) > 1:
+            self.screen_stack.pop().on_exit()
+        main_menu = self.current_screen if isinstance(self.current_screen, MainMenu) else None
+        if main_menu is None:
+            self.clear_screens()
+
         # Reset game state
-        self.state = GameState.MAIN_MENU
-        self.current_screen = None
         self.selected_characters = []
+        self.sound_manager.stop_music()
 
-        # Reinitialize all managers
-        self.sound_manager = SoundManager()
+        # Reinitialize the gameplay managers
         self.character_manager = CharacterManager(self)
-        self.enemy_manager = EnemyManager(self)
+        self.enemy_manager = self.create_enemy_manager()
         self.screen_effects = ScreenEffectsManager(
-            self.screen, self.SCREEN_WIDTH, self.SCREEN_HEIGHT
+            self.screen,
+            self.SCREEN_WIDTH,
+            self.SCREEN_HEIGHT,
+            rng=self.render_rng,
+            get_ticks=self.get_ticks,
+            quality=self.quality,
         )
 
-        # Create new main menu
-        self.change_screen(MainMenu(self))
\ No newline at end of file
+        if main_menu:
+            main_menu.on_resume()
+            main_menu.request_full_redraw()
+            self._update_state()
+        else:
+            self.push_screen(MainMenu(self))
\ No newline at end of file
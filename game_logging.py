@@ -0,0 +1,196 @@
+"""
+Logging for SpaceFight.
+
+Log records go into a queue and are formatted and written by a QueueListener on its own
+thread, so logging from the game loop never waits on the terminal. Gameplay events, like
+hits and movement, are logged with log_event: every event has a category with its own level,
+rate limit and sampling from LOG_SETTINGS, and its fields are only turned into text on the
+listener thread.
+
+Event sites in the hot path are written as
+
+    if __debug__:
+        log_event(COMBAT, "enemy_hit", damage=5, target="Regar")
+
+so running the game with python -O compiles them out entirely.
+"""
+import atexit
+import logging
+import logging.handlers
+import queue
+import time
+from typing import Any, Dict, Optional, Tuple
+from config import LOG_SETTINGS
+
+# Event categories, configured in LOG_SETTINGS["categories"]
+MOVEMENT = "movement"
+COMBAT = "combat"
+
+LOGGER_PREFIX = "spacefight"
+
+
+class Event:
+    """
+    The message of a gameplay event, a name with fields.
+    It's only turned into text when a handler formats the record, on the listener thread.
+    Fields should be plain values (numbers, strings), not objects that keep changing.
+    """
+
+    __slots__ = ("name", "fields")
+
+    def __init__(self, name: str, fields: Dict[str, Any]):
+        self.name = name
+        self.fields = fields
+
+    def __str__(self):
+        if not self.fields:
+            return self.name
+        return self.name + " " + " ".join(f"{key}={value}" for key, value in self.fields.items())
+
+
+class RateLimit:
+    """
+    Decides which events of a category get logged.
+    Only one of every `sample` events is considered, and of those at most `per_second` are
+    logged each second. Dropped events are counted and reported with the next logged one.
+    """
+
+    __slots__ = ("per_second", "sample", "tokens", "last_refill", "seen", "dropped")
+
+    def __init__(self, per_second: Optional[float], sample: int = 1):
+        """
+        Initialize the RateLimit.
+        Args:
+            per_second (float): Most events logged per second, None for no limit
+            sample (int): Log one of every this many events
+        """
+        self.per_second = per_second
+        self.sample = max(1, sample)
+        self.tokens = per_second or 0.0
+        self.last_refill = time.monotonic()
+        self.seen = 0
+        self.dropped = 0
+
+    def allow(self) -> bool:
+        """
+        Check if the next event may be logged.
+        Returns:
+            bool: True to log it, False when it's dropped
+        """
+        self.seen += 1
+        if self.seen % self.sample:
+            self.dropped += 1
+            return False
+        if self.per_second is None:
+            return True
+        now = time.monotonic()
+        self.tokens = min(self.per_second, self.tokens + (now - self.last_refill) * self.per_second)
+        self.last_refill = now
+        if self.tokens < 1.0:
+            self.dropped += 1
+            return False
+        self.tokens -= 1.0
+        return True
+
+    def take_dropped(self) -> int:
+        """
+        Get the number of events dropped since the last call.
+        Returns:
+            int: Dropped events
+        """
+        dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener.
+    The stock QueueHandler formats every record before queueing it, on the thread that logged it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Category -> its logger, level, whether it's enabled and its rate limit
+_categories: Dict[str, Tuple[logging.Logger, int, bool, RateLimit]] = {}
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[DeferredQueueHandler] = None
+
+
+def _configure_categories() -> None:
+    """Create the logger and rate limit of every category in LOG_SETTINGS."""
+    _categories.clear()
+    for category, settings in LOG_SETTINGS["categories"].items():
+        _categories[category] = (
+            logging.getLogger(f"{LOGGER_PREFIX}.{category}"),
+            logging.getLevelName(settings.get("level", "INFO")),
+            settings.get("enabled", True),
+            RateLimit(settings.get("per_second"), settings.get("sample", 1)),
+        )
+
+
+def log_event(category: str, name: str, **fields: Any) -> None:
+    """
+    Log a gameplay event, if its category is enabled and within its rate limit.
+    Args:
+        category (str): The category, e.g. COMBAT
+        name (str): Name of the event, e.g. "enemy_hit"
+        **fields: Values describing the event
+    """
+    entry = _categories.get(category)
+    if entry is None:
+        return
+    logger, level, enabled, limit = entry
+    if not enabled or not logger.isEnabledFor(level) or not limit.allow():
+        return
+    dropped = limit.take_dropped()
+    if dropped:
+        fields["dropped"] = dropped
+    logger.log(level, Event(name, fields))
+
+
+def setup_logging(level: Optional[str] = None) -> None:
+    """
+    Send all logging through the queue to a listener thread writing to stderr.
+    Safe to call more than once, later calls only change the level.
+    Args:
+        level (str): Level name of the root logger, defaults to LOG_SETTINGS["level"]
+    """
+    global _listener, _queue_handler
+    root = logging.getLogger()
+    root.setLevel(level or LOG_SETTINGS["level"])
+    _configure_categories()
+    if _listener is not None:
+        return
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter(LOG_SETTINGS["format"]))
+    _listener = logging.handlers.QueueListener(records, stream, respect_handler_level=True)
+    _queue_handler = DeferredQueueHandler(records)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """
+    Write out everything still in the queue and stop the listener thread.
+    Anything logged afterwards goes straight to the listener's handlers.
+    """
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+    _listener = None
+    _queue_handler = None
+
+
+_configure_categories()
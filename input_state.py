@@ -0,0 +1,68 @@
+from typing import NamedTuple
+
+# Gameplay actions a player can hold down, in bit order. InputManager maps keys, mouse
+# buttons and joysticks to these, see INPUT_BINDINGS in config.py.
+MOVE_UP = "move_up"
+MOVE_DOWN = "move_down"
+MOVE_LEFT = "move_left"
+MOVE_RIGHT = "move_right"
+ATTACK = "attack"
+ACTIONS = (MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT, ATTACK)
+ACTION_BITS = {action: 1 << bit for bit, action in enumerate(ACTIONS)}
+MAX_PLAYERS = 4
+
+
+def action_bit(player_number: int, action: str) -> int:
+    """
+    Get the bit of a player's action in an input mask.
+    Args:
+        player_number (int): The player, starting at 1
+        action (str): One of ACTIONS
+    Returns:
+        int: The bit, every player has len(ACTIONS) bits of its own
+    """
+    return ACTION_BITS[action] << ((player_number - 1) * len(ACTIONS))
+
+
+# Player number -> action -> bit, looked up instead of shifting on every check. Index 0 is unused.
+PLAYER_ACTION_BITS = [{}] + [
+    {action: action_bit(player_number, action) for action in ACTIONS}
+    for player_number in range(1, MAX_PLAYERS + 1)
+]
+
+
+class InputSnapshot(NamedTuple):
+    """
+    The actions every player holds down on one tick, sampled once and shared by everything
+    that reads input. It can't change after it's made, and the mask is what replays store.
+    """
+
+    mask: int = 0
+
+    def pressed(self, player_number, action: str) -> bool:
+        """
+        Check if a player holds down an action.
+        Args:
+            player_number (int): The player, None for characters nobody controls
+            action (str): One of ACTIONS
+        Returns:
+            bool: True while the action is held
+        """
+        if not player_number or player_number > MAX_PLAYERS:
+            return False
+        return bool(self.mask & PLAYER_ACTION_BITS[player_number][action])
+
+    def axis(self, player_number, negative: str, positive: str) -> int:
+        """
+        Combine two opposite actions into a direction.
+        Args:
+            player_number (int): The player
+            negative (str): Action towards -1, e.g. MOVE_LEFT
+            positive (str): Action towards 1, e.g. MOVE_RIGHT
+        Returns:
+            int: -1, 0 or 1
+        """
+        return self.pressed(player_number, positive) - self.pressed(player_number, negative)
+
+
+NO_INPUT = InputSnapshot()
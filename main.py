@@ -1,28 +1,111 @@
+import os
 import sys
+import argparse
 import logging
 import pygame
 from game import Game
+from game_logging import setup_logging
 from screens.main_menu import MainMenu
 import config
 
 config.SCREEN_WIDTH = 1280
 config.SCREEN_HEIGHT = 720
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 
-def main():
+def parse_args(argv=None):
+    """
+    Parse the command line arguments.
+    Args:
+        argv (list): Arguments to parse, defaults to sys.argv
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="SpaceFight, the game.")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run without a window or audio, straight into the level and as fast as possible",
+    )
+    parser.add_argument(
+        "--ticks",
+        type=int,
+        default=config.SIMULATION_HZ * 60,
+        help="number of simulation steps to run in headless mode (default: one minute of game time)",
+    )
+    parser.add_argument(
+        "--characters",
+        default="Regar",
+        help="comma separated characters to play in headless mode, player 1 first (default: Regar)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time every phase of the frame and write the percentiles to a report on exit (F3 shows the overlay)",
+    )
+    parser.add_argument(
+        "--enemy-backend",
+        choices=["sprites", "swarm"],
+        default=config.ENEMY_BACKEND,
+        help="simulate enemies as sprites or all at once with numpy (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default=config.LOG_SETTINGS["level"],
+        help="lowest level to log, DEBUG includes movement events (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="record the input of the level to a replay file",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="play a replay file back headless and as fast as possible",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main function of SpaceFight, the game."""
+    args = parse_args(argv)
+    setup_logging(args.log_level)
+    if args.replay:
+        # A replay is always played back without a window, at full speed
+        args.headless = True
     try:
+        if args.headless:
+            # SDL reads these when it initializes, so they have to be set before pygame.init
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
         # Initialize Pygame
         if not pygame.init()[0]:
             raise pygame.error(f"Pygame failed to initialize: {pygame.get_error()}")
         
         logging.info("Starting SpaceFight...")
-        game = Game(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-        game.start()
+        game = Game(
+            config.SCREEN_WIDTH,
+            config.SCREEN_HEIGHT,
+            headless=args.headless,
+            profile=args.profile,
+            enemy_backend=args.enemy_backend,
+        )
+        if args.record:
+            game.replay.start_recording(args.record)
+
+        if args.headless:
+            if args.replay:
+                game.replay.load(args.replay)
+                game.start_level(game.replay.characters)
+                stats = game.run_headless(game.replay.total_ticks)
+            else:
+                game.start_level(args.characters.split(","))
+                stats = game.run_headless(args.ticks)
+            print(f"{stats['ticks']} ticks in {stats['seconds']:.2f}s ({stats['ticks_per_second']:.1f} ticks/s)")
+        else:
+            game.start()
     
     except pygame.error as e:
         logging.error(f"Pygame error: {e}")
@@ -2,10 +2,38 @@ from .sound_manager import SoundManager
 from .character_manager import CharacterManager
 from .screen_effects import ScreenEffectsManager
 from .enemy_manager import EnemyManager
+from .profiler import FrameProfiler
+from .replay_manager import ReplayManager
+from .asset_manager import AssetManager
+from .spatial_hash import SpatialHash
+from .enemy_swarm import EnemySwarm
+from .enemy_pool import EnemyPool
+from .ai_scheduler import AIScheduler
+from .flow_field import FlowField
+from .wave_scheduler import WaveScheduler
+from .damage_buffer import DamageBuffer
+from .health_bars import HealthBarCache
+from .quality_manager import QualityManager
+from .input_manager import InputManager
+from .render_queue import RenderQueue
 
 __all__ = [
     'SoundManager',
     'CharacterManager',
     'ScreenEffectsManager',
-    'EnemyManager'
+    'EnemyManager',
+    'FrameProfiler',
+    'ReplayManager',
+    'AssetManager',
+    'SpatialHash',
+    'EnemySwarm',
+    'EnemyPool',
+    'AIScheduler',
+    'FlowField',
+    'WaveScheduler',
+    'DamageBuffer',
+    'HealthBarCache',
+    'QualityManager',
+    'InputManager',
+    'RenderQueue'
 ]
\ No newline at end of file
@@ -0,0 +1,138 @@
+from typing import Callable, Dict, Optional
+from enemy import Enemy, EnemyState
+from characters import Character
+from config import AI_SETTINGS
+
+# Update tiers, from most to least work per tick
+FULL = "full"  # Near a player: targeting and the state machine every tick
+REDUCED = "reduced"  # Far from its target: the state machine every few ticks with the time saved up
+OFFSCREEN = "offscreen"  # Still walking in from off screen: no targeting at all
+TIERS = (FULL, REDUCED, OFFSCREEN)
+
+
+class AIScheduler:
+    """
+    Decides how much work every enemy gets each tick.
+    Target searches are spread out, each enemy looks for the nearest player only every few
+    ticks and the enemies take turns so they don't all search on the same tick. Enemies close
+    to a player run every tick, far ones run less often and the ones still walking in from
+    off screen skip targeting. How many enemies ran each tier is counted every tick.
+    """
+
+    def __init__(self, game):
+        """
+        Initialize the AIScheduler.
+        Args:
+            game (Game): The game instance
+        """
+        self.game = game
+        self.enabled = AI_SETTINGS["enabled"]
+        self.retarget_interval = AI_SETTINGS["retarget_interval"]
+        self.far_update_interval = AI_SETTINGS["far_update_interval"]
+        self.near_distance_squared = AI_SETTINGS["near_distance"] ** 2
+        self.tick = 0
+        self.next_slot = 0
+        self.tier_counts: Dict[str, int] = dict.fromkeys(TIERS, 0)  # Enemies per tier last tick
+
+    def register(self, enemy: Enemy) -> None:
+        """
+        Give a newly spawned enemy its turn, so consecutive spawns search on different ticks.
+        Args:
+            enemy (Enemy): The enemy
+        """
+        enemy.ai_slot = self.next_slot
+        enemy.ai_pending_dt = 0.0
+        self.next_slot += 1
+
+    def begin_tick(self) -> None:
+        """Start a new tick, call this before updating the enemies."""
+        self.tick += 1
+        for tier in TIERS:
+            self.tier_counts[tier] = 0
+
+    def end_tick(self) -> None:
+        """Report the tier counts of this tick to the profiler."""
+        profiler = self.game.profiler
+        for tier in TIERS:
+            profiler.count(f"AI.{tier}", self.tier_counts[tier])
+
+    def update_enemy(
+        self, enemy: Enemy, dt: float, find_target: Callable[[Enemy], Optional[Character]]
+    ) -> None:
+        """
+        Update an enemy with the work its tier allows this tick.
+        Args:
+            enemy (Enemy): The enemy
+            dt (float): Time delta since last update
+            find_target (callable): Returns the nearest player character to an enemy
+        """
+        if not self.enabled:
+            self.tier_counts[FULL] += 1
+            enemy.target = find_target(enemy)
+            enemy.update(dt)
+            return
+
+        tier = self._tier_of(enemy)
+        self.tier_counts[tier] += 1
+        if tier == OFFSCREEN:
+            enemy.update(dt)
+            return
+
+        if self._retarget_due(enemy):
+            enemy.target = find_target(enemy)
+
+        # Save up the time of the ticks a far enemy sits out and run it all at once. The saved
+        # time was walking time, an enemy that got stunned, started attacking or is dying in
+        # the meantime drops it so its timers don't skip ahead.
+        if self._has_timers(enemy):
+            enemy.ai_pending_dt = 0.0
+        dt += enemy.ai_pending_dt
+        if tier == REDUCED and (self.tick + enemy.ai_slot) % self.far_update_interval:
+            enemy.ai_pending_dt = dt
+            enemy.reset_interpolation()  # Hold still instead of replaying its last step
+            return
+        enemy.ai_pending_dt = 0.0
+        enemy.update(dt)
+
+    def _tier_of(self, enemy: Enemy) -> str:
+        """
+        Get the update tier of an enemy.
+        Args:
+            enemy (Enemy): The enemy
+        Returns:
+            str: FULL, REDUCED or OFFSCREEN
+        """
+        if self._has_timers(enemy):
+            return FULL  # Timers and attacks stay exact
+        if enemy.state == EnemyState.SPAWNING and enemy._is_outside_screen():
+            return OFFSCREEN
+        target = enemy.target
+        if target is None:
+            return FULL
+        distance_squared = (target.position.x - enemy.position.x) ** 2 + (
+            target.position.y - enemy.position.y
+        ) ** 2
+        return REDUCED if distance_squared > self.near_distance_squared else FULL
+
+    @staticmethod
+    def _has_timers(enemy: Enemy) -> bool:
+        """
+        Check if an enemy is in a state whose timers have to run every tick.
+        Args:
+            enemy (Enemy): The enemy
+        Returns:
+            bool: True while it's dying, stunned or attacking
+        """
+        return enemy.is_dying or enemy.state in (EnemyState.STUNNED, EnemyState.ATTACKING)
+
+    def _retarget_due(self, enemy: Enemy) -> bool:
+        """
+        Check if an enemy should look for the nearest player this tick.
+        Args:
+            enemy (Enemy): The enemy
+        Returns:
+            bool: True when it has no target, its target left the level or it's its turn
+        """
+        if enemy.target is None or enemy.target not in self.game.character_manager.active_characters:
+            return True
+        return (self.tick + enemy.ai_slot) % self.retarget_interval == 0
@@ -0,0 +1,322 @@
+import json
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+import pygame
+from config import ASSET_SETTINGS
+
+
+def _decode_image(path: str, size: Optional[Tuple[int, int]]) -> pygame.Surface:
+    """
+    Load and scale an image. Runs on a loader thread, so it must not touch the display.
+    Args:
+        path (str): Path of the image file
+        size (tuple): Width and height to scale to, None keeps the original size
+    Returns:
+        pygame.Surface: The image, not yet converted for the display
+    """
+    image = pygame.image.load(path)
+    if size and image.get_size() != tuple(size):
+        image = pygame.transform.scale(image, size)
+    return image
+
+
+def _read_bytes(path: str) -> bytes:
+    """
+    Read a file without parsing it. Runs on a loader thread.
+    Args:
+        path (str): Path of the file
+    Returns:
+        bytes: The contents
+    """
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _read_json(path: str) -> Any:
+    """
+    Read and parse a JSON file. Runs on a loader thread.
+    Args:
+        path (str): Path of the JSON file
+    Returns:
+        The parsed data
+    """
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+class AssetManager:
+    """
+    Shared cache for images and data files.
+    Images are cached already scaled and converted for the display, keyed by path, target size
+    and conversion mode, so changing screens never decodes or scales the same image twice.
+    When the cached images go over the memory budget the least recently used ones are dropped.
+
+    Assets can also be requested ahead of time, they are then decoded on a pool of loader
+    threads and each request gets a future. Converting for the display has to happen on the
+    main thread, so finished images are converted when they are first used or by poll.
+    """
+
+    def __init__(self, memory_budget: int = ASSET_SETTINGS["memory_budget_mb"] * 1024 * 1024):
+        """
+        Initialize the AssetManager.
+        Args:
+            memory_budget (int): Bytes of image data to keep cached before evicting
+        """
+        self.memory_budget = memory_budget
+        self.memory_used = 0
+        self.images: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.data: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Background loading
+        self.executor = ThreadPoolExecutor(
+            max_workers=ASSET_SETTINGS["loader_threads"], thread_name_prefix="asset-loader"
+        )
+        self.image_futures: Dict[Tuple, Future] = {}
+        self.data_futures: Dict[str, Future] = {}
+        self.failed_images: Set[Tuple] = set()  # Keys get_image_if_ready doesn't try again
+
+    @staticmethod
+    def _image_key(path: str, size: Optional[Tuple[int, int]], mode: str) -> Tuple:
+        """
+        Get the cache key of an image.
+        Args:
+            path (str): Path of the image file
+            size (tuple): Target size or None
+            mode (str): Conversion mode
+        Returns:
+            tuple: The key
+        """
+        if mode not in ("convert", "convert_alpha", "none"):
+            raise ValueError(f"Unknown conversion mode: {mode}")
+        return (path, tuple(size) if size else None, mode)
+
+    def get_image(self, path: str, size: Optional[Tuple[int, int]] = None, mode: str = "convert") -> pygame.Surface:
+        """
+        Get an image, loading, scaling and converting it the first time it's asked for.
+        If it was requested earlier this waits for the loader thread instead of loading it again.
+        The returned surface is shared, don't draw on it.
+        Args:
+            path (str): Path of the image file
+            size (tuple): Width and height to scale to, None keeps the original size
+            mode (str): "convert" for opaque images, "convert_alpha" for images with
+                transparency, "none" to keep the file's pixel format
+        Returns:
+            pygame.Surface: The image
+        """
+        key = self._image_key(path, size, mode)
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            self.images.move_to_end(key)
+            return image
+
+        self.misses += 1
+        future = self.image_futures.pop(key, None)
+        decoded = future.result() if future else _decode_image(path, key[1])
+        return self._store_image(key, decoded)
+
+    def get_image_if_ready(
+        self, path: str, size: Optional[Tuple[int, int]] = None, mode: str = "convert"
+    ) -> Optional[pygame.Surface]:
+        """
+        Get an image without waiting for it.
+        The first call starts loading it in the background, and None is returned until it's ready.
+        An image that fails to load is logged once and never tried again, it stays None.
+        Args:
+            path (str): Path of the image file
+            size (tuple): Width and height to scale to, None keeps the original size
+            mode (str): Conversion mode, see get_image
+        Returns:
+            pygame.Surface: The image, or None while it's still loading or when it can't be loaded
+        """
+        key = self._image_key(path, size, mode)
+        if key in self.images:
+            return self.get_image(path, size, mode)
+        if key in self.failed_images:
+            return None
+        future = self.request_image(path, size, mode)
+        if not future.done():
+            return None
+        if future.exception() is not None:
+            del self.image_futures[key]
+            self._image_failed(key, future.exception())
+            return None
+        return self.get_image(path, size, mode)
+
+    def request_image(self, path: str, size: Optional[Tuple[int, int]] = None, mode: str = "convert") -> Future:
+        """
+        Start decoding and scaling an image on a loader thread.
+        Args:
+            path (str): Path of the image file
+            size (tuple): Width and height to scale to, None keeps the original size
+            mode (str): Conversion mode, see get_image
+        Returns:
+            Future: Done once the image is decoded, call get_image to use it
+        """
+        key = self._image_key(path, size, mode)
+        if key in self.images:
+            future = Future()
+            future.set_result(self.images[key])
+            return future
+        if key not in self.image_futures:
+            self.image_futures[key] = self.executor.submit(_decode_image, path, key[1])
+        return self.image_futures[key]
+
+    def get_json(self, path: str) -> Any:
+        """
+        Get the parsed contents of a JSON file, reading it the first time it's asked for.
+        Args:
+            path (str): Path of the JSON file
+        Returns:
+            The parsed data, shared between callers
+        """
+        if path not in self.data:
+            self.misses += 1
+            future = self.data_futures.pop(path, None)
+            self.data[path] = future.result() if future else _read_json(path)
+        else:
+            self.hits += 1
+        return self.data[path]
+
+    def request_json(self, path: str) -> Future:
+        """
+        Start reading a JSON file on a loader thread.
+        Args:
+            path (str): Path of the JSON file
+        Returns:
+            Future: Done once the file is parsed, call get_json to use it
+        """
+        if path in self.data:
+            future = Future()
+            future.set_result(self.data[path])
+            return future
+        if path not in self.data_futures:
+            self.data_futures[path] = self.executor.submit(_read_json, path)
+        return self.data_futures[path]
+
+    def request_bytes(self, path: str) -> Future:
+        """
+        Start reading a file on a loader thread, e.g. music to stream from memory later.
+        The contents aren't cached, the caller keeps them for as long as it needs them.
+        Args:
+            path (str): Path of the file
+        Returns:
+            Future: Done once the file is read, its result is the contents
+        """
+        return self.executor.submit(_read_bytes, path)
+
+    def submit(self, func: Callable, *args) -> Future:
+        """
+        Run any other loading work, like decoding a sound, on a loader thread.
+        Args:
+            func (callable): The function to run
+            *args: Its arguments
+        Returns:
+            Future: The future of the result
+        """
+        return self.executor.submit(func, *args)
+
+    def poll(self) -> None:
+        """
+        Convert and cache every image that has finished loading.
+        Call this on the main thread, e.g. every update of a loading screen.
+        Loads that failed are logged and forgotten, the next get_image or get_json of
+        the file loads it again and raises if it still fails. get_image_if_ready keeps
+        returning None for images that failed.
+        """
+        for key, future in list(self.image_futures.items()):
+            if not future.done():
+                continue
+            del self.image_futures[key]
+            if future.exception() is not None:
+                self._image_failed(key, future.exception())
+                continue
+            self._store_image(key, future.result())
+        for path, future in list(self.data_futures.items()):
+            if future.done() and future.exception() is not None:
+                del self.data_futures[path]
+                logging.error(f"Failed to load {path}: {future.exception()}")
+
+    def _image_failed(self, key: Tuple, error: BaseException) -> None:
+        """
+        Log an image that couldn't be loaded and remember it, see get_image_if_ready.
+        Args:
+            key (tuple): The cache key
+            error (BaseException): Why it failed
+        """
+        logging.error(f"Failed to load image {key[0]}: {error}")
+        self.failed_images.add(key)
+
+    def _store_image(self, key: Tuple, image: pygame.Surface) -> pygame.Surface:
+        """
+        Convert a decoded image for the display and add it to the cache.
+        Args:
+            key (tuple): The cache key
+            image (pygame.Surface): The decoded image
+        Returns:
+            pygame.Surface: The cached image
+        """
+        mode = key[2]
+        if mode == "convert":
+            image = image.convert()
+        elif mode == "convert_alpha":
+            image = image.convert_alpha()
+
+        self.images[key] = image
+        self.failed_images.discard(key)
+        self.memory_used += self.image_size(image)
+        self._evict()
+        return image
+
+    @staticmethod
+    def image_size(image: pygame.Surface) -> int:
+        """
+        Get the memory used by an image's pixels.
+        Args:
+            image (pygame.Surface): The image
+        Returns:
+            int: Size in bytes
+        """
+        return image.get_height() * image.get_pitch()
+
+    def _evict(self) -> None:
+        """Drop the least recently used images until the cache fits its budget."""
+        # Always keep the newest image, even if it's over the budget on its own
+        while self.memory_used > self.memory_budget and len(self.images) > 1:
+            key, image = self.images.popitem(last=False)
+            self.memory_used -= self.image_size(image)
+            self.evictions += 1
+            logging.debug(f"Evicted {key[0]} at {key[1]} from the asset cache")
+
+    def clear(self) -> None:
+        """Drop every cached asset and forget the images that failed to load."""
+        self.images.clear()
+        self.data.clear()
+        self.failed_images.clear()
+        self.memory_used = 0
+
+    def shutdown(self) -> None:
+        """Stop the loader threads, dropping any loads that haven't started."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the cache statistics.
+        Returns:
+            dict: Cached image count, memory used and budget in bytes, hits, misses, evictions
+                and loads still in progress
+        """
+        return {
+            "images": len(self.images),
+            "memory_used": self.memory_used,
+            "memory_budget": self.memory_budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "loading": len(self.image_futures) + len(self.data_futures),
+        }
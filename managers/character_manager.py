@@ -2,6 +2,7 @@ import pygame
 import logging
 from typing import List, Optional, Tuple
 from characters import Regar, Susan, Emily, Bart, Character 
+from .profiler import profiled
 
 
 class CharacterManager:
@@ -35,6 +36,7 @@ class CharacterManager:
             y = 300
             character.rect.topleft = (x, y)
             character.position = pygame.math.Vector2(x, y)
+            character.reset_interpolation()
         self.character_group.empty()
         self.character_group.add(self.active_characters)
 
@@ -51,6 +53,7 @@ class CharacterManager:
                 y = 300
                 character.rect.topleft = (x, y)
                 character.position = pygame.math.Vector2(x, y)
+                character.reset_interpolation()
                 
             self.character_group.empty()
             self.character_group.add(self.active_characters)
@@ -81,6 +84,11 @@ class CharacterManager:
                 try:
                     character.rect.midbottom = (x, y)
                     character.position = pygame.math.Vector2(x, y - character.rect.height // 2)
+                    character.reset_interpolation()
+                    # Start every level from the same state so replays line up
+                    character.facing_right = True
+                    character.attacking = False
+                    character.attack_timer = 0
                 except AttributeError as e:
                     logging.error(f"Invalid character object at index {i}: {e}")
                     continue
@@ -97,9 +105,22 @@ class CharacterManager:
         Draw the characters on the screen.
         Args:
             screen (pygame.Surface): The screen surface
+        Returns:
+            list: The screen areas that were drawn to
+        """
+        drawn_rects = []
+        for character in self.active_characters:
+            drawn_rects.extend(character.draw(screen))
+        return drawn_rects
+
+    def queue_characters(self, render_queue):
+        """
+        Add the characters to a level's render queue.
+        Args:
+            render_queue (RenderQueue): The queue to add to
         """
         for character in self.active_characters:
-            character.draw(screen)
+            character.queue_draw(render_queue)
 
     def draw_ui(self, screen):
         """Draw UI elements with error handling.
@@ -139,6 +160,7 @@ class CharacterManager:
                 return character
         return None
 
+    @profiled("CharacterManager.update_characters")
     def update_characters(self, dt):
         """
         Update the characters in the game.
@@ -0,0 +1,69 @@
+from typing import Any, Dict, Hashable, Optional, Set
+
+
+class DamageBuffer:
+    """
+    Collects the damage player attacks deal during a tick, to be applied all at once.
+    Every swing has an ID and hits each target only once, however many ticks its hitbox stays
+    out, so damage doesn't depend on how many ticks or frames a swing lasts.
+    Hits without a swing ID count every time, like single use hitboxes.
+    """
+
+    def __init__(self):
+        """Initialize the DamageBuffer."""
+        self.pending: Dict[Hashable, int] = {}  # Target -> damage waiting to be applied
+        self.swing_hits: Dict[Any, Set[Hashable]] = {}  # Swing ID -> targets it already hit
+        self._active_swings: Set[Any] = set()  # Swings whose hitbox was out this tick
+
+    def add_hit(self, target: Hashable, amount: int, swing_id: Optional[Any] = None) -> bool:
+        """
+        Queue the damage of a hit, unless the swing already hit this target.
+        Args:
+            target: The target, an enemy or anything identifying one
+            amount (int): Damage of the hit
+            swing_id: ID of the swing the hit belongs to
+        Returns:
+            bool: True if the hit counts
+        """
+        if swing_id is not None:
+            self._active_swings.add(swing_id)
+            hit_targets = self.swing_hits.setdefault(swing_id, set())
+            if target in hit_targets:
+                return False
+            hit_targets.add(target)
+        self.pending[target] = self.pending.get(target, 0) + amount
+        return True
+
+    def already_hit(self, target: Hashable, swing_id: Optional[Any]) -> bool:
+        """
+        Check if a swing already hit a target, to skip its collision test.
+        Args:
+            target: The target
+            swing_id: ID of the swing
+        Returns:
+            bool: True if the hit wouldn't count
+        """
+        if swing_id is None:
+            return False
+        self._active_swings.add(swing_id)
+        return target in self.swing_hits.get(swing_id, ())
+
+    def drain(self) -> Dict[Hashable, int]:
+        """
+        Take the damage queued this tick and forget the swings that have ended.
+        Returns:
+            dict: Target -> total damage
+        """
+        pending = self.pending
+        self.pending = {}
+        for swing_id in list(self.swing_hits):
+            if swing_id not in self._active_swings:
+                del self.swing_hits[swing_id]
+        self._active_swings.clear()
+        return pending
+
+    def clear(self) -> None:
+        """Drop all queued damage and swings."""
+        self.pending.clear()
+        self.swing_hits.clear()
+        self._active_swings.clear()
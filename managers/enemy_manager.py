@@ -1,10 +1,19 @@
 import pygame
-import random
-from enemy import Enemy
+from enemy import Enemy, EnemyState
 import logging
 from typing import Optional, Tuple, List
 from characters import Character
 from config import ENEMY_SPAWN
+from render_layers import ACTORS, EFFECTS, HEALTH_BARS
+from .profiler import profiled
+from .wave_scheduler import WaveScheduler
+from .damage_buffer import DamageBuffer
+from .health_bars import HealthBarCache
+from .quality_manager import ATTACK_OVERLAYS, DISTANT_HEALTH_BARS
+from .spatial_hash import SpatialHash
+from .enemy_pool import EnemyPool
+from .ai_scheduler import AIScheduler
+from .flow_field import FlowField
 
 class EnemyManager:
     """
@@ -20,29 +29,41 @@ class EnemyManager:
         """
         self.game = game
         self.enemies = pygame.sprite.Group()
-        self.spawn_points = ENEMY_SPAWN["spawn_points"]
-        self.spawn_timer = 0
-        self.spawn_cooldown = ENEMY_SPAWN["spawn_cooldown"]
         self.max_enemies = ENEMY_SPAWN["max_enemies"]
-
+        self.waves = WaveScheduler(game, self)  # Decides when and where enemies spawn
+        self.pool = EnemyPool(game)  # Dead enemies are reused by later spawns
+        self.scheduler = AIScheduler(game)  # Staggers targeting and updates far enemies less often
+        self.flow_field = FlowField(game)  # Shared pursuit paths towards the players
+        self.damage = DamageBuffer()  # Player hits, applied once per tick
+        self.health_bars = HealthBarCache()
+
+        # Broadphase grids, rebuilt every update. Attack hits and targeting go through these
+        # so their cost doesn't grow with every enemy times every character.
+        self.enemy_index = SpatialHash()
+        self.character_index = SpatialHash()
+        self.enemy_index_dirty = True  # Enemies were added or removed since the last rebuild
+
+    @profiled("EnemyManager.update")
     def update(self, dt):
         """
         Update all enemies and handle spawning
         Args:
             dt (float): Time delta since last update
         """
-        # Update spawn timer
-        self.spawn_timer -= dt
-        if self.spawn_timer <= 0:
-            self._try_spawn_enemy()
-            self.spawn_timer = self.spawn_cooldown
+        self.resolve_damage()
+
+        # Spawn the enemies of the current wave
+        self.waves.update(dt)
+
+        self._rebuild_character_index()
+        self.flow_field.update(self.game.character_manager.active_characters)
+        self.scheduler.begin_tick()
 
         # Update enemies and remove those that have completed their death animation
         for enemy in list(
             self.enemies
         ):  # Create a copy of the list to safely modify during iteration
-            enemy.target = self._find_nearest_target(enemy)
-            enemy.update(dt)
+            self.scheduler.update_enemy(enemy, dt, self._find_nearest_target)
 
             # Only remove the enemy after death animation completes
             if enemy.health <= 0 and not enemy.is_dying:
@@ -51,16 +72,53 @@ class EnemyManager:
                 enemy.health <= 0 and enemy.is_dying and enemy.animation_complete
             ):  # Add animation_complete check
                 enemy.kill()
+                self.pool.release(enemy)
 
-    def _try_spawn_enemy(self):
-        """Attempt to spawn an enemy with error handling."""
-        try:
-            if len(self.enemies) < self.max_enemies:
-                spawn_point = random.choice(self.spawn_points)
-                enemy = Enemy(self.game, spawn_point)
-                self.enemies.add(enemy)
-        except Exception as e:
-            logging.error(f"Failed to spawn enemy: {str(e)}")
+        self.scheduler.end_tick()
+        self._rebuild_enemy_index()
+
+    def _rebuild_character_index(self):
+        """Put every active character in the character grid at its current position."""
+        self.character_index.clear()
+        for character in self.game.character_manager.active_characters:
+            self.character_index.insert_point(character, character.position.x, character.position.y)
+
+    def _rebuild_enemy_index(self):
+        """Put every enemy in the enemy grid with its current rect."""
+        self.enemy_index.clear()
+        for enemy in self.enemies:
+            self.enemy_index.insert(enemy, enemy.rect)
+        self.enemy_index_dirty = False
+
+    def add_enemy(self, enemy: Enemy) -> None:
+        """
+        Add an enemy to the level.
+        Args:
+            enemy (Enemy): The enemy to add
+        """
+        self.enemies.add(enemy)
+        enemy.flow_field = self.flow_field
+        self.scheduler.register(enemy)
+        self.enemy_index_dirty = True
+
+    def spawn_enemy(self, position: Tuple[float, float], state: EnemyState = EnemyState.SPAWNING) -> None:
+        """
+        Add an enemy to the level, reusing a dead one from the pool when possible.
+        Args:
+            position (tuple): The x,y coordinates where the enemy spawns
+            state (EnemyState): The state it starts in
+        """
+        enemy = self.pool.acquire(position)
+        enemy.state = state
+        self.add_enemy(enemy)
+
+    def preallocate(self, count: int) -> None:
+        """
+        Create enemies ahead of time so spawning during the fight doesn't have to.
+        Args:
+            count (int): Number of enemies to have ready
+        """
+        self.pool.preallocate(count - len(self.enemies))
 
     def _find_nearest_target(self, enemy: Enemy) -> Optional[Character]:
         """
@@ -70,83 +128,103 @@ class EnemyManager:
         Returns:
             Character: The nearest player character
         """
-        nearest_target = None
-        min_distance = float("inf")
-
-        for character in self.game.character_manager.active_characters:
-            distance = (character.position - enemy.position).length()
-            if distance < min_distance:
-                min_distance = distance
-                nearest_target = character
+        if self.character_index.count != len(self.game.character_manager.active_characters):
+            self._rebuild_character_index()
+        return self.character_index.nearest(enemy.position.x, enemy.position.y)
 
-        return nearest_target
-
-    def draw(self, screen):
+    @profiled("EnemyManager.draw")
+    def draw(self, render_queue):
         """
-        Draw all enemies, their attack indicators, and health bars
+        Add all enemies, their attack indicators, and health bars to the render queue.
+        Enemies are sorted in with the characters by depth, each of the others is a layer
+        drawn with a single blits call. Enemies off screen are skipped.
+        The quality manager can switch off the attack indicators and the health bars of
+        enemies far from their target.
         Args:
-            screen (pygame.Surface): The screen surface to draw on
+            render_queue (RenderQueue): The level's render queue
         """
+        screen_width, screen_height = render_queue.screen.get_size()
+        quality = self.game.quality
+        show_attacks = quality.allows(ATTACK_OVERLAYS)
+        all_health_bars = quality.allows(DISTANT_HEALTH_BARS)
+        bar_distance_squared = quality.health_bar_distance_squared
+        add, add_sorted = render_queue.add, render_queue.add_sorted
         for enemy in self.enemies:
-            # Draw enemy sprite
-            enemy.draw(screen)
-
-            # Draw attack indicator if attacking
-            if enemy.attacking:
+            render_rect = enemy.get_render_rect()
+            attack_width = enemy.attack_range.get_width()
+            if (
+                render_rect.right + attack_width < 0
+                or render_rect.left - attack_width > screen_width
+                or render_rect.bottom < 0
+                or render_rect.top - 10 > screen_height
+            ):
+                continue
+
+            if enemy.visible and not (enemy.is_dying and enemy.animation_complete):
+                add_sorted(ACTORS, enemy, render_rect.bottom, enemy.image, render_rect)
+
+            # Attack indicator if attacking
+            if enemy.attacking and show_attacks:
                 attack_rect = enemy.attack_range.get_rect()
                 if enemy.facing_right:
-                    attack_rect.midleft = (enemy.rect.centerx, enemy.rect.centery)
+                    attack_rect.midleft = render_rect.center
                 else:
-                    attack_rect.midright = (enemy.rect.centerx, enemy.rect.centery)
-                screen.blit(enemy.attack_range, attack_rect)
-
-            # Draw enemy health bar
-            if not enemy.is_dying:
-                health_bar_width = 50
-                health_bar_height = 5
-                health_percentage = enemy.health / enemy.max_health
-                current_health_width = health_bar_width * health_percentage
-
-                # Background (red)
-                pygame.draw.rect(
-                    screen,
-                    (255, 0, 0),
-                    (
-                        enemy.rect.x,
-                        enemy.rect.y - 10,
-                        health_bar_width,
-                        health_bar_height,
-                    ),
-                )
-
-                # Foreground (green)
-                pygame.draw.rect(
-                    screen,
-                    (0, 255, 0),
-                    (
-                        enemy.rect.x,
-                        enemy.rect.y - 10,
-                        current_health_width,
-                        health_bar_height,
-                    ),
-                )
-
-    def handle_collision(self, player_attack_rect: pygame.Rect, player_strength: int) -> None:
-        """
-        Handle collisions between player attacks and enemies
+                    attack_rect.midright = render_rect.center
+                add(EFFECTS, enemy.attack_range, attack_rect)
+
+            if not enemy.is_dying and (all_health_bars or self._near_target(enemy, bar_distance_squared)):
+                health_bar = self.health_bars.get(enemy.health, enemy.max_health)
+                add(HEALTH_BARS, health_bar, (render_rect.x, render_rect.y - 10))
+
+    @staticmethod
+    def _near_target(enemy: Enemy, distance_squared: float) -> bool:
+        """
+        Check if an enemy is close to its target.
+        Args:
+            enemy (Enemy): The enemy
+            distance_squared (float): The squared distance that counts as close
+        Returns:
+            bool: True when the enemy has a target within the distance
+        """
+        if enemy.target is None:
+            return False
+        offset_x = enemy.target.position.x - enemy.position.x
+        offset_y = enemy.target.position.y - enemy.position.y
+        return offset_x * offset_x + offset_y * offset_y <= distance_squared
+
+    def handle_collision(self, player_attack_rect: pygame.Rect, player_strength: int, swing_id=None) -> None:
+        """
+        Handle collisions between player attacks and enemies.
+        The damage is queued and applied by resolve_damage at the start of the next update.
         Args:
             player_attack_rect (pygame.Rect): The attack hitbox of the player
             player_strength (int): The strength of the player's attack
+            swing_id: ID of the swing, each swing hits an enemy only once. None counts every call.
         """
-        for enemy in self.enemies:
-            if enemy.rect.colliderect(player_attack_rect):
-                enemy.take_damage(player_strength)
+        if self.enemy_index_dirty:
+            self._rebuild_enemy_index()
+        for enemy in self.enemy_index.query_rect(player_attack_rect):
+            if self.damage.already_hit(enemy, swing_id):
+                continue
+            if enemy.alive() and enemy.rect.colliderect(player_attack_rect):
+                self.damage.add_hit(enemy, player_strength, swing_id)
+
+    def resolve_damage(self) -> None:
+        """Apply the damage of every hit queued since the last update, one take_damage per enemy."""
+        for enemy, amount in self.damage.drain().items():
+            if enemy.alive():
+                enemy.take_damage(amount)
 
     def clear(self):
         """
-        Clear all enemies from the game
+        Clear all enemies from the game, they go back to the pool
         """
+        for enemy in self.enemies:
+            self.pool.release(enemy)
         self.enemies.empty()
+        self.damage.clear()
+        self.enemy_index.clear()
+        self.enemy_index_dirty = True
 
     def get_enemy_count(self):
         """
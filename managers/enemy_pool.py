@@ -0,0 +1,73 @@
+from typing import Dict, List, Tuple
+from enemy import Enemy
+
+
+class EnemyPool:
+    """
+    Keeps dead enemies around to be reused by later spawns.
+    Creating an Enemy allocates several surfaces, so in long fights spawning a new one every
+    time churns memory and ends up in garbage collector pauses mid-fight. Enemies are created
+    ahead of time at level start, reset when they are acquired and handed back when they die.
+    """
+
+    def __init__(self, game):
+        """
+        Initialize the EnemyPool.
+        Args:
+            game (Game): The game instance
+        """
+        self.game = game
+        self.free: List[Enemy] = []
+        self.created = 0
+        self.hits = 0  # Spawns that reused a pooled enemy
+        self.misses = 0  # Spawns that had to create a new enemy
+
+    def preallocate(self, count: int) -> None:
+        """
+        Create enemies until the pool holds at least a number of them.
+        Args:
+            count (int): Number of free enemies to have ready
+        """
+        while len(self.free) < count:
+            self.free.append(Enemy(self.game, (0, 0)))
+            self.created += 1
+
+    def acquire(self, spawn_position: Tuple[float, float]) -> Enemy:
+        """
+        Get an enemy ready to spawn, reusing a free one when there is one.
+        Args:
+            spawn_position (tuple): The x,y coordinates where the enemy spawns
+        Returns:
+            Enemy: The enemy
+        """
+        if self.free:
+            self.hits += 1
+            enemy = self.free.pop()
+            enemy.reset(spawn_position)
+            return enemy
+
+        self.misses += 1
+        self.created += 1
+        return Enemy(self.game, spawn_position)
+
+    def release(self, enemy: Enemy) -> None:
+        """
+        Hand an enemy that left the level back to the pool.
+        Args:
+            enemy (Enemy): The enemy, it must not be in any sprite group anymore
+        """
+        enemy.target = None  # Don't keep a character alive through a pooled enemy
+        self.free.append(enemy)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the pool statistics.
+        Returns:
+            dict: Free enemies, enemies created in total, hits and misses
+        """
+        return {
+            "free": len(self.free),
+            "created": self.created,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
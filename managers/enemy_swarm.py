@@ -0,0 +1,512 @@
+import math
+from typing import Dict, List, Tuple
+import pygame
+from enemy import EnemyState
+from characters import HIT_FLASH_TICKS
+from animation import FRAME_SIZE, get_animation_set
+from config import ENEMY_STATS, ENEMY_ATTACK, ENEMY_SPAWN
+from game_logging import log_event, COMBAT
+from render_layers import ACTORS, EFFECTS, HEALTH_BARS
+from .profiler import profiled
+from .wave_scheduler import WaveScheduler
+from .damage_buffer import DamageBuffer
+from .health_bars import HealthBarCache
+from .quality_manager import ATTACK_OVERLAYS, DISTANT_HEALTH_BARS
+from .flow_field import FlowField
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the game falls back to EnemyManager without it
+    np = None
+
+INITIAL_CAPACITY = 256
+ENEMY_SIZE = FRAME_SIZE  # Enemies are as big as their animation frames
+
+
+class EnemySwarm:
+    """
+    Enemy backend that simulates every enemy at once.
+    Instead of one sprite per enemy, positions, health, timers and states are kept in NumPy
+    arrays with one row per enemy and every tick is a handful of whole-array operations.
+    Enemies behave exactly like Enemy sprites do, and LevelScreen uses it through the same
+    methods as EnemyManager. Needs numpy, see Game.create_enemy_manager.
+    """
+
+    def __init__(self, game, capacity: int = INITIAL_CAPACITY):
+        """
+        Initialize the EnemySwarm.
+        Args:
+            game (Game): The game instance
+            capacity (int): Number of enemies to allocate room for, grows when needed
+        """
+        if np is None:
+            raise ImportError("EnemySwarm needs numpy, install it or use the sprite enemy backend")
+
+        self.game = game
+        self.max_enemies = ENEMY_SPAWN["max_enemies"]
+        self.waves = WaveScheduler(game, self)  # Decides when and where enemies spawn
+
+        # Shared enemy stats
+        self.max_health = ENEMY_STATS["health"]
+        self.speed = ENEMY_STATS["speed"]
+        self.strength = ENEMY_STATS["strength"]
+        self.stun_duration = ENEMY_STATS["stun_duration"]
+        self.attack_range_distance = ENEMY_ATTACK["range_distance"]
+        self.attack_cooldown = ENEMY_ATTACK["cooldown"]
+        self.death_blink_duration = ENEMY_STATS["death_blink_duration"]
+        self.death_total_time = ENEMY_STATS["death_total_time"]
+        self.max_blinks = ENEMY_STATS["max_blinks"]
+
+        self.count = 0
+        self.next_uid = 0
+        self._allocate(capacity)
+        self.damage = DamageBuffer()  # Player hits by enemy uid, applied once per tick
+
+        # Pursuit follows the same navigation grid as the sprite enemies
+        self.flow_field = FlowField(game)
+        self._field_arrays: Dict = {}  # The fields of the active characters as arrays
+
+        # The same animations the Enemy sprites use, shared instead of one image per enemy
+        self.animations = get_animation_set("Enemy", ENEMY_STATS["color"])
+        animations = self.animations.animations
+        self.animation_frame_ticks = np.array([animation.frame_ticks for animation in animations])
+        self.animation_last_frames = np.array([animation.last_frame for animation in animations])
+        self.animation_loops = np.array([animation.loop for animation in animations])
+        self.attack_range = pygame.Surface(ENEMY_ATTACK["range_size"])
+        self.attack_range.fill(ENEMY_ATTACK["range_color"])
+        self.health_bars = HealthBarCache()
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Create the enemy arrays, keeping the enemies already in them.
+        Args:
+            capacity (int): Number of rows
+        """
+        old = getattr(self, "position", None)
+        fields = {
+            "uid": (np.int64, capacity),  # Never reused, so queued hits find the right enemy
+            "position": (np.float64, (capacity, 2)),
+            "previous_position": (np.float64, (capacity, 2)),
+            "health": (np.int64, capacity),
+            "state": (np.int8, capacity),
+            "target": (np.int64, capacity),  # Index into the active characters, -1 for none
+            "attack_timer": (np.float64, capacity),
+            "stun_timer": (np.float64, capacity),
+            "hit_flash_until": (np.int64, capacity),  # Tick the hit flash ends on
+            "animation": (np.int8, capacity),  # Index of the animation playing, see Animation.index
+            "animation_frame": (np.int16, capacity),
+            "animation_next_tick": (np.int64, capacity),  # Tick the next frame is due on
+            "death_time_left": (np.float64, capacity),
+            "death_blink_timer": (np.float64, capacity),
+            "blink_count": (np.int64, capacity),
+            "facing_right": (np.bool_, capacity),
+            "attacking": (np.bool_, capacity),
+            "is_dying": (np.bool_, capacity),
+            "visible": (np.bool_, capacity),
+            "animation_complete": (np.bool_, capacity),
+        }
+        for name, (dtype, shape) in fields.items():
+            array = np.zeros(shape, dtype=dtype)
+            if old is not None:
+                array[: self.count] = getattr(self, name)[: self.count]
+            setattr(self, name, array)
+        self.fields = list(fields)
+        self.capacity = capacity
+
+    def preallocate(self, count: int) -> None:
+        """
+        Make room for a number of enemies ahead of time.
+        Args:
+            count (int): Number of enemies to have room for
+        """
+        if count > self.capacity:
+            self._allocate(count)
+
+    def spawn_enemy(self, position: Tuple[float, float], state: EnemyState = EnemyState.SPAWNING) -> None:
+        """
+        Add an enemy to the level.
+        Args:
+            position (tuple): The x,y coordinates where the enemy spawns
+            state (EnemyState): The state it starts in
+        """
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        i = self.count
+        self.count += 1
+        self.uid[i] = self.next_uid
+        self.next_uid += 1
+        self.position[i] = position
+        self.previous_position[i] = position
+        self.health[i] = self.max_health
+        self.state[i] = state.value
+        self.target[i] = -1
+        self.attack_timer[i] = 0
+        self.stun_timer[i] = 0
+        self.hit_flash_until[i] = 0
+        self.animation[i] = self.animations.walk.index
+        self.animation_frame[i] = 0
+        self.animation_next_tick[i] = self.game.tick_count + self.animations.walk.frame_ticks
+        self.death_time_left[i] = self.death_total_time
+        self.death_blink_timer[i] = self.death_blink_duration
+        self.blink_count[i] = 0
+        self.facing_right[i] = True
+        self.attacking[i] = False
+        self.is_dying[i] = False
+        self.visible[i] = True
+        self.animation_complete[i] = False
+
+    def _find_nearest_targets(self) -> List:
+        """
+        Point every enemy at its nearest player character.
+        Returns:
+            list: The active characters, indexed by the target array
+        """
+        characters = self.game.character_manager.active_characters
+        n = self.count
+        if not characters:
+            self.target[:n] = -1
+            return characters
+        character_positions = np.array([(c.position.x, c.position.y) for c in characters])
+        offsets = character_positions[None, :, :] - self.position[:n, None, :]
+        self.target[:n] = np.argmin((offsets**2).sum(axis=2), axis=1)
+        return characters
+
+    @profiled("EnemySwarm.update")
+    def update(self, dt):
+        """
+        Update all enemies and handle spawning, the same steps as Enemy.update for every enemy
+        Args:
+            dt (float): Time delta since last update
+        """
+        self.resolve_damage()
+
+        self.waves.update(dt)
+
+        n = self.count
+        if n == 0:
+            return
+        characters = self._find_nearest_targets()
+        self.flow_field.update(characters)
+        self.previous_position[:n] = self.position[:n]
+
+        position = self.position[:n]
+        state = self.state[:n]
+        is_dying = self.is_dying[:n]
+        visible = self.visible[:n]
+        attack_timer = self.attack_timer[:n]
+        attacking = self.attacking[:n]
+
+        # Death animation
+        dying = is_dying.copy()
+        self.death_time_left[:n][dying] -= dt
+        self.death_blink_timer[:n][dying] -= dt
+        blink = dying & (self.death_blink_timer[:n] <= 0)
+        visible[blink] = ~visible[blink]
+        self.death_blink_timer[:n][blink] = self.death_blink_duration
+        self.blink_count[:n][blink & visible] += 1
+        finished = dying & ((self.blink_count[:n] >= self.max_blinks) | (self.death_time_left[:n] <= 0))
+        self.animation_complete[:n][finished] = True
+        visible[finished] = False
+
+        # Stunned enemies only count down
+        stunned = ~dying & (state == EnemyState.STUNNED.value)
+        self.stun_timer[:n][stunned] -= dt
+        state[stunned & (self.stun_timer[:n] <= 0)] = EnemyState.PURSUING.value
+
+        active = ~dying & ~stunned
+        cooling_down = active & (attack_timer > 0)
+        attack_timer[cooling_down] -= dt
+
+        # Every state acts on the state it had at the start of the tick
+        spawning = active & (state == EnemyState.SPAWNING.value)
+        pursuing = active & (state == EnemyState.PURSUING.value)
+        in_attack = active & (state == EnemyState.ATTACKING.value)
+
+        # Spawning: walk in until inside the level bounds
+        screen = self.game.current_screen
+        x, y = position[:, 0], position[:, 1]
+        top = screen.floor_y - ENEMY_SIZE[1]
+        outside = (x < screen.left_x) | (x > screen.right_x) | (y < top) | (y > screen.ceiling_y)
+        step = self.speed * dt
+        walking_in = spawning & outside
+        x += np.where(walking_in & (x < screen.left_x), step, 0)
+        x -= np.where(walking_in & (x > screen.right_x), step, 0)
+        y += np.where(walking_in & (y < top), step, 0)
+        y -= np.where(walking_in & (y > screen.ceiling_y), step, 0)
+        state[spawning & ~outside] = EnemyState.PURSUING.value
+
+        has_target = self.target[:n] >= 0
+        if characters:
+            character_positions = np.array([(c.position.x, c.position.y) for c in characters])
+            direction = character_positions[self.target[:n]] - position
+        else:
+            direction = np.zeros_like(position)
+        distance = np.hypot(direction[:, 0], direction[:, 1])
+        in_range = distance <= self.attack_range_distance
+
+        # Pursuing: turn towards the target, then attack it if it's in range or walk to it
+        pursuing &= has_target & (distance > 0)
+        self.facing_right[:n][pursuing] = direction[pursuing, 0] > 0
+        state[pursuing & in_range] = EnemyState.ATTACKING.value
+        walking = pursuing & ~in_range
+        flow, follows_flow = self._flow_directions(characters, walking)
+        heading_straight = walking & ~follows_flow
+        position[heading_straight] += direction[heading_straight] / distance[heading_straight, None] * step
+        position[follows_flow] += flow[follows_flow] * step
+
+        # Attacking: go back to pursuing when the target is gone or out of range
+        lost_target = in_attack & (~has_target | ~in_range)
+        state[lost_target] = EnemyState.PURSUING.value
+        attacking[lost_target & has_target] = False
+        in_attack &= ~lost_target
+        strike = in_attack & ~attacking & (attack_timer <= 0)
+        attacking[strike] = True
+        attack_timer[strike] = self.attack_cooldown
+        recovering = in_attack & ~strike & attacking & (attack_timer > 0)
+        attacking[recovering & (attack_timer <= self.attack_cooldown * 0.3)] = False
+
+        # Deal the damage of every strike, one take_damage per character hit
+        if strike.any():
+            hits = np.bincount(self.target[:n][strike], minlength=len(characters))
+            for character, hit_count in zip(characters, hits):
+                if hit_count and hasattr(character, "take_damage"):
+                    damage = int(hit_count) * self.strength
+                    character.take_damage(damage)
+                    if __debug__:
+                        log_event(COMBAT, "enemy_hit", damage=damage, target=character.name, hits=int(hit_count))
+
+        # Start the death animation of anything killed outside take_damage, remove finished ones
+        dead = self.health[:n] <= 0
+        newly_dead = dead & ~is_dying
+        is_dying[newly_dead] = True
+        self._update_animations()
+        self._remove(dead & ~newly_dead & self.animation_complete[:n])
+
+    def _update_animations(self) -> None:
+        """Advance the animation of every enemy, like Enemy.update_sprite does."""
+        n = self.count
+        animations = self.animations
+        state = self.state[:n]
+        chosen = np.where(self.attacking[:n], animations.attack.index, animations.idle.index)
+        chosen = np.where(state == EnemyState.ATTACKING.value, chosen, animations.walk.index)
+        chosen[state == EnemyState.STUNNED.value] = animations.idle.index
+        chosen[self.is_dying[:n]] = animations.death.index
+
+        tick = self.game.tick_count
+        frame = self.animation_frame[:n]
+        next_tick = self.animation_next_tick[:n]
+        changed = chosen != self.animation[:n]
+        due = ~changed & (tick >= next_tick)
+        at_end = np.where(self.animation_loops[chosen], 0, frame)
+        following = np.where(frame < self.animation_last_frames[chosen], frame + 1, at_end)
+        frame[due] = following[due]
+        frame[changed] = 0
+        restarted = changed | due
+        next_tick[restarted] = tick + self.animation_frame_ticks[chosen[restarted]]
+        self.animation[:n] = chosen
+
+    def _flow_directions(self, characters: List, walking):
+        """
+        Look up the flow field direction of every walking enemy towards its target.
+        Args:
+            characters (list): The active characters, indexed by the target array
+            walking (numpy.ndarray): True for every enemy that moves towards its target
+        Returns:
+            tuple: The directions, and True for every enemy the flow field has a direction for
+        """
+        n = self.count
+        field_grid = self.flow_field
+        fields = [field_grid.fields.get(character) for character in characters]
+        if not characters or None in fields:
+            return np.zeros((n, 2)), np.zeros(n, dtype=np.bool_)
+
+        # The fields of all characters stacked in arrays, redone when one of them was rebuilt
+        cached_fields = self._field_arrays.get("fields", ())
+        if len(cached_fields) != len(fields) or any(a is not b for a, b in zip(cached_fields, fields)):
+            directions = np.array([np.column_stack((f.direction_x, f.direction_y)) for f in fields])
+            # In sight of the goal the enemies head straight for their target
+            reachable = (np.array([f.distance for f in fields]) != math.inf) & ~np.array([f.straight for f in fields])
+            self._field_arrays = {"fields": fields, "directions": directions, "reachable": reachable}
+
+        columns = ((self.position[:n, 0] - field_grid.left) // field_grid.cell_size).astype(np.int64)
+        rows = ((self.position[:n, 1] - field_grid.top) // field_grid.cell_size).astype(np.int64)
+        inside = (columns >= 0) & (columns < field_grid.columns) & (rows >= 0) & (rows < field_grid.rows)
+        cells = np.where(inside, rows * field_grid.columns + columns, 0)
+        targets = self.target[:n]
+        follows_flow = walking & inside & self._field_arrays["reachable"][targets, cells]
+        return self._field_arrays["directions"][targets, cells], follows_flow
+
+    def _remove(self, mask) -> None:
+        """
+        Remove enemies, moving the rest together at the start of the arrays.
+        Args:
+            mask (numpy.ndarray): True for every enemy to remove
+        """
+        if not mask.any():
+            return
+        keep = ~mask
+        kept = int(keep.sum())
+        for name in self.fields:
+            array = getattr(self, name)
+            array[:kept] = array[: self.count][keep]
+        self.count = kept
+
+    def _render_positions(self):
+        """
+        Get the positions to draw the enemies at, interpolated between the last two
+        simulation steps
+        Returns:
+            numpy.ndarray: Top left x,y of every enemy, as ints
+        """
+        n = self.count
+        alpha = self.game.interpolation_alpha
+        previous = self.previous_position[:n]
+        return (previous + (self.position[:n] - previous) * alpha).astype(np.int64)
+
+    @profiled("EnemySwarm.draw")
+    def draw(self, render_queue):
+        """
+        Add all enemies, their attack indicators, and health bars to the render queue.
+        Enemies are sorted in with the characters by depth, each of the others is a layer
+        drawn with a single blits call. Enemies off screen are skipped.
+        The quality manager can switch off the attack indicators and the health bars of
+        enemies far from their target.
+        Args:
+            render_queue (RenderQueue): The level's render queue
+        """
+        n = self.count
+        if n == 0:
+            return
+        render_positions = self._render_positions()
+        screen_width, screen_height = render_queue.screen.get_size()
+        attack_width, attack_height = self.attack_range.get_size()
+        left, top = render_positions[:, 0], render_positions[:, 1]
+        on_screen = (
+            (left + ENEMY_SIZE[0] + attack_width >= 0)
+            & (left - attack_width <= screen_width)
+            & (top + ENEMY_SIZE[1] >= 0)
+            & (top - 10 <= screen_height)
+        )
+        shown = on_screen & self.visible[:n] & ~(self.is_dying[:n] & self.animation_complete[:n])
+        facing_right = self.facing_right[:n]
+
+        # Pick the frame of every enemy like Character.update_sprite does
+        frames = [(animation.frames, animation.hit_flash) for animation in self.animations.animations]
+        flashing = self.hit_flash_until[:n] > self.game.tick_count
+        render_queue.extend_sorted(ACTORS, (
+            (uid, y + ENEMY_SIZE[1], frames[animation][flash][frame][facing], (x, y))
+            for uid, (x, y), facing, animation, flash, frame in zip(
+                self.uid[:n][shown].tolist(),
+                render_positions[shown].tolist(),
+                facing_right[shown].tolist(),
+                self.animation[:n][shown].tolist(),
+                flashing[shown].tolist(),
+                self.animation_frame[:n][shown].tolist(),
+            )
+        ))
+
+        quality = self.game.quality
+        attacking = on_screen & self.attacking[:n]
+        if not quality.allows(ATTACK_OVERLAYS):
+            attacking[:] = False
+        half_width, half_height = ENEMY_SIZE[0] // 2, ENEMY_SIZE[1] // 2
+        for (x, y), facing in zip(render_positions[attacking].tolist(), facing_right[attacking].tolist()):
+            center_x = x + half_width
+            attack_left = center_x if facing else center_x - attack_width
+            render_queue.add(EFFECTS, self.attack_range, (attack_left, y + half_height - attack_height // 2))
+
+        with_bar = on_screen & ~self.is_dying[:n]
+        if not quality.allows(DISTANT_HEALTH_BARS):
+            with_bar &= self._near_target(quality.health_bar_distance_squared)
+        get_bar = self.health_bars.get
+        render_queue.extend(HEALTH_BARS, (
+            (get_bar(health, self.max_health), (x, y - 10))
+            for (x, y), health in zip(render_positions[with_bar].tolist(), self.health[:n][with_bar].tolist())
+        ))
+
+    def _near_target(self, distance_squared: float):
+        """
+        Check which enemies are close to their target.
+        Args:
+            distance_squared (float): The squared distance that counts as close
+        Returns:
+            numpy.ndarray: True for every enemy with a target within the distance
+        """
+        n = self.count
+        characters = self.game.character_manager.active_characters
+        targets = self.target[:n]
+        has_target = (targets >= 0) & (targets < len(characters))
+        if not characters:
+            return has_target
+        character_positions = np.array([(c.position.x, c.position.y) for c in characters])
+        offsets = character_positions[np.where(has_target, targets, 0)] - self.position[:n]
+        return has_target & ((offsets**2).sum(axis=1) <= distance_squared)
+
+    def handle_collision(self, player_attack_rect: pygame.Rect, player_strength: int, swing_id=None) -> None:
+        """
+        Handle collisions between player attacks and enemies.
+        The damage is queued and applied by resolve_damage at the start of the next update.
+        Args:
+            player_attack_rect (pygame.Rect): The attack hitbox of the player
+            player_strength (int): The strength of the player's attack
+            swing_id: ID of the swing, each swing hits an enemy only once. None counts every call.
+        """
+        n = self.count
+        if n == 0:
+            return
+        # Enemy rects sit at the truncated position, like Enemy.rect
+        left = np.trunc(self.position[:n, 0])
+        top = np.trunc(self.position[:n, 1])
+        hit = (
+            (left < player_attack_rect.right)
+            & (left + ENEMY_SIZE[0] > player_attack_rect.left)
+            & (top < player_attack_rect.bottom)
+            & (top + ENEMY_SIZE[1] > player_attack_rect.top)
+        )
+        for uid in self.uid[:n][hit].tolist():
+            self.damage.add_hit(uid, player_strength, swing_id)
+
+    def resolve_damage(self) -> None:
+        """Apply the damage of every hit queued since the last update, to all enemies at once."""
+        pending = self.damage.drain()
+        n = self.count
+        if not pending or n == 0:
+            return
+        uids = np.fromiter(pending.keys(), dtype=np.int64, count=len(pending))
+        amounts = np.fromiter(pending.values(), dtype=np.int64, count=len(pending))
+        # Enemies keep their spawn order, so the ids are sorted. Enemies removed since the hit are skipped.
+        indices = np.minimum(np.searchsorted(self.uid[:n], uids), n - 1)
+        found = self.uid[:n][indices] == uids
+        hit = np.zeros(n, dtype=np.bool_)
+        hit[indices[found]] = True
+        damage = np.zeros(n, dtype=np.int64)
+        damage[indices[found]] = amounts[found]
+
+        # Same as Enemy.take_damage: killed enemies start dying, the others are stunned
+        health = self.health[:n]
+        health[hit] = np.maximum(0, health[hit] - damage[hit])
+        self.hit_flash_until[:n][hit] = self.game.tick_count + HIT_FLASH_TICKS
+        is_dying = self.is_dying[:n]
+        killed = hit & (health <= 0) & ~is_dying
+        is_dying[killed] = True
+        self.death_blink_timer[:n][killed] = self.death_blink_duration
+        self.animation_complete[:n][killed] = False
+        self.blink_count[:n][killed] = 0
+        stunned = hit & ~is_dying
+        self.state[:n][stunned] = EnemyState.STUNNED.value
+        self.stun_timer[:n][stunned] = self.stun_duration
+
+    def clear(self):
+        """
+        Clear all enemies from the game
+        """
+        self.count = 0
+        self.damage.clear()
+
+    def get_enemy_count(self):
+        """
+        Get the current number of enemies
+        Returns:
+            int: Number of active enemies
+        """
+        return self.count
@@ -0,0 +1,290 @@
+import heapq
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import pygame
+from characters import Character
+from config import FLOW_FIELD_SETTINGS
+from .profiler import profiled
+
+# Neighbour offsets with their step cost, straight and diagonal
+NEIGHBOURS = [
+    (dx, dy, math.hypot(dx, dy)) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy
+]
+# Corners of a cell as fractions of it, just inside so they stay in the cell
+CORNERS = [(x, y) for x in (0.01, 0.99) for y in (0.01, 0.99)]
+
+
+class Field:
+    """
+    The distance and direction grid towards one character.
+    Directions are unit vectors towards the farthest cell of the shortest path that can be
+    seen from the cell, (0, 0) in cells that can't reach the character. Cells that can see
+    the character's own cell are straight: there the enemy heads straight for the character.
+    """
+
+    __slots__ = ("goal", "distance", "direction_x", "direction_y", "straight")
+
+    def __init__(self, goal: int, size: int):
+        """
+        Initialize an empty field.
+        Args:
+            goal (int): Index of the cell the character is in
+            size (int): Number of cells in the grid
+        """
+        self.goal = goal
+        self.distance: List[float] = [math.inf] * size
+        self.direction_x: List[float] = [0.0] * size
+        self.direction_y: List[float] = [0.0] * size
+        self.straight: List[bool] = [False] * size
+
+
+class FlowField:
+    """
+    Navigation grid the enemies follow towards the players.
+    The level area is split into cells and every player gets a field that tells each cell
+    which way to go to reach that player, walking around blocked cells. A field is only rebuilt
+    when its player moves to another cell, and an enemy just looks up the cell it's in, so
+    pursuit costs the same per enemy however many enemies there are.
+    Enemies that can see their player's cell, and all of them in levels without obstacles,
+    aren't steered and head straight for the player.
+    Positions are top left corners, like Character.position.
+    """
+
+    def __init__(self, game, cell_size: int = FLOW_FIELD_SETTINGS["cell_size"]):
+        """
+        Initialize the FlowField.
+        Args:
+            game (Game): The game instance
+            cell_size (int): Width and height of a cell in pixels
+        """
+        self.game = game
+        self.cell_size = cell_size
+        self.left, self.top, right, bottom = FLOW_FIELD_SETTINGS["area"]
+        self.columns = int((right - self.left) // cell_size) + 1
+        self.rows = int((bottom - self.top) // cell_size) + 1
+        self.blocked = [False] * (self.columns * self.rows)
+        self.has_obstacles = False
+        self.blocked_sums: List[List[int]] = []
+        self.fields: Dict[Character, Field] = {}
+        self.set_obstacles(FLOW_FIELD_SETTINGS["obstacles"])
+
+    def set_obstacles(self, obstacles: Iterable[Sequence[int]]) -> None:
+        """
+        Block every cell whose center is inside one of the obstacles, e.g. walls.
+        Args:
+            obstacles (iterable): Rects as (x, y, width, height), in position coordinates
+        """
+        rects = [pygame.Rect(obstacle) for obstacle in obstacles]
+        half = self.cell_size / 2
+        for row in range(self.rows):
+            for column in range(self.columns):
+                center = (self.left + column * self.cell_size + half, self.top + row * self.cell_size + half)
+                self.blocked[row * self.columns + column] = any(rect.collidepoint(center) for rect in rects)
+        self.has_obstacles = any(self.blocked)
+        # Blocked cells above and left of every grid corner, to count those in a rectangle at once
+        self.blocked_sums = [[0] * (self.columns + 1) for _ in range(self.rows + 1)]
+        for row in range(self.rows):
+            row_count = 0
+            for column in range(self.columns):
+                row_count += self.blocked[row * self.columns + column]
+                self.blocked_sums[row + 1][column + 1] = self.blocked_sums[row][column + 1] + row_count
+        self.fields.clear()  # Every field has to be rebuilt around the new obstacles
+
+    def cell_index(self, x: float, y: float) -> Optional[int]:
+        """
+        Get the index of the cell a position is in.
+        Args:
+            x (float): X position
+            y (float): Y position
+        Returns:
+            int: The cell index, or None outside the grid
+        """
+        column = int((x - self.left) // self.cell_size)
+        row = int((y - self.top) // self.cell_size)
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return row * self.columns + column
+        return None
+
+    def _clamped_cell_index(self, x: float, y: float) -> int:
+        """
+        Get the index of the grid cell nearest to a position, even outside the grid.
+        Args:
+            x (float): X position
+            y (float): Y position
+        Returns:
+            int: The cell index
+        """
+        column = min(max(int((x - self.left) // self.cell_size), 0), self.columns - 1)
+        row = min(max(int((y - self.top) // self.cell_size), 0), self.rows - 1)
+        return row * self.columns + column
+
+    @profiled("FlowField.update")
+    def update(self, characters: List[Character]) -> None:
+        """
+        Rebuild the field of every character that moved to another cell since the last update.
+        Args:
+            characters (list): The active characters
+        """
+        if not self.has_obstacles:
+            return  # Nothing to walk around, every enemy heads straight for its target
+        for character in list(self.fields):
+            if character not in characters:
+                del self.fields[character]
+        for character in characters:
+            goal = self._clamped_cell_index(character.position.x, character.position.y)
+            field = self.fields.get(character)
+            if field is None or field.goal != goal:
+                self.fields[character] = self._build(goal)
+
+    def _neighbours(self, cell: int):
+        """
+        Get the cells an enemy can step to from a cell, without cutting past blocked corners.
+        Args:
+            cell (int): Index of the cell
+        Returns:
+            iterator: Neighbour index, x and y step and the cost of the step
+        """
+        columns, rows, blocked = self.columns, self.rows, self.blocked
+        row, column = divmod(cell, columns)
+        for dx, dy, cost in NEIGHBOURS:
+            neighbour_column, neighbour_row = column + dx, row + dy
+            if not (0 <= neighbour_column < columns and 0 <= neighbour_row < rows):
+                continue
+            neighbour = neighbour_row * columns + neighbour_column
+            if blocked[neighbour]:
+                continue
+            if dx and dy and (blocked[row * columns + neighbour_column] or blocked[neighbour_row * columns + column]):
+                continue
+            yield neighbour, dx, dy, cost
+
+    def _line_of_sight(self, cell: int, other: int) -> bool:
+        """
+        Check if a straight walk from anywhere in a cell to the same spot in another crosses
+        no blocked cell, by following the lines between their matching corners.
+        Args:
+            cell (int): Index of one cell
+            other (int): Index of the other cell
+        Returns:
+            bool: True when nothing is in the way
+        """
+        row, column = divmod(cell, self.columns)
+        other_row, other_column = divmod(other, self.columns)
+        top, bottom = min(row, other_row), max(row, other_row) + 1
+        left, right = min(column, other_column), max(column, other_column) + 1
+        sums = self.blocked_sums
+        if not sums[bottom][right] - sums[top][right] - sums[bottom][left] + sums[top][left]:
+            return True  # Nothing blocked in the rectangle around both cells
+        delta_column, delta_row = other_column - column, other_row - row
+        # Four samples per cell crossed, enough to catch the corners of blocked cells
+        steps = 4 * max(abs(delta_column), abs(delta_row))
+        columns, blocked = self.columns, self.blocked
+        for corner_column, corner_row in CORNERS:
+            for step in range(1, steps):
+                t = step / steps
+                sample_row = int(row + corner_row + delta_row * t)
+                sample_column = int(column + corner_column + delta_column * t)
+                if blocked[sample_row * columns + sample_column]:
+                    return False
+        return True
+
+    def _build(self, goal: int) -> Field:
+        """
+        Build the field towards a cell, shortest distances first from the goal outwards.
+        Args:
+            goal (int): Index of the cell to reach
+        Returns:
+            Field: The new field
+        """
+        field = Field(goal, self.columns * self.rows)
+        distance = field.distance
+        distance[goal] = 0.0
+        next_cell: Dict[int, int] = {}  # The neighbour the shortest way from a cell goes through
+        order = []  # Cells by distance, closest first
+        queue = [(0.0, goal)]
+        while queue:
+            cell_distance, cell = heapq.heappop(queue)
+            if cell_distance > distance[cell]:
+                continue
+            order.append(cell)
+            for neighbour, _, _, cost in self._neighbours(cell):
+                new_distance = cell_distance + cost
+                if new_distance < distance[neighbour]:
+                    distance[neighbour] = new_distance
+                    next_cell[neighbour] = cell
+                    heapq.heappush(queue, (new_distance, neighbour))
+
+        # Every cell aims at the farthest cell along its shortest way it can still see, so
+        # enemies walk straight lines between the corners of obstacles instead of zigzagging
+        # from cell to cell. The cell its next cell aims at is the one to try first.
+        aim = {goal: goal}
+        field.straight[goal] = True
+        columns = self.columns
+        for cell in order[1:]:
+            following = next_cell[cell]
+            target = aim[following]
+            if target != following and not self._line_of_sight(cell, target):
+                target = following
+            aim[cell] = target
+            if target == goal:
+                field.straight[cell] = True
+                continue
+            row, column = divmod(cell, columns)
+            target_row, target_column = divmod(target, columns)
+            length = math.hypot(target_column - column, target_row - row)
+            field.direction_x[cell] = (target_column - column) / length
+            field.direction_y[cell] = (target_row - row) / length
+        return field
+
+    def direction(self, character: Character, x: float, y: float) -> Optional[Tuple[float, float]]:
+        """
+        Get the way to go from a position to reach a character.
+        Args:
+            character (Character): The character to reach
+            x (float): X position
+            y (float): Y position
+        Returns:
+            tuple: Unit x,y direction, or None when the field can't tell (outside the grid, in
+                sight of the character's cell or no field for the character), then head straight for it
+        """
+        field = self.fields.get(character)
+        cell = self._known_cell(field, x, y)
+        if cell is None:
+            return None
+        return field.direction_x[cell], field.direction_y[cell]
+
+    def steer(self, character: Character, x: float, y: float, direction: pygame.math.Vector2) -> bool:
+        """
+        Like direction, but writes the way to go into a vector instead of returning a new tuple.
+        Args:
+            character (Character): The character to reach
+            x (float): X position
+            y (float): Y position
+            direction (pygame.math.Vector2): Set to the unit x,y direction
+        Returns:
+            bool: True when the field knew the way, the vector is left alone otherwise
+        """
+        field = self.fields.get(character)
+        cell = self._known_cell(field, x, y)
+        if cell is None:
+            return False
+        direction.x = field.direction_x[cell]
+        direction.y = field.direction_y[cell]
+        return True
+
+    def _known_cell(self, field: Optional[Field], x: float, y: float) -> Optional[int]:
+        """
+        Get the cell of a position if a field has a way from it to its character.
+        Args:
+            field (Field): The field, None when there is none
+            x (float): X position
+            y (float): Y position
+        Returns:
+            int: The cell index, None outside the grid, in sight of the character's cell or
+                where the character can't be reached
+        """
+        if field is None:
+            return None
+        cell = self.cell_index(x, y)
+        if cell is None or field.straight[cell] or field.distance[cell] == math.inf:
+            return None
+        return cell
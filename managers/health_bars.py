@@ -0,0 +1,40 @@
+from typing import Dict
+import pygame
+from config import UI_SETTINGS, RENDER_SETTINGS
+
+
+class HealthBarCache:
+    """
+    Pre-rendered health bars, a red bar with the remaining health in green over it.
+    Health is rounded down to one of a fixed number of steps and every step is drawn once,
+    so drawing a bar is a single blit instead of two rect draws.
+    """
+
+    def __init__(self, steps: int = RENDER_SETTINGS["health_bar_steps"]):
+        """
+        Initialize the HealthBarCache.
+        Args:
+            steps (int): Number of health levels a bar can show, besides empty
+        """
+        self.width = UI_SETTINGS["health_bar_width"]
+        self.height = UI_SETTINGS["health_bar_height"]
+        self.steps = steps
+        self.bars: Dict[int, pygame.Surface] = {}
+
+    def get(self, health: float, max_health: float) -> pygame.Surface:
+        """
+        Get the bar for a health value.
+        Args:
+            health (float): Current health
+            max_health (float): Full health
+        Returns:
+            pygame.Surface: The bar, shared, don't draw on it
+        """
+        step = int(max(0.0, min(1.0, health / max_health)) * self.steps)
+        bar = self.bars.get(step)
+        if bar is None:
+            bar = pygame.Surface((self.width, self.height))
+            bar.fill((255, 0, 0))
+            bar.fill((0, 255, 0), (0, 0, int(self.width * step / self.steps), self.height))
+            self.bars[step] = bar
+        return bar
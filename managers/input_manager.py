@@ -0,0 +1,147 @@
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+import pygame
+from config import INPUT_BINDINGS, INPUT_SETTINGS
+from input_state import ACTIONS, MAX_PLAYERS, InputSnapshot, action_bit
+
+# Kinds of raw input a binding can name
+KEY = "key"  # ("key", name), a keyboard key by its pygame name, e.g. "a" or "right ctrl"
+MOUSE = "mouse"  # ("mouse", button), 0 left, 1 middle, 2 right
+JOY_BUTTON = "joy_button"  # ("joy_button", button)
+JOY_AXIS = "joy_axis"  # ("joy_axis", axis, direction), held past the dead zone, direction -1 or 1
+JOY_HAT = "joy_hat"  # ("joy_hat", hat, x, y), x or y -1 or 1 and the other 0
+INPUT_KINDS = (KEY, MOUSE, JOY_BUTTON, JOY_AXIS, JOY_HAT)
+
+
+class InputManager:
+    """
+    Turns the keyboard, mouse and joysticks into the actions of every player.
+    The devices are read once per tick by sample, and every binding of the action table
+    is checked against that one reading. The result is an InputSnapshot that characters,
+    replays and anything else read instead of polling pygame themselves.
+    Joystick bindings of a player read the player's own joystick, the first one connected
+    for player 1, the second for player 2 and so on.
+    """
+
+    def __init__(self, bindings: Optional[Dict[int, Dict[str, Sequence]]] = None):
+        """
+        Initialize the InputManager.
+        Args:
+            bindings (dict): Player number -> action -> inputs, defaults to INPUT_BINDINGS
+        """
+        self.dead_zone = INPUT_SETTINGS["joystick_dead_zone"]
+        self.bindings: Dict[int, Dict[str, List[Tuple]]] = {}
+        self._checks: List[Tuple] = []  # (bit, player index, kind, *arguments) for every binding
+        self.joysticks: List[pygame.joystick.JoystickType] = []  # In the order they were connected
+
+        for player_number, actions in (INPUT_BINDINGS if bindings is None else bindings).items():
+            for action, inputs in actions.items():
+                self.bind(player_number, action, inputs)
+
+    def bind(self, player_number: int, action: str, inputs: Sequence) -> None:
+        """
+        Rebind an action of a player, replacing the inputs it had.
+        Args:
+            player_number (int): The player, starting at 1
+            action (str): One of ACTIONS
+            inputs (list): The inputs that hold the action, like ("key", "w") or ("mouse", 0)
+        Raises:
+            ValueError: For an unknown player, action, input kind or key name
+        """
+        if not 1 <= player_number <= MAX_PLAYERS:
+            raise ValueError(f"No player {player_number}, there are {MAX_PLAYERS}")
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action {action}")
+        for binding in inputs:
+            if binding[0] not in INPUT_KINDS:
+                raise ValueError(f"Unknown input {binding} for {action}")
+            if binding[0] == KEY:
+                try:
+                    pygame.key.key_code(binding[1])
+                except ValueError:
+                    raise ValueError(f"Unknown key name {binding[1]!r} for {action}") from None
+        self.bindings.setdefault(player_number, {})[action] = [tuple(binding) for binding in inputs]
+        self._compile()
+
+    def _compile(self) -> None:
+        """Flatten the bindings into the list of checks sample runs through."""
+        self._checks = []
+        for player_number, actions in self.bindings.items():
+            for action, inputs in actions.items():
+                bit = action_bit(player_number, action)
+                for kind, *arguments in inputs:
+                    if kind == KEY:
+                        arguments = [pygame.key.key_code(arguments[0])]
+                    self._checks.append((bit, player_number - 1, kind, *arguments))
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """
+        Keep track of joysticks being connected and disconnected.
+        Args:
+            event (pygame.event.Event): Any event, others are ignored
+        """
+        if event.type == pygame.JOYDEVICEADDED:
+            joystick = pygame.joystick.Joystick(event.device_index)
+            self.joysticks.append(joystick)
+            logging.info(f"Joystick connected: {joystick.get_name()}")
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            for joystick in self.joysticks:
+                if joystick.get_instance_id() == event.instance_id:
+                    self.joysticks.remove(joystick)
+                    logging.info(f"Joystick disconnected: {joystick.get_name()}")
+                    break
+
+    def sample(self) -> InputSnapshot:
+        """
+        Read every device once and work out which actions are held this tick.
+        Returns:
+            InputSnapshot: The actions of every player
+        """
+        return self.map_input(pygame.key.get_pressed(), pygame.mouse.get_pressed(), self.joysticks)
+
+    def map_input(self, keys, mouse_buttons, joysticks: Sequence = ()) -> InputSnapshot:
+        """
+        Work out the held actions from a reading of the devices.
+        Args:
+            keys: Indexable by key code like pygame.key.get_pressed()
+            mouse_buttons (tuple): Like pygame.mouse.get_pressed()
+            joysticks (list): The joysticks of the players, player 1's first
+        Returns:
+            InputSnapshot: The actions of every player
+        """
+        mask = 0
+        for bit, player_index, kind, *arguments in self._checks:
+            if mask & bit:
+                continue  # Another input already holds the action
+            if kind == KEY:
+                held = keys[arguments[0]]
+            elif kind == MOUSE:
+                held = mouse_buttons[arguments[0]]
+            else:
+                if player_index >= len(joysticks):
+                    continue
+                held = self._joystick_held(joysticks[player_index], kind, arguments)
+            if held:
+                mask |= bit
+        return InputSnapshot(mask)
+
+    def _joystick_held(self, joystick, kind: str, arguments: List) -> bool:
+        """
+        Check a joystick binding.
+        Args:
+            joystick (pygame.joystick.JoystickType): The player's joystick
+            kind (str): JOY_BUTTON, JOY_AXIS or JOY_HAT
+            arguments (list): The rest of the binding
+        Returns:
+            bool: True when the binding is held, False also when the joystick doesn't have the control
+        """
+        if kind == JOY_BUTTON:
+            return arguments[0] < joystick.get_numbuttons() and joystick.get_button(arguments[0])
+        if kind == JOY_AXIS:
+            axis, direction = arguments
+            return axis < joystick.get_numaxes() and joystick.get_axis(axis) * direction > self.dead_zone
+        hat, x, y = arguments
+        if hat >= joystick.get_numhats():
+            return False
+        hat_x, hat_y = joystick.get_hat(hat)
+        return bool((x and hat_x == x) or (y and hat_y == y))
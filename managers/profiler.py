@@ -0,0 +1,296 @@
+import time
+import logging
+import functools
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+import pygame
+from config import PROFILER_SETTINGS
+
+
+class _Section:
+    """
+    Context manager that times one named section of a frame.
+    One instance is kept per name so timing a section doesn't allocate.
+    """
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullSection:
+    """Does nothing, handed out when the profiler is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+# Colors for the phases in the overlay graph
+PHASE_COLORS = {
+    "events": (200, 200, 200),
+    "update": (80, 200, 80),
+    "draw": (80, 140, 255),
+    "flip": (255, 170, 40),
+}
+
+
+class FrameProfiler:
+    """
+    Times each phase of the frame (events, update, draw, flip) and the managers inside them.
+    Times are accumulated per frame and kept in a ring buffer, so a phase that runs several
+    times in one frame (like the fixed step update) is reported as its total for the frame.
+    Counters, e.g. how many enemies ran each AI tier, are kept per frame the same way.
+    """
+
+    def __init__(self, enabled: bool = PROFILER_SETTINGS["enabled"]):
+        """
+        Initialize the profiler.
+        Args:
+            enabled (bool): Whether to record anything. When disabled every call returns right away.
+        """
+        self.enabled = enabled
+        self.profiling = enabled  # Asked for at startup, the overlay only turns recording on while shown
+        self.history = PROFILER_SETTINGS["history"]
+        self.report_path = PROFILER_SETTINGS["report_path"]
+        self.show_overlay = False
+
+        self.samples: Dict[str, Deque[float]] = {}  # Section name -> ms per frame
+        self.frame_times: Deque[float] = deque(maxlen=self.history)
+        self.counters: Dict[str, Deque[int]] = {}  # Counter name -> total per frame
+        self._current_frame: Dict[str, float] = {}
+        self._current_counts: Dict[str, int] = {}
+        self._sections: Dict[str, _Section] = {}
+        self._frame_start: Optional[float] = None  # None while no frame is being timed
+        self._font: Optional[pygame.font.Font] = None
+
+    def section(self, name: str):
+        """
+        Get a context manager that times a section of the current frame.
+        Args:
+            name (str): Name of the section, e.g. "update" or "EnemyManager.update"
+        Returns:
+            A context manager, a shared no-op one when the profiler is disabled
+        """
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """
+        Add time to a section of the current frame.
+        Args:
+            name (str): Name of the section
+            seconds (float): Time spent in the section
+        """
+        self._current_frame[name] = self._current_frame.get(name, 0.0) + seconds * 1000
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        Add to a counter of the current frame.
+        Args:
+            name (str): Name of the counter, e.g. "AI.full"
+            amount (int): How much to add
+        """
+        if self.enabled:
+            self._current_counts[name] = self._current_counts.get(name, 0) + amount
+
+    def gauge(self, name: str, value: int) -> None:
+        """
+        Set a counter of the current frame to a value, e.g. a queue length.
+        Args:
+            name (str): Name of the counter
+            value (int): Its value, the last one set in a frame is kept
+        """
+        if self.enabled:
+            self._current_counts[name] = value
+
+    def begin_frame(self) -> None:
+        """
+        Start timing a new frame.
+        Recording is only switched on or off here, so a frame is always timed from its start.
+        """
+        self.enabled = self.profiling or self.show_overlay
+        if not self.enabled:
+            self._frame_start = None
+            return
+        self._current_frame.clear()
+        self._current_counts.clear()
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """Finish the current frame and push its times into the ring buffer."""
+        if not self.enabled or self._frame_start is None:
+            return  # The frame wasn't timed from its start
+        self.frame_times.append((time.perf_counter() - self._frame_start) * 1000)
+        self._frame_start = None
+        for name, ms in self._current_frame.items():
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.history)
+            self.samples[name].append(ms)
+        for name, amount in self._current_counts.items():
+            if name not in self.counters:
+                self.counters[name] = deque(maxlen=self.history)
+            self.counters[name].append(amount)
+        for name, values in self.counters.items():
+            if name not in self._current_counts:
+                values.append(0)  # Nothing counted this frame
+
+    def toggle_overlay(self) -> None:
+        """
+        Show or hide the on-screen overlay. Showing it records frames from the next frame on,
+        hiding it goes back to recording only if profiling was asked for at startup.
+        """
+        self.show_overlay = not self.show_overlay
+
+    def percentiles(self, values) -> Tuple[float, float, float]:
+        """
+        Get the p50, p95 and p99 of a list of times.
+        Args:
+            values (iterable): Times in ms
+        Returns:
+            tuple: p50, p95 and p99 in ms
+        """
+        ordered = sorted(values)
+        if not ordered:
+            return 0.0, 0.0, 0.0
+
+        def nearest_rank(percent):
+            index = min(len(ordered) - 1, max(0, int(round(percent / 100 * len(ordered))) - 1))
+            return ordered[index]
+
+        return nearest_rank(50), nearest_rank(95), nearest_rank(99)
+
+    def build_report(self) -> List[str]:
+        """
+        Build the report lines with the percentiles of every section.
+        Returns:
+            list: Lines of the report
+        """
+        lines = [
+            f"SpaceFight frame profile ({len(self.frame_times)} frames, times in ms)",
+            f"{'section':<36}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}",
+        ]
+        rows = [("frame", self.frame_times)] + sorted(self.samples.items())
+        for name, values in rows:
+            p50, p95, p99 = self.percentiles(values)
+            worst = max(values) if values else 0.0
+            lines.append(f"{name:<36}{p50:>9.3f}{p95:>9.3f}{p99:>9.3f}{worst:>9.3f}")
+
+        if self.counters:
+            lines += ["", f"{'counter (per frame)':<36}{'mean':>9}{'max':>9}"]
+            for name, values in sorted(self.counters.items()):
+                lines.append(f"{name:<36}{sum(values) / len(values):>9.1f}{max(values):>9}")
+        return lines
+
+    def write_report(self, path: Optional[str] = None) -> None:
+        """
+        Write the percentile report to a file.
+        Args:
+            path (str): Where to write it, defaults to PROFILER_SETTINGS["report_path"]
+        """
+        if not self.profiling or not self.frame_times:
+            return  # Frames recorded only for the overlay don't make a report
+        path = path or self.report_path
+        try:
+            with open(path, "w") as f:
+                f.write("\n".join(self.build_report()) + "\n")
+            logging.info(f"Profiler report written to {path}")
+        except OSError as e:
+            logging.error(f"Failed to write profiler report to {path}: {e}")
+
+    def draw_overlay(self, screen: pygame.Surface) -> None:
+        """
+        Draw a stacked graph of the recent frames and the percentiles of each phase.
+        Args:
+            screen (pygame.Surface): The screen surface
+        """
+        if not self.show_overlay:
+            return
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        frames = PROFILER_SETTINGS["overlay_frames"]
+        budget = PROFILER_SETTINGS["frame_budget_ms"]
+        graph_height = 100
+        scale = graph_height / (budget * 2)  # The top of the graph is twice the budget
+        left = screen.get_width() - frames - 10
+        bottom = 10 + graph_height
+
+        background = pygame.Surface((frames, graph_height))
+        background.fill((0, 0, 0))
+        background.set_alpha(160)
+        screen.blit(background, (left, 10))
+
+        # One column per frame with the phases stacked on top of each other
+        phases = [(self.samples.get(name), color) for name, color in PHASE_COLORS.items()]
+        count = min(frames, len(self.frame_times))
+        for column in range(count):
+            x = left + frames - count + column
+            y = bottom
+            for values, color in phases:
+                if not values or column - count + len(values) < 0:
+                    continue
+                height = values[column - count + len(values)] * scale
+                top = max(10, y - height)
+                pygame.draw.line(screen, color, (x, y), (x, top))
+                y = top
+
+        budget_y = bottom - budget * scale
+        pygame.draw.line(screen, (255, 0, 0), (left, budget_y), (left + frames, budget_y))
+
+        y = bottom + 5
+        for name in ["frame"] + list(PHASE_COLORS):
+            values = self.frame_times if name == "frame" else self.samples.get(name, ())
+            p50, p95, p99 = self.percentiles(values)
+            color = PHASE_COLORS.get(name, (255, 255, 255))
+            text = self._font.render(f"{name} p50 {p50:.1f} p95 {p95:.1f} p99 {p99:.1f}", True, color)
+            screen.blit(text, (left, y))
+            y += text.get_height()
+
+        for name, values in sorted(self.counters.items()):
+            text = self._font.render(f"{name} {values[-1]}", True, (255, 255, 255))
+            screen.blit(text, (left, y))
+            y += text.get_height()
+
+
+def profiled(name: str):
+    """
+    Decorator that times a manager method as a section of the frame.
+    The decorated object must have a game attribute with a profiler.
+    Args:
+        name (str): Name of the section
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.game.profiler
+            if not profiler.enabled:
+                return method(self, *args, **kwargs)
+            with profiler.section(name):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
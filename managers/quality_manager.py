@@ -0,0 +1,114 @@
+import logging
+from collections import deque
+from typing import Deque
+from config import QUALITY_SETTINGS
+
+# Features that can be switched off to save frame time, in the order they are given up.
+# The cheapest to lose comes first, the spawn rate changes the game so it goes last.
+SCREEN_SHAKE = "screen_shake"  # ScreenEffectsManager.apply_shake
+ATTACK_OVERLAYS = "attack_overlays"  # Attack range boxes of the enemies
+DISTANT_HEALTH_BARS = "distant_health_bars"  # Health bars of enemies far from their target
+STARS = "stars"  # Stars in the windows of the spaceship interior
+SPAWN_RATE = "spawn_rate"  # Full speed wave spawning
+FEATURES = (SCREEN_SHAKE, ATTACK_OVERLAYS, DISTANT_HEALTH_BARS, STARS, SPAWN_RATE)
+
+
+class QualityManager:
+    """
+    Lowers the quality when frames take too long and raises it again when there is room.
+    Frame times are collected in a window, when the window's average is over the frame budget
+    the next feature in FEATURES is switched off. A feature only comes back after several
+    windows in a row well under the budget, so the quality doesn't flip back and forth
+    around the budget. Every level change is logged.
+    """
+
+    def __init__(self, game):
+        """
+        Initialize the QualityManager.
+        Args:
+            game (Game): The game instance
+        """
+        self.game = game
+        self.enabled = QUALITY_SETTINGS["enabled"]
+        self.frame_budget_ms = QUALITY_SETTINGS["frame_budget_ms"]
+        self.raise_below_ms = self.frame_budget_ms * QUALITY_SETTINGS["raise_below"]
+        self.raise_after_windows = QUALITY_SETTINGS["raise_after_windows"]
+        self.spawn_rate_multiplier = QUALITY_SETTINGS["spawn_rate_multiplier"]
+        self.health_bar_distance_squared = QUALITY_SETTINGS["health_bar_distance"] ** 2
+
+        self.level = 0  # Number of features switched off, from the start of FEATURES
+        self.frame_times: Deque[float] = deque(maxlen=QUALITY_SETTINGS["window_frames"])
+        self.windows_with_headroom = 0
+
+    def allows(self, feature: str) -> bool:
+        """
+        Check if a feature is on at the current quality level.
+        Args:
+            feature (str): One of FEATURES
+        Returns:
+            bool: True when the feature should run
+        """
+        return FEATURES.index(feature) >= self.level
+
+    @property
+    def spawn_rate(self) -> float:
+        """
+        Get how fast waves spawn at the current quality level.
+        Replays always spawn at full speed, their spawns can't depend on how fast the machine is.
+        Returns:
+            float: 1.0 for full speed, less when spawning is slowed down
+        """
+        if self.game.replay.mode != "off" or self.allows(SPAWN_RATE):
+            return 1.0
+        return self.spawn_rate_multiplier
+
+    def add_frame(self, milliseconds: float) -> None:
+        """
+        Add the time of a frame and change the quality level once the window is full.
+        Args:
+            milliseconds (float): Time spent on the frame, without waiting for the frame cap
+        """
+        if not self.enabled:
+            return
+        self.frame_times.append(milliseconds)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return
+
+        average = sum(self.frame_times) / len(self.frame_times)
+        self.frame_times.clear()
+        if average > self.frame_budget_ms:
+            self.windows_with_headroom = 0
+            if self.level < len(FEATURES):
+                self._set_level(self.level + 1, average)
+        elif average < self.raise_below_ms:
+            self.windows_with_headroom += 1
+            if self.windows_with_headroom >= self.raise_after_windows and self.level > 0:
+                self.windows_with_headroom = 0
+                self._set_level(self.level - 1, average)
+        else:
+            self.windows_with_headroom = 0
+
+    def _set_level(self, level: int, average: float) -> None:
+        """
+        Change the quality level and log which feature went off or came back.
+        Args:
+            level (int): The new level
+            average (float): Average frame time of the window that caused the change, in ms
+        """
+        if level > self.level:
+            change = f"{FEATURES[level - 1]} off"
+        else:
+            change = f"{FEATURES[level]} back on"
+        logging.info(
+            f"Quality level {self.level} -> {level}, {change} "
+            f"(frames took {average:.1f} ms, budget {self.frame_budget_ms:.1f} ms)"
+        )
+        self.level = level
+
+    def reset(self) -> None:
+        """Go back to full quality and forget the frame times."""
+        if self.level:
+            logging.info(f"Quality level {self.level} -> 0, everything back on")
+        self.level = 0
+        self.frame_times.clear()
+        self.windows_with_headroom = 0
@@ -0,0 +1,176 @@
+from bisect import insort
+from operator import attrgetter
+from typing import Dict, Hashable, Iterable, List, Tuple
+import pygame
+from render_layers import LAYERS, Y_SORTED_LAYERS
+from .profiler import profiled
+
+_depth_of = attrgetter("depth")
+
+
+class RenderItem:
+    """One drawable of a y-sorted layer, kept from frame to frame."""
+
+    __slots__ = ("key", "depth", "image", "dest", "frame")
+
+    def __init__(self, key: Hashable, depth: float, image: pygame.Surface, dest, frame: int):
+        self.key = key
+        self.depth = depth
+        self.image = image
+        self.dest = dest
+        self.frame = frame  # Last frame it was added on
+
+    def __lt__(self, other: "RenderItem") -> bool:
+        # Lets insort place items by depth without its key argument, which needs Python 3.10
+        return self.depth < other.depth
+
+
+class RenderQueue:
+    """
+    Collects everything a level draws in a frame and draws it layer by layer, each layer
+    with a single blits call.
+
+    Y-sorted layers remember their order from the last frame. Things only move a little
+    between frames, so that order is nearly right already: drawables that weren't added
+    again are dropped, the rest are sorted again, which takes about linear time on an
+    almost sorted list, and new drawables are inserted at their place with a binary search.
+    Drawables with the same depth keep their order, so overlapping sprites don't flicker.
+    """
+
+    def __init__(self, game):
+        """
+        Initialize the RenderQueue.
+        Args:
+            game (Game): The game instance
+        """
+        self.game = game
+        self.screen = game.screen
+        self.frame = 0
+        self.sorted_items: Dict[int, List[RenderItem]] = {layer: [] for layer in Y_SORTED_LAYERS}
+        self.items_by_key: Dict[int, Dict[Hashable, RenderItem]] = {layer: {} for layer in Y_SORTED_LAYERS}
+        self.added: Dict[int, List[RenderItem]] = {layer: [] for layer in Y_SORTED_LAYERS}  # New this frame
+        self.kept = dict.fromkeys(Y_SORTED_LAYERS, 0)  # Items from last frame added again
+        self.blit_lists: Dict[int, List[Tuple]] = {
+            layer: [] for layer in LAYERS if layer not in Y_SORTED_LAYERS
+        }
+
+    def add(self, layer: int, image: pygame.Surface, dest) -> None:
+        """
+        Add something to draw on a layer that isn't sorted, it's drawn in the order it was added.
+        Args:
+            layer (int): EFFECTS or HEALTH_BARS
+            image (pygame.Surface): The surface to draw
+            dest: Its top left position or rect
+        """
+        self.blit_lists[layer].append((image, dest))
+
+    def extend(self, layer: int, blit_items: Iterable[Tuple[pygame.Surface, object]]) -> None:
+        """
+        Add many things to draw on a layer that isn't sorted.
+        Args:
+            layer (int): EFFECTS or HEALTH_BARS
+            blit_items (iterable): (image, dest) of each, see add
+        """
+        self.blit_lists[layer].extend(blit_items)
+
+    def add_sorted(self, layer: int, key: Hashable, depth: float, image: pygame.Surface, dest) -> None:
+        """
+        Add something to draw on a y-sorted layer.
+        Args:
+            layer (int): ACTORS
+            key (Hashable): Identifies the drawable from frame to frame, e.g. the sprite itself
+            depth (float): Drawn over everything with a smaller depth, usually the bottom y
+            image (pygame.Surface): The surface to draw
+            dest: Its top left position or rect
+        """
+        item = self.items_by_key[layer].get(key)
+        if item is None:
+            item = self.items_by_key[layer][key] = RenderItem(key, depth, image, dest, self.frame)
+            self.added[layer].append(item)
+            return
+        if item.frame != self.frame:
+            self.kept[layer] += 1
+        item.depth = depth
+        item.image = image
+        item.dest = dest
+        item.frame = self.frame
+
+    def extend_sorted(self, layer: int, drawables: Iterable[Tuple[Hashable, float, pygame.Surface, object]]) -> None:
+        """
+        Add many things to draw on a y-sorted layer at once.
+        Args:
+            layer (int): ACTORS
+            drawables (iterable): (key, depth, image, dest) of each, see add_sorted
+        """
+        items_by_key = self.items_by_key[layer]
+        added = self.added[layer]
+        frame = self.frame
+        kept = 0
+        for key, depth, image, dest in drawables:
+            item = items_by_key.get(key)
+            if item is None:
+                item = items_by_key[key] = RenderItem(key, depth, image, dest, frame)
+                added.append(item)
+                continue
+            if item.frame != frame:
+                kept += 1
+            item.depth = depth
+            item.image = image
+            item.dest = dest
+            item.frame = frame
+        self.kept[layer] += kept
+
+    def _order(self, layer: int) -> List[RenderItem]:
+        """
+        Bring a y-sorted layer in drawing order for this frame.
+        Args:
+            layer (int): The layer
+        Returns:
+            list: Its items, back to front
+        """
+        items = self.sorted_items[layer]
+        items_by_key = self.items_by_key[layer]
+        frame = self.frame
+        if self.kept[layer] != len(items):
+            for item in items:
+                if item.frame != frame:
+                    del items_by_key[item.key]
+            items[:] = [item for item in items if item.frame == frame]
+        items.sort(key=_depth_of)
+
+        added = self.added[layer]
+        for item in added:
+            insort(items, item)
+        self.game.profiler.count("RenderQueue.inserted", len(added))
+        added.clear()
+        self.kept[layer] = 0
+        return items
+
+    @profiled("RenderQueue.flush")
+    def flush(self) -> List[pygame.Rect]:
+        """
+        Draw every layer, one blits call each, and start the next frame.
+        Returns:
+            list: The screen areas that were drawn to
+        """
+        drawn_rects = []
+        for layer in LAYERS:
+            if layer in self.sorted_items:
+                blit_list = [(item.image, item.dest) for item in self._order(layer)]
+            else:
+                blit_list = self.blit_lists[layer]
+            drawn_rects += self.screen.blits(blit_list)
+            if layer in self.blit_lists:
+                blit_list.clear()
+        self.frame += 1
+        return drawn_rects
+
+    def clear(self) -> None:
+        """Forget everything added so far, e.g. when the level restarts."""
+        for layer in Y_SORTED_LAYERS:
+            self.sorted_items[layer].clear()
+            self.items_by_key[layer].clear()
+            self.added[layer].clear()
+            self.kept[layer] = 0
+        for blit_list in self.blit_lists.values():
+            blit_list.clear()
@@ -0,0 +1,238 @@
+import gzip
+import json
+import logging
+import random
+from typing import List, Optional
+import pygame
+from config import SIMULATION_HZ
+from input_state import ACTIONS, ATTACK, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT, MOVE_UP, NO_INPUT, InputSnapshot
+from .input_manager import InputManager
+
+REPLAY_VERSION = 2
+
+# Version 1 replays stored raw keys and mouse buttons instead of actions. They are converted
+# on load with the controls the game had back then.
+LEGACY_REPLAY_VERSION = 1
+LEGACY_REPLAY_KEYS = [
+    pygame.K_w,
+    pygame.K_a,
+    pygame.K_s,
+    pygame.K_d,
+    pygame.K_UP,
+    pygame.K_LEFT,
+    pygame.K_DOWN,
+    pygame.K_RIGHT,
+    pygame.K_RCTRL,
+    pygame.K_RSHIFT,
+]
+LEGACY_REPLAY_MOUSE_BUTTONS = [0, 2]  # Left and right button
+LEGACY_BINDINGS = {
+    1: {
+        MOVE_UP: [("key", "w")],
+        MOVE_DOWN: [("key", "s")],
+        MOVE_LEFT: [("key", "a")],
+        MOVE_RIGHT: [("key", "d")],
+        ATTACK: [("mouse", 0), ("mouse", 2)],
+    },
+    2: {
+        MOVE_UP: [("key", "up")],
+        MOVE_DOWN: [("key", "down")],
+        MOVE_LEFT: [("key", "left")],
+        MOVE_RIGHT: [("key", "right")],
+        ATTACK: [("key", "right ctrl"), ("key", "right shift")],
+    },
+}
+
+
+class LegacyKeys:
+    """
+    Indexable like pygame.key.get_pressed(), for the keys of a version 1 replay mask.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask: int):
+        self.mask = mask
+
+    def __getitem__(self, key: int) -> bool:
+        return key in LEGACY_REPLAY_KEYS and bool(self.mask & (1 << LEGACY_REPLAY_KEYS.index(key)))
+
+
+def convert_legacy_runs(runs: List[List[int]]) -> List[List[int]]:
+    """
+    Turn the key and mouse masks of a version 1 replay into action masks.
+    Args:
+        runs (list): [mask, ticks] pairs with one bit per key in LEGACY_REPLAY_KEYS
+            followed by one per button in LEGACY_REPLAY_MOUSE_BUTTONS
+    Returns:
+        list: [mask, ticks] pairs of InputSnapshot masks
+    """
+    input_manager = InputManager(LEGACY_BINDINGS)
+    mouse_offset = len(LEGACY_REPLAY_KEYS)
+    converted = []
+    for mask, ticks in runs:
+        mouse_buttons = [False, False, False]
+        for bit, button in enumerate(LEGACY_REPLAY_MOUSE_BUTTONS):
+            mouse_buttons[button] = bool(mask & (1 << (mouse_offset + bit)))
+        converted.append([input_manager.map_input(LegacyKeys(mask), mouse_buttons).mask, ticks])
+    return converted
+
+
+class ReplayManager:
+    """
+    Records the actions of every level tick and plays them back deterministically.
+    It also owns the seeding of the game's random generators, so the same seed and the same
+    inputs always produce the same fight.
+
+    The replay file is gzipped JSON holding the seed, the selected characters and the action
+    masks of InputSnapshot as run-length encoded [mask, ticks] pairs, a few KB for minutes
+    of play. Actions are stored instead of keys, so rebinding the controls doesn't break replays.
+    """
+
+    def __init__(self, game: "Game"):
+        """
+        Initialize the ReplayManager.
+        Args:
+            game (Game): The game instance
+        """
+        self.game = game
+        self.mode = "off"  # "off", "record" or "play"
+        self.path: Optional[str] = None
+        self.seed: Optional[int] = None
+        self.characters: List[str] = []
+        self.runs: List[List[int]] = []  # [mask, ticks] pairs
+        self.total_ticks = 0
+
+        # Playback position
+        self._run_index = 0
+        self._run_tick = 0
+
+    def start_recording(self, path: str) -> None:
+        """
+        Record every level tick from now on and save them to path on exit.
+        Args:
+            path (str): The replay file to write
+        """
+        self.mode = "record"
+        self.path = path
+        self.runs = []
+        self.total_ticks = 0
+
+    def load(self, path: str) -> None:
+        """
+        Load a replay file and play it back from the next level start.
+        Args:
+            path (str): The replay file to read
+        """
+        with gzip.open(path, "rt") as f:
+            data = json.load(f)
+
+        version = data.get("version")
+        if version not in (REPLAY_VERSION, LEGACY_REPLAY_VERSION):
+            raise ValueError(f"Unsupported replay version {version} in {path}")
+        if data["simulation_hz"] != SIMULATION_HZ:
+            raise ValueError(
+                f"Replay {path} was recorded at {data['simulation_hz']} Hz, "
+                f"the game simulates at {SIMULATION_HZ} Hz"
+            )
+        if version == LEGACY_REPLAY_VERSION:
+            if data["keys"] != LEGACY_REPLAY_KEYS:
+                raise ValueError(f"Replay {path} was recorded with different key bindings")
+            data["inputs"] = convert_legacy_runs(data["inputs"])
+        elif data["actions"] != list(ACTIONS):
+            raise ValueError(f"Replay {path} was recorded with different actions")
+
+        self.mode = "play"
+        self.path = path
+        self.seed = data["seed"]
+        self.characters = data["characters"]
+        self.runs = data["inputs"]
+        self.total_ticks = sum(ticks for _, ticks in self.runs)
+        self._run_index = 0
+        self._run_tick = 0
+        logging.info(f"Loaded replay {path}: {self.total_ticks} ticks, characters {self.characters}")
+
+    def begin_level(self, character_names: List[str]) -> None:
+        """
+        Seed the random generators for a new level.
+        Playback reuses the recorded seed, otherwise a new one is picked and remembered.
+        A recording only keeps the last level played.
+        Args:
+            character_names (list): Names of the selected characters, player 1 first
+        """
+        if self.mode != "play":
+            self.seed = random.SystemRandom().randrange(2**32)
+            self.characters = list(character_names)
+            if self.mode == "record":
+                self.runs = []
+                self.total_ticks = 0
+        self.game.seed_random(self.seed)
+
+    def sample_input(self, in_level: bool) -> InputSnapshot:
+        """
+        Get the actions for this tick, recording or replaying them.
+        Args:
+            in_level (bool): Whether the level is running this tick, only level ticks are recorded
+        Returns:
+            InputSnapshot: The actions of every player
+        """
+        if self.mode == "play":
+            if not in_level:
+                return NO_INPUT
+            return InputSnapshot(self._next_mask())
+
+        snapshot = self.game.input_manager.sample()
+        if self.mode == "record" and in_level:
+            self._record_mask(snapshot.mask)
+        return snapshot
+
+    @property
+    def finished(self) -> bool:
+        """bool: True once playback has used every recorded tick"""
+        return self.mode == "play" and self._run_index >= len(self.runs)
+
+    def _record_mask(self, mask: int) -> None:
+        """
+        Add one tick of input, extending the last run if the input didn't change.
+        Args:
+            mask (int): The packed input for the tick
+        """
+        if self.runs and self.runs[-1][0] == mask:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+        self.total_ticks += 1
+
+    def _next_mask(self) -> int:
+        """
+        Get the next recorded tick of input.
+        Returns:
+            int: The packed input, 0 once the replay is over
+        """
+        if self.finished:
+            return 0
+        mask, ticks = self.runs[self._run_index]
+        self._run_tick += 1
+        if self._run_tick >= ticks:
+            self._run_index += 1
+            self._run_tick = 0
+        return mask
+
+    def save(self) -> None:
+        """Write the recording to its replay file."""
+        if self.mode != "record" or not self.runs:
+            return
+        data = {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "simulation_hz": SIMULATION_HZ,
+            "characters": self.characters,
+            "actions": list(ACTIONS),
+            "inputs": self.runs,
+        }
+        try:
+            with gzip.open(self.path, "wt") as f:
+                json.dump(data, f, separators=(",", ":"))
+            logging.info(f"Replay saved to {self.path}: {self.total_ticks} ticks in {len(self.runs)} runs")
+        except OSError as e:
+            logging.error(f"Failed to save replay to {self.path}: {e}")
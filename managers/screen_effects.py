@@ -1,20 +1,27 @@
 import random
 import pygame
+from .quality_manager import SCREEN_SHAKE
 
 class ScreenEffectsManager:
     """
     Manages visual effects like screen shaking.
     """
 
-    def __init__(self, screen, screen_width, screen_height):
+    def __init__(self, screen, screen_width, screen_height, rng=random, get_ticks=pygame.time.get_ticks, quality=None):
         """
         Initialize the ScreenEffectsManager.
         Args:
             screen (pygame.Surface): The screen surface.
             screen_width (int): The width of the screen.
             screen_height (int): The height of the screen.
+            rng (random.Random): Random generator for the shake offsets.
+            get_ticks (callable): Returns the current time in milliseconds.
+            quality (QualityManager): Turns the shake off when frames take too long, None keeps it on.
         """
         self.screen = screen
+        self.rng = rng
+        self.get_ticks = get_ticks
+        self.quality = quality
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.shake_duration = 0
@@ -31,7 +38,7 @@ class ScreenEffectsManager:
         """
         self.shake_duration = duration
         self.shake_intensity = intensity
-        self.shake_start_time = pygame.time.get_ticks()
+        self.shake_start_time = self.get_ticks()
         self.shaking = True
 
     def update(self):
@@ -39,15 +46,18 @@ class ScreenEffectsManager:
         Update the screen shake effect.
         """
         if self.shaking:
-            current_time = pygame.time.get_ticks()
+            current_time = self.get_ticks()
             if current_time - self.shake_start_time > self.shake_duration:
                 self.shaking = False
 
     def apply_shake(self):
         """
         Apply the screen shake effect to the screen.
+        Skipped while the quality manager has switched screen shake off.
         """
+        if self.quality is not None and not self.quality.allows(SCREEN_SHAKE):
+            return
         if self.shaking:
-            dx = random.randint(-self.shake_intensity, self.shake_intensity)
-            dy = random.randint(-self.shake_intensity, self.shake_intensity)
+            dx = self.rng.randint(-self.shake_intensity, self.shake_intensity)
+            dy = self.rng.randint(-self.shake_intensity, self.shake_intensity)
             self.screen.blit(self.screen, (dx, dy))
@@ -1,38 +1,84 @@
 # sound_manager.py
+import logging
+import io
 import pygame
 from pathlib import Path
-from typing import Dict, Optional
-from config import SOUND_SETTINGS, SOUND_REGISTRY
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+from config import SOUND_SETTINGS, SOUND_REGISTRY, MUSIC_SETTINGS
 
 class SoundManager:
     """
     Centralized sound management system for the entire game.
     Handles preloading, caching, and playing of all game sounds.
+    Sound effects are decoded up front, music is only ever streamed through pygame.mixer.music.
     """
-    def __init__(self):
-        """Initialize the sound manager with default settings and preload all game sounds."""
+    def __init__(self, enabled: bool = True, loader: Optional["AssetManager"] = None):
+        """
+        Initialize the sound manager with default settings and preload all game sounds.
+
+        Args:
+            enabled: False keeps the manager silent and skips loading any files, used when
+                running headless without an audio device
+            loader: Decode the sound effects on this AssetManager's loader threads instead
+                of blocking here
+        """
+        self.loader = loader
+        self.loading_futures: List[Future] = []  # One per sound effect still decoding
+        self.enabled = enabled
         self.music_volume = SOUND_SETTINGS['default_music_volume']
         self.sound_volume = SOUND_SETTINGS['default_sound_volume']
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.current_music: Optional[str] = None
+
+        # Music streaming
+        self.crossfade_ms = MUSIC_SETTINGS['crossfade_ms']
+        self.music_futures: Dict[str, Future] = {}  # Music files being read ahead, still compressed
+        self.pending_music: Optional[Tuple[str, int]] = None  # Track waiting for the fade out to finish
+        self.fade_timer = 0.0
+        self._music_stream: Optional[io.BytesIO] = None  # Kept alive while the mixer streams from it
         
         # Define sound categories and their associated files
         self.sound_registry = SOUND_REGISTRY
         
         # Preload all sounds on initialization
-        self._preload_sounds()
+        if self.enabled:
+            self._preload_sounds()
     
     def _preload_sounds(self):
-        """Preload all sound effects into memory."""
+        """Preload all sound effects into memory. Music is streamed instead, see play_music."""
         sound_path = Path('assets/sound')
-        for category in self.sound_registry.values():
-            for sound_id, filename in category.items():
-                try:
-                    full_path = sound_path / filename
-                    self.sounds[sound_id] = pygame.mixer.Sound(str(full_path))
-                    self.sounds[sound_id].set_volume(self.sound_volume)
-                except Exception as e:
-                    print(f"Failed to load sound {sound_id} from {full_path}: {e}")
+        for sound_id, filename in self.sound_registry['effects'].items():
+            full_path = sound_path / filename
+            if self.loader:
+                future = self.loader.submit(pygame.mixer.Sound, str(full_path))
+                future.add_done_callback(
+                    lambda done, sound_id=sound_id, full_path=full_path: self._sound_loaded(sound_id, full_path, done)
+                )
+                self.loading_futures.append(future)
+                continue
+            try:
+                self.sounds[sound_id] = pygame.mixer.Sound(str(full_path))
+                self.sounds[sound_id].set_volume(self.sound_volume)
+            except Exception as e:
+                logging.error(f"Failed to load sound {sound_id} from {full_path}: {e}")
+
+    def _sound_loaded(self, sound_id: str, full_path: Path, future: Future):
+        """
+        Store a sound effect decoded on a loader thread.
+
+        Args:
+            sound_id: The identifier of the sound
+            full_path: The file it was decoded from
+            future: The finished decode
+        """
+        try:
+            sound = future.result()
+        except Exception as e:
+            logging.error(f"Failed to load sound {sound_id} from {full_path}: {e}")
+            return
+        sound.set_volume(self.sound_volume)
+        self.sounds[sound_id] = sound
 
     def play_sound(self, sound_id: str) -> bool:
         """
@@ -44,48 +90,146 @@ class SoundManager:
         Returns:
             bool: True if sound played successfully, False otherwise
         """
+        if not self.enabled:
+            return False
         if sound_id in self.sounds:
             try:
                 self.sounds[sound_id].play()
                 return True
             except Exception as e:
-                print(f"Failed to play sound {sound_id}: {e}")
+                logging.error(f"Failed to play sound {sound_id}: {e}")
                 return False
-        print(f"Sound {sound_id} not found in registry")
+        if all(future.done() for future in self.loading_futures):  # Not just still decoding
+            logging.warning(f"Sound {sound_id} not found in registry")
         return False
 
     def play_music(self, music_id: str, loops: int = -1):
         """
         Play background music by its ID.
+        If another track is still playing it is faded out first and the new one fades in
+        once it has stopped, see update.
         
         Args:
             music_id: The identifier of the music track to play
             loops: Number of times to loop (-1 for infinite)
         """
+        if not self.enabled:
+            return
         if music_id == self.current_music:
             return  # Already playing this track
-            
+        if music_id not in self.sound_registry['music']:
+            logging.warning(f"Music {music_id} not found in registry")
+            return
+
+        self.current_music = music_id
+        if pygame.mixer.music.get_busy():
+            if self.pending_music is None:
+                pygame.mixer.music.fadeout(self.crossfade_ms)
+                self.fade_timer = self.crossfade_ms / 1000
+            self.pending_music = (music_id, loops)
+        else:
+            self._start_music(music_id, loops)
+
+    def _start_music(self, music_id: str, loops: int):
+        """
+        Start streaming a music track, from its prefetched file if there is one.
+
+        Args:
+            music_id: The identifier of the music track to play
+            loops: Number of times to loop (-1 for infinite)
+        """
+        self.pending_music = None
         try:
-            music_file = self.sound_registry['music'].get(music_id)
-            if music_file:
-                full_path = Path('assets/sound') / music_file
-                pygame.mixer.music.load(str(full_path))
-                pygame.mixer.music.set_volume(self.music_volume)
-                pygame.mixer.music.play(loops)
-                self.current_music = music_id
+            music_file = self.sound_registry['music'][music_id]
+            data = self._take_prefetched(music_id)
+            if data is not None:
+                self._music_stream = io.BytesIO(data)
+                pygame.mixer.music.load(self._music_stream, music_file)
+            else:
+                pygame.mixer.music.load(str(Path('assets/sound') / music_file))
+            pygame.mixer.music.set_volume(self.music_volume)
+            pygame.mixer.music.play(loops, fade_ms=self.crossfade_ms)
         except Exception as e:
-            print(f"Failed to play music {music_id}: {e}")
-        # I added a try-except here because as I was building the sound mananger I was having a lot of issues. TODO: remove print statement and try-except block
+            # A broken or missing music file shouldn't stop the game, it just stays quiet
+            logging.error(f"Failed to play music {music_id}: {e}")
+
+        next_track = MUSIC_SETTINGS['next_track'].get(music_id)
+        if next_track:
+            self.prefetch_music(next_track)
+
+    def prefetch_music(self, music_id: str):
+        """
+        Read a music file into memory on the loader threads, without decoding it,
+        so the next play_music of that track doesn't wait on the disk.
+        Tracks whose file isn't there are skipped, play_music reports those.
+
+        Args:
+            music_id: The identifier of the music track to prefetch
+        """
+        if not self.enabled or self.loader is None or music_id in self.music_futures:
+            return
+        music_file = self.sound_registry['music'].get(music_id)
+        if not music_file:
+            return
+        path = Path('assets/sound') / music_file
+        if not path.is_file():
+            logging.debug(f"Not prefetching music {music_id}, {path} doesn't exist")
+            return
+        self.music_futures[music_id] = self.loader.request_bytes(str(path))
+
+    def _take_prefetched(self, music_id: str) -> Optional[bytes]:
+        """
+        Get a prefetched music file if it has been read, without waiting for it.
+
+        Args:
+            music_id: The identifier of the music track
+        Returns:
+            bytes: The file, or None to stream it from disk instead
+        """
+        future = self.music_futures.pop(music_id, None)
+        if future is None or not future.done():
+            return None
+        if future.exception() is not None:
+            logging.warning(f"Failed to prefetch music {music_id}: {future.exception()}")
+            return None
+        return future.result()
+
+    def update(self, dt: float):
+        """
+        Start the pending music track once the previous one has faded out.
+
+        Args:
+            dt: Time since the last update in seconds
+        """
+        if self.pending_music is None:
+            return
+        self.fade_timer -= dt
+        if self.fade_timer <= 0 or not pygame.mixer.music.get_busy():
+            self._start_music(*self.pending_music)
 
     def stop_music(self):
-        """Stop the currently playing music track."""
-        pygame.mixer.music.stop()
+        """Fade out the currently playing music track."""
+        if self.enabled:
+            pygame.mixer.music.fadeout(self.crossfade_ms)
         self.current_music = None
+        self.pending_music = None
+
+    def is_music_playing(self) -> bool:
+        """
+        Check if a music track is playing or about to start.
+
+        Returns:
+            bool: True if music is playing
+        """
+        if not self.enabled:
+            return False
+        return self.pending_music is not None or pygame.mixer.music.get_busy()
 
     def set_music_volume(self, volume: float):
         """Set the volume for background music (0.0 to 1.0)."""
         self.music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.music_volume)
+        if self.enabled:
+            pygame.mixer.music.set_volume(self.music_volume)
 
     def set_sound_volume(self, volume: float):
         """Set the volume for sound effects (0.0 to 1.0)."""
@@ -0,0 +1,196 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import pygame
+from config import SPATIAL_HASH_SETTINGS
+
+
+class SpatialHash:
+    """
+    Uniform grid broadphase.
+    Items are bucketed into square cells, so a query only looks at the items in the cells it
+    touches instead of every item. Queries return candidates, callers still do the exact test.
+    """
+
+    def __init__(self, cell_size: int = SPATIAL_HASH_SETTINGS["cell_size"]):
+        """
+        Initialize the SpatialHash.
+        Args:
+            cell_size (int): Width and height of a cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Tuple[Any, float, float]]] = {}
+        self.count = 0
+        # Range of occupied cells, used to know when a nearest search can stop
+        self.min_cell = (0, 0)
+        self.max_cell = (-1, -1)
+
+    def clear(self) -> None:
+        """Remove every item."""
+        self.cells.clear()
+        self.count = 0
+        self.min_cell = (0, 0)
+        self.max_cell = (-1, -1)
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Get the cell a point falls in.
+        Args:
+            x (float): X position
+            y (float): Y position
+        Returns:
+            tuple: Column and row of the cell
+        """
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, item: Any, rect: pygame.Rect) -> None:
+        """
+        Add an item covering a rect, it goes in every cell the rect overlaps.
+        Args:
+            item: The item
+            rect (pygame.Rect): The area it covers
+        """
+        left, top = self.cell_of(rect.left, rect.top)
+        right, bottom = self.cell_of(rect.right - 1, rect.bottom - 1)
+        entry = (item, rect.x, rect.y)
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                self._add(column, row, entry)
+        self.count += 1
+
+    def insert_point(self, item: Any, x: float, y: float) -> None:
+        """
+        Add an item at a point.
+        Args:
+            item: The item
+            x (float): X position
+            y (float): Y position
+        """
+        column, row = self.cell_of(x, y)
+        self._add(column, row, (item, x, y))
+        self.count += 1
+
+    def _add(self, column: int, row: int, entry: Tuple[Any, float, float]) -> None:
+        """
+        Put an entry in a cell.
+        Args:
+            column (int): Cell column
+            row (int): Cell row
+            entry (tuple): The item and its position
+        """
+        cell = self.cells.get((column, row))
+        if cell is None:
+            cell = self.cells[(column, row)] = []
+        cell.append(entry)
+        if self.max_cell < self.min_cell:
+            self.min_cell = self.max_cell = (column, row)
+        else:
+            self.min_cell = (min(self.min_cell[0], column), min(self.min_cell[1], row))
+            self.max_cell = (max(self.max_cell[0], column), max(self.max_cell[1], row))
+
+    def query_rect(self, rect: pygame.Rect) -> Iterator[Any]:
+        """
+        Get the items in the cells a rect overlaps, each item once.
+        Args:
+            rect (pygame.Rect): The area to search
+        Returns:
+            iterator: Candidate items
+        """
+        left, top = self.cell_of(rect.left, rect.top)
+        right, bottom = self.cell_of(rect.right - 1, rect.bottom - 1)
+        seen = set()
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                for item, _, _ in self.cells.get((column, row), ()):
+                    if id(item) not in seen:
+                        seen.add(id(item))
+                        yield item
+
+    def query_radius(self, x: float, y: float, radius: float) -> Iterator[Any]:
+        """
+        Get the items within a distance of a point, by their inserted positions.
+        Args:
+            x (float): X position
+            y (float): Y position
+            radius (float): Search distance
+        Returns:
+            iterator: Items in range, each item once
+        """
+        left, top = self.cell_of(x - radius, y - radius)
+        right, bottom = self.cell_of(x + radius, y + radius)
+        radius_squared = radius * radius
+        seen = set()
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                for item, item_x, item_y in self.cells.get((column, row), ()):
+                    if id(item) in seen:
+                        continue
+                    if (item_x - x) ** 2 + (item_y - y) ** 2 <= radius_squared:
+                        seen.add(id(item))
+                        yield item
+
+    def nearest(self, x: float, y: float) -> Optional[Any]:
+        """
+        Get the item closest to a point, by their inserted positions.
+        Searches rings of cells outwards and stops once no closer item can exist. When there are
+        fewer items than cells to search, e.g. a handful of characters, it just checks them all.
+        Args:
+            x (float): X position
+            y (float): Y position
+        Returns:
+            The nearest item, or None if there are no items
+        """
+        if self.count == 0:
+            return None
+
+        column, row = self.cell_of(x, y)
+        # The farthest ring that can still hold an item
+        max_ring = max(
+            abs(column - self.min_cell[0]),
+            abs(column - self.max_cell[0]),
+            abs(row - self.min_cell[1]),
+            abs(row - self.max_cell[1]),
+        )
+
+        nearest_item = None
+        best_distance_squared = float("inf")
+        if self.count <= (2 * max_ring + 1) ** 2:
+            for cell in self.cells.values():
+                for item, item_x, item_y in cell:
+                    distance_squared = (item_x - x) ** 2 + (item_y - y) ** 2
+                    if distance_squared < best_distance_squared:
+                        best_distance_squared = distance_squared
+                        nearest_item = item
+            return nearest_item
+
+        for ring in range(max_ring + 1):
+            # Anything in this ring or further out is at least (ring - 1) cells away
+            ring_distance = max(0, ring - 1) * self.cell_size
+            if ring_distance * ring_distance > best_distance_squared:
+                break
+            for cell_column, cell_row in self._ring_cells(column, row, ring):
+                for item, item_x, item_y in self.cells.get((cell_column, cell_row), ()):
+                    distance_squared = (item_x - x) ** 2 + (item_y - y) ** 2
+                    if distance_squared < best_distance_squared:
+                        best_distance_squared = distance_squared
+                        nearest_item = item
+        return nearest_item
+
+    @staticmethod
+    def _ring_cells(column: int, row: int, ring: int) -> Iterator[Tuple[int, int]]:
+        """
+        Get the cells on the border of the square ring cells away from a cell.
+        Args:
+            column (int): Center cell column
+            row (int): Center cell row
+            ring (int): Distance in cells, 0 is the center cell itself
+        Returns:
+            iterator: Column and row of every cell on the ring
+        """
+        if ring == 0:
+            yield column, row
+            return
+        for offset in range(-ring, ring + 1):
+            yield column + offset, row - ring
+            yield column + offset, row + ring
+        for offset in range(-ring + 1, ring):
+            yield column - ring, row + offset
+            yield column + ring, row + offset
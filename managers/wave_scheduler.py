@@ -0,0 +1,198 @@
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from config import ENEMY_SPAWN, WAVE_SETTINGS
+from .profiler import profiled
+
+ENEMY_TYPES = ("Enemy",)  # Enemy types a wave group can ask for
+
+
+class WaveScheduler:
+    """
+    Spawns the enemies of a level wave by wave, following the level's wave definitions.
+    A wave is made of groups, every group spawns a number of enemies of one type at its spawn
+    points, one every interval. The next wave starts a delay after the last one finished
+    spawning, and looping levels start over with more enemies per group each time round.
+
+    Spawns that are due go into a queue. The queue is only drained while the frame time is
+    within budget and there is room under the level's enemy cap, so a heavy fight delays the
+    next enemies instead of dragging the frame rate down.
+    """
+
+    def __init__(self, game, enemy_manager):
+        """
+        Initialize the WaveScheduler.
+        Args:
+            game (Game): The game instance
+            enemy_manager (EnemyManager or EnemySwarm): Spawns the enemies
+        """
+        self.game = game
+        self.enemy_manager = enemy_manager
+        self.enabled = True
+        self.frame_budget_ms = WAVE_SETTINGS["frame_budget_ms"]
+        self.max_spawns_per_tick = WAVE_SETTINGS["max_spawns_per_tick"]
+        self.definition: Dict[str, Any] = self._default_definition()
+
+        self.time = 0.0
+        self.wave_index = 0  # Counts up forever on looping levels
+        self.next_wave_time = 0.0
+        self.scheduled: Deque[Tuple[float, List[int]]] = deque()  # Spawn time and spawn point choices, soonest first
+        self.queue: Deque[List[int]] = deque()  # Spawns that are due but haven't happened yet
+        self.spawned = 0
+        self.deferred = 0  # Ticks the queue had to wait for the frame budget
+
+    @staticmethod
+    def _default_definition() -> Dict[str, Any]:
+        """
+        Get the endless wave of single enemies used for levels without a wave definition,
+        the same spawning as ENEMY_SPAWN describes.
+        Returns:
+            dict: The level definition
+        """
+        return {
+            "max_enemies": ENEMY_SPAWN["max_enemies"],
+            "loop": True,
+            "waves": [
+                {
+                    "delay": ENEMY_SPAWN["spawn_cooldown"],
+                    "groups": [{"count": 1, "spawn_points": list(range(len(ENEMY_SPAWN["spawn_points"])))}],
+                }
+            ],
+        }
+
+    def start_level(self, level_name: str) -> None:
+        """
+        Load the waves of a level and start from its first wave.
+        Args:
+            level_name (str): Key of the level in the wave definitions file
+        """
+        try:
+            levels = self.game.asset_manager.get_json(WAVE_SETTINGS["path"])
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to load the wave definitions: {e}")
+            levels = {}
+        self.definition = levels.get(level_name) or self._default_definition()
+        for wave in self.definition["waves"]:
+            for group in wave["groups"]:
+                if group.get("type", "Enemy") not in ENEMY_TYPES:
+                    logging.warning(f"Unknown enemy type {group['type']} in the waves of {level_name}")
+        self.enemy_manager.max_enemies = self.definition.get("max_enemies", ENEMY_SPAWN["max_enemies"])
+        self.reset()
+
+    def reset(self) -> None:
+        """Go back to before the first wave and drop everything waiting to spawn."""
+        self.time = 0.0
+        self.wave_index = 0
+        self.next_wave_time = self.definition["waves"][0].get("delay", 0.0) if self.definition["waves"] else None
+        self.scheduled.clear()
+        self.queue.clear()
+        self.spawned = 0
+        self.deferred = 0
+
+    def stop(self) -> None:
+        """Stop spawning, e.g. for benchmarks that place their own enemies."""
+        self.enabled = False
+        self.scheduled.clear()
+        self.queue.clear()
+
+    def difficulty_multiplier(self) -> float:
+        """
+        Get how many times more enemies the groups of the current loop spawn.
+        Returns:
+            float: 1.0 the first time through the waves, growing every loop
+        """
+        waves = self.definition["waves"]
+        difficulty = self.definition.get("difficulty", {})
+        loops = self.wave_index // len(waves)
+        multiplier = 1.0 + difficulty.get("count_per_loop", 0.0) * loops
+        return min(multiplier, difficulty.get("max_multiplier", multiplier))
+
+    def _start_wave(self) -> None:
+        """Schedule every spawn of the current wave and work out when the next one starts."""
+        waves = self.definition["waves"]
+        wave = waves[self.wave_index % len(waves)]
+        multiplier = self.difficulty_multiplier()
+        last_spawn = self.time
+        for group in wave["groups"]:
+            count = round(group["count"] * multiplier)
+            for number in range(count):
+                spawn_time = self.time + group.get("delay", 0.0) + number * group.get("interval", 0.0)
+                self.scheduled.append((spawn_time, group["spawn_points"]))
+                last_spawn = max(last_spawn, spawn_time)
+        self.scheduled = deque(sorted(self.scheduled, key=lambda spawn: spawn[0]))
+        logging.info(f"Wave {self.wave_index + 1} started, difficulty x{multiplier:.2f}")
+
+        self.wave_index += 1
+        if self.wave_index >= len(waves) and not self.definition.get("loop", False):
+            self.next_wave_time = None
+        else:
+            self.next_wave_time = last_spawn + waves[self.wave_index % len(waves)].get("delay", 0.0)
+
+    def over_budget(self) -> bool:
+        """
+        Check if the frames take too long to add more enemies right now.
+        Replays are never over budget, their spawns can't depend on how fast the machine is.
+        Returns:
+            bool: True when spawning should wait
+        """
+        if self.game.replay.mode != "off":
+            return False
+        return self.game.frame_work_ms > self.frame_budget_ms
+
+    @profiled("WaveScheduler.update")
+    def update(self, dt: float) -> None:
+        """
+        Start waves and spawn the enemies that are due.
+        Args:
+            dt (float): Time delta since last update
+        """
+        if not self.enabled:
+            return
+        self.time += dt * self.game.quality.spawn_rate  # Slower while the quality is lowered
+        # The next wave waits until the enemies held back by the cap or the budget are out
+        if self.next_wave_time is not None and self.time >= self.next_wave_time and not self.queue:
+            self._start_wave()
+        while self.scheduled and self.scheduled[0][0] <= self.time:
+            self.queue.append(self.scheduled.popleft()[1])
+
+        if self.queue:
+            if self.over_budget():
+                self.deferred += 1
+                self.game.profiler.count("Waves.deferred")
+            else:
+                self._spawn_queued()
+
+        profiler = self.game.profiler
+        profiler.gauge("Waves.queued", len(self.queue))
+        profiler.gauge("Waves.scheduled", len(self.scheduled))
+
+    def _spawn_queued(self) -> None:
+        """Spawn queued enemies while there is room under the enemy cap."""
+        spawn_points = ENEMY_SPAWN["spawn_points"]
+        for _ in range(self.max_spawns_per_tick):
+            if not self.queue or self.enemy_manager.get_enemy_count() >= self.enemy_manager.max_enemies:
+                return
+            choices = self.queue.popleft()
+            try:
+                self.enemy_manager.spawn_enemy(spawn_points[self.game.rng.choice(choices)])
+            except Exception as e:
+                logging.error(f"Failed to spawn enemy: {str(e)}")
+                continue
+            self.spawned += 1
+            self.game.profiler.count("Waves.spawned")
+
+    def get_stats(self) -> Dict[str, Optional[float]]:
+        """
+        Get the scheduler statistics.
+        Returns:
+            dict: Current wave number, queued and scheduled spawns, spawned enemies,
+                deferred ticks and seconds until the next wave
+        """
+        return {
+            "wave": self.wave_index,
+            "queued": len(self.queue),
+            "scheduled": len(self.scheduled),
+            "spawned": self.spawned,
+            "deferred": self.deferred,
+            "next_wave_in": None if self.next_wave_time is None else max(0.0, self.next_wave_time - self.time),
+        }
@@ -0,0 +1,7 @@
+# Layers of a level's RenderQueue (see managers/render_queue.py), drawn in this order.
+# Kept out of the managers package so characters can use them too.
+ACTORS = 0  # Characters and enemies, sorted by the y of their feet so the ones in front cover the ones behind
+EFFECTS = 1  # Attack range indicators
+HEALTH_BARS = 2
+LAYERS = (ACTORS, EFFECTS, HEALTH_BARS)
+Y_SORTED_LAYERS = (ACTORS,)
@@ -5,6 +5,7 @@ from .story_screen import StoryScreen
 from .level_screen import LevelScreen
 from .pause import PauseScreen
 from .game_over import GameOverScreen
+from .loading_screen import LoadingScreen
 
 __all__ = [
     'Screen',
@@ -13,5 +14,6 @@ __all__ = [
     'StoryScreen',
     'LevelScreen',
     'PauseScreen',
-    'GameOverScreen'
+    'GameOverScreen',
+    'LoadingScreen'
 ]
\ No newline at end of file
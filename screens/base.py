@@ -1,5 +1,5 @@
 import pygame
-from typing import Optional
+from typing import List, Optional
 
 
 class Screen:
@@ -16,6 +16,32 @@ class Screen:
         """
         self.game = game
         self.screen = game.screen
+        self.full_redraw = True  # The next draw must repaint the whole screen
+
+    def on_enter(self) -> None:
+        """
+        Called when the screen is put on the screen stack.
+        """
+        pass
+
+    def on_suspend(self) -> None:
+        """
+        Called when another screen is pushed on top of this one. The screen keeps its state
+        and assets, it just stops being updated and drawn.
+        """
+        pass
+
+    def on_resume(self) -> None:
+        """
+        Called when the screen on top of this one is popped and this one runs again.
+        """
+        pass
+
+    def on_exit(self) -> None:
+        """
+        Called when the screen is removed from the stack for good, release anything it holds here.
+        """
+        pass
 
     def handle_events(self, events: list[pygame.event.Event]) -> None:
         pass
@@ -23,6 +49,31 @@ class Screen:
     def update(self, dt: float) -> None:
         pass
 
-    def draw(self) -> None:
+    def draw(self) -> Optional[List[pygame.Rect]]:
+        """
+        Draw the screen.
+        Returns:
+            The rects that changed if only those need presenting, None to present the whole screen
+        """
         pass
 
+    def get_lazy_image(self, path: str, size=None, mode: str = "convert") -> Optional[pygame.Surface]:
+        """
+        Get an image the screen can be shown without.
+        It starts loading in the background the first time it's asked for, until then
+        this returns None and the screen should draw a stand-in.
+        Args:
+            path (str): Path of the image file
+            size (tuple): Width and height to scale to, None keeps the original size
+            mode (str): Conversion mode, see AssetManager.get_image
+        Returns:
+            pygame.Surface: The image, or None while it's still loading
+        """
+        return self.game.asset_manager.get_image_if_ready(path, size, mode)
+
+    def request_full_redraw(self) -> None:
+        """
+        Make the next draw repaint the whole screen, e.g. after another screen drew over it.
+        """
+        self.full_redraw = True
+
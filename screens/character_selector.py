@@ -1,6 +1,7 @@
+import logging
 import pygame
 from .base import Screen
-from .story_screen import StoryScreen
+from .story_screen import draw_spaceship_interior
 
 
 class CharacterSelector(Screen):
@@ -19,9 +20,6 @@ class CharacterSelector(Screen):
         super().__init__(game)
         self.game = game
         self.initialize_sounds()
-        self.story_screen = StoryScreen(
-            self.game, init_sound=False
-        )  # TODO: When I have proper backgrounds, I don't need to import and intiliaze this at all.
 
         self.player1_index = 0
         self.player2_index = 0
@@ -147,7 +145,7 @@ class CharacterSelector(Screen):
             self.show_error("Error: No characters selected")
             return
 
-        print(f"Starting game with characters: {[char.__class__.__name__ for char in selected_characters]}")
+        logging.info(f"Starting game with characters: {[char.__class__.__name__ for char in selected_characters]}")
         self.game.sound_manager.stop_music()
 
         # Set the selected characters and start the game
@@ -175,19 +173,19 @@ class CharacterSelector(Screen):
             dt (float): Time since last update
         """
         if self.error_timer > 0:
-            self.error_timer -= self.game.clock.get_time()
+            self.error_timer -= dt * 1000
             if self.error_timer <= 0:
                 self.error_message = None
 
     def draw(self):
         """
         Draw the character selector screen
-        for now I am using the story screen to draw the background. I will change this later.
+        for now I am using the story screen's spaceship interior as the background. I will change this later.
         when the game has its own art.
         """
         self.screen.fill((50, 50, 70))
         # Draw background
-        self.story_screen.draw_spaceship_interior()
+        draw_spaceship_interior(self.game, self.screen)
 
         # Draw characters
         self.game.character_manager.draw_characters(self.screen)
@@ -33,7 +33,7 @@ class GameOverScreen(Screen):
             center=(self.game.SCREEN_WIDTH // 2, self.game.SCREEN_HEIGHT // 2 + 50)
         )
 
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.game.get_ticks()
         self.display_duration = 5000  # 7 seconds
         self.subtitle_delay = 1000  # 2 second delay for subtitle
 
@@ -43,7 +43,7 @@ class GameOverScreen(Screen):
         Args:
             dt (float): Time since last update
         """   
-        current_time = pygame.time.get_ticks()
+        current_time = self.game.get_ticks()
         if current_time - self.start_time >= self.display_duration:
             self.game.reset_game()
 
@@ -55,5 +55,5 @@ class GameOverScreen(Screen):
         self.screen.blit(self.text, self.text_rect)
 
         # Only show subtitle after delay
-        if pygame.time.get_ticks() - self.start_time >= self.subtitle_delay:
+        if self.game.get_ticks() - self.start_time >= self.subtitle_delay:
             self.screen.blit(self.subtitle, self.subtitle_rect)
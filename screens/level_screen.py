@@ -1,6 +1,7 @@
 import pygame
 from .base import Screen
-from config import LEVEL_BOUNDS
+from config import LEVEL_BOUNDS, RENDER_SETTINGS
+from managers import RenderQueue
 
 
 class LevelScreen(Screen):
@@ -18,6 +19,7 @@ class LevelScreen(Screen):
         """
         super().__init__(game)
         self.game = game
+        self.level_name = "level_one"  # Key of the level's waves in assets/waves.json
         self.initialize_assets()
         self.initialize_sounds()
         self.initialize_characters()
@@ -29,13 +31,17 @@ class LevelScreen(Screen):
         self.left_x =  LEVEL_BOUNDS["left_x"]
         self.right_x = LEVEL_BOUNDS["right_x"]
 
+        # Dirty rect rendering, the areas drawn last frame get the background restored
+        self.dirty_rects_enabled = RENDER_SETTINGS["dirty_rects"]
+        self.previous_rects = []
+        self.render_queue = RenderQueue(game)  # Draws characters and enemies front to back by depth
+
     def initialize_assets(self):
         """
         Initialize the assets for the level one screen
         """
-        self.background = pygame.image.load("assets/art/level_one.webp").convert()
-        self.background = pygame.transform.scale(
-            self.background, (self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT)
+        self.background = self.game.asset_manager.get_image(
+            "assets/art/level_one.webp", (self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT)
         )
 
     def initialize_sounds(self):
@@ -51,6 +57,9 @@ class LevelScreen(Screen):
         """
         selected_characters = self.game.get_selected_characters()
         self.game.character_manager.initialize_characters_for_level(selected_characters)
+        self.game.replay.begin_level([character.name for character in selected_characters])
+        self.game.enemy_manager.waves.start_level(self.level_name)
+        self.game.enemy_manager.preallocate(self.game.enemy_manager.max_enemies)
 
     def update(self, dt):
         """
@@ -58,7 +67,6 @@ class LevelScreen(Screen):
         Args:
             dt (float): Time since last update
         """
-        dt = self.game.clock.get_time() / 1000  # Convert to seconds
         self.game.character_manager.update_characters(dt)
         self.game.enemy_manager.update(dt)
         self.limit_character_movement()
@@ -77,6 +85,13 @@ class LevelScreen(Screen):
             if animations_complete:
                 self.game.trigger_game_over()
 
+    def on_exit(self):
+        """
+        Remove the level's enemies when the level is closed for good.
+        """
+        self.game.enemy_manager.clear()
+        self.render_queue.clear()
+
     def limit_character_movement(self):
         """
         Limit the characters vertical movement to the backgrounds floor
@@ -101,12 +116,32 @@ class LevelScreen(Screen):
     def draw(self):
         """
         Draw the level one screen
+        Characters and enemies go through the render queue, so whoever stands lower on the
+        screen is drawn in front. With dirty rects enabled only the background behind last
+        frame's sprites is restored, every sprite is drawn again on top, and only those areas
+        get presented.
+        Returns:
+            list: The rects that changed, or None when the whole screen has to be presented
         """
-        self.screen.blit(self.background, (0, 0))
-        self.game.character_manager.draw_characters(self.screen)
-        self.game.enemy_manager.draw(self.screen)
+        full_redraw = self.full_redraw or not self.dirty_rects_enabled
+        if full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            self.full_redraw = False
+        else:
+            for rect in self.previous_rects:
+                self.screen.blit(self.background, rect, rect)
+
+        self.game.character_manager.queue_characters(self.render_queue)
+        self.game.enemy_manager.draw(self.render_queue)
+        drawn_rects = self.render_queue.flush()
         self.game.character_manager.draw_ui(self.screen)
 
+        dirty_rects = self.previous_rects + drawn_rects
+        self.previous_rects = drawn_rects
+        if full_redraw or len(dirty_rects) > RENDER_SETTINGS["max_dirty_rects"]:
+            return None
+        return dirty_rects
+
     # def handle_events(self, events):
     #     """
     #     Handle events for the level one screen
@@ -0,0 +1,71 @@
+import pygame
+from .base import Screen
+from config import PRELOAD_ASSETS
+
+
+class LoadingScreen(Screen):
+    """
+    Shows a progress bar while the assets the game needs up front load in the background,
+    then hands off to the main menu.
+    Args:
+        Screen (Screen): Base class for all screens
+    """
+
+    def __init__(self, game):
+        """
+        Initialize the loading screen and start loading everything in PRELOAD_ASSETS.
+        Args:
+            game (Game): The game instance
+        """
+        super().__init__(game)
+        self.font = pygame.font.Font(None, 36)
+        screen_size = (self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT)
+
+        asset_manager = self.game.asset_manager
+        self.futures = [
+            asset_manager.request_image(path, screen_size) for path in PRELOAD_ASSETS["backgrounds"]
+        ]
+        self.futures += [asset_manager.request_json(path) for path in PRELOAD_ASSETS["data"]]
+        self.futures += self.game.sound_manager.loading_futures
+
+    def get_progress(self):
+        """
+        Get how much of the required set has loaded.
+        Returns:
+            float: 0.0 to 1.0
+        """
+        if not self.futures:
+            return 1.0
+        return sum(future.done() for future in self.futures) / len(self.futures)
+
+    def update(self, dt):
+        """
+        Convert finished images and move on to the main menu once everything is ready.
+        Args:
+            dt (float): Time since last update
+        """
+        self.game.asset_manager.poll()
+        if self.get_progress() >= 1.0:
+            from .main_menu import MainMenu
+
+            self.game.change_screen(MainMenu(self.game))
+
+    def draw(self):
+        """
+        Draw the loading text and progress bar.
+        """
+        self.screen.fill((0, 0, 0))
+
+        text = self.font.render("Loading...", True, (255, 255, 255))
+        text_rect = text.get_rect(center=(self.game.SCREEN_WIDTH // 2, self.game.SCREEN_HEIGHT // 2 - 30))
+        self.screen.blit(text, text_rect)
+
+        bar_width = 400
+        bar_height = 20
+        bar_rect = pygame.Rect(0, 0, bar_width, bar_height)
+        bar_rect.center = (self.game.SCREEN_WIDTH // 2, self.game.SCREEN_HEIGHT // 2 + 10)
+        pygame.draw.rect(self.screen, (50, 50, 50), bar_rect)
+        filled_rect = bar_rect.copy()
+        filled_rect.width = int(bar_width * self.get_progress())
+        pygame.draw.rect(self.screen, (0, 255, 0), filled_rect)
+        pygame.draw.rect(self.screen, (255, 255, 255), bar_rect, 2)
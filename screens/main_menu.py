@@ -1,3 +1,4 @@
+import logging
 import pygame
 from .base import Screen
 
@@ -13,9 +14,8 @@ class MainMenu(Screen):
             game (Game): The game object
         """
         super().__init__(game)
-        self.background = pygame.image.load("assets/art/main_menu_background.png").convert()
-        self.background = pygame.transform.scale(
-            self.background, (self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT)
+        self.background = self.game.asset_manager.get_image(
+            "assets/art/main_menu_background.png", (self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT)
         )
 
         self.font = pygame.font.Font(None, 36)
@@ -69,9 +69,10 @@ class MainMenu(Screen):
         if self.selected_index == 0:  # Start
             self.game.sound_manager.stop_music()
             from .story_screen import StoryScreen  # Import here to avoid circular import
-            self.game.change_screen(StoryScreen(self.game))
+            # The menu stays suspended under the game, so going back to it is instant
+            self.game.push_screen(StoryScreen(self.game))
         elif self.selected_index == 1:  # Options
-            print("Open options")  # Replace with options screen logic
+            logging.info("Open options")  # Replace with options screen logic
         elif self.selected_index == 2:  # Quit
             self.game.sound_manager.stop_music()
             self.game.running = False
@@ -104,6 +105,6 @@ class MainMenu(Screen):
         """
         Resume the main menu screen.
         """
-        # Check to make sure the music is playing
-        if not self.game.sound_manager.is_music_playing():
-            self.initialize_sounds()
+        # The music of the level may still be fading out, play_music crossfades back to the
+        # menu track and does nothing when it's already playing
+        self.initialize_sounds()
@@ -1,3 +1,4 @@
+import logging
 import pygame
 from pygame.constants import KEYDOWN, K_ESCAPE # this is a new way I read aoout keydown in pygame. if it workss TODO: use it in the whole game
 from .base import Screen
@@ -11,15 +12,15 @@ class PauseScreen(Screen):
         screen (pygame.Surface): The screen surface
     """
 
-    def __init__(self, game, previous_screen):
+    def __init__(self, game):
         """
-        Initialize the pause screen.
+        Initialize the pause screen. It is pushed on top of the level, which stays suspended
+        underneath and is resumed by popping this screen.
         Args:
             game (Game): The game instance
-            previous_screen (Screen): The screen to return to when unpaused
         """
         super().__init__(game)
-        self.previous_screen = previous_screen
+        self.backdrop = None  # The last frame of the paused screen with the overlay on top
 
         # UI Constants
         self.BUTTON_WIDTH = 200
@@ -77,28 +78,37 @@ class PauseScreen(Screen):
         Handle the selection of a menu item.
         """
         if self.menu_items[self.selected_index] == "Resume":
-            self.game.change_screen(self.previous_screen)
+            self.game.pop_screen()
         elif self.menu_items[self.selected_index] == "Options":
-            print("Options menu - Coming soon!")
+            logging.info("Options menu - Coming soon!")
         elif self.menu_items[self.selected_index] == "Main Menu":
-            # Reset entire game state by reinitializing MainMenu
-            self.game.sound_manager.stop_music()
+            # Reset entire game state, this goes back to the main menu
             self.game.reset_game()
-            from .main_menu import MainMenu
-
-            self.game.change_screen(MainMenu(self.game))
         elif self.menu_items[self.selected_index] == "Exit Game":
             self.game.running = False
 
-    def draw(self):
+    def on_enter(self):
         """
-        Draw the pause screen.
+        Darken the last frame of the paused screen once, it is used as the background.
         """
-        # Draw semi-transparent overlay
+        self.backdrop = self.screen.copy()
         overlay = pygame.Surface((self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT))
         overlay.fill((0, 0, 0))
         overlay.set_alpha(128)
-        self.screen.blit(overlay, (0, 0))
+        self.backdrop.blit(overlay, (0, 0))
+
+    def on_exit(self):
+        """
+        Release the backdrop.
+        """
+        self.backdrop = None
+
+    def draw(self):
+        """
+        Draw the pause screen.
+        """
+        # Draw the paused game behind a semi-transparent overlay
+        self.screen.blit(self.backdrop, (0, 0))
 
         # Draw "PAUSED" text
         pause_text = self.font.render("PAUSED", True, (255, 255, 255))
@@ -1,8 +1,7 @@
 import pygame
 import textwrap
-import json
 from .base import Screen
-import random
+from managers.quality_manager import STARS
 
 
 class StoryScreen(Screen):
@@ -31,15 +30,12 @@ class StoryScreen(Screen):
         """
         Initialize the assets for the story screen.
         """
-        self.background = pygame.image.load("assets/art/deep_space.png").convert()
-        self.background = pygame.transform.scale(
-            self.background, (self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT)
-        )
+        # The intro text can start over plain black while the background loads
+        self.get_lazy_image("assets/art/deep_space.png", (self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT))
         self.font = pygame.font.Font(None, 36)
 
         # Load story from JSON file
-        with open("assets/story.json", "r") as f:
-            self.story_data = json.load(f)
+        self.story_data = self.game.asset_manager.get_json("assets/story.json")
 
         # Start with the intro segments
         self.story_segments = self.story_data["intro"]
@@ -53,7 +49,7 @@ class StoryScreen(Screen):
         self.current_segment = 0
 
         # Timer to control text appearance
-        self.text_timer = pygame.time.get_ticks()
+        self.text_timer = self.game.get_ticks()
         self.text_delay = 5000  # 5 seconds delay between text segments
         self.fade_duration = 2000  # 2 seconds for fade in and fade out
         self.fade_timer = 0
@@ -85,8 +81,7 @@ class StoryScreen(Screen):
         Args:
             dt (float): Time since last update
         """
-        current_time = pygame.time.get_ticks()
-        dt = self.game.clock.get_time() / 1000
+        current_time = self.game.get_ticks()
 
         # Update characters
         self.game.character_manager.update_characters(dt)
@@ -94,7 +89,7 @@ class StoryScreen(Screen):
         if self.current_segment < len(self.story_segments):
             # Fade in
             if self.fade_direction == 1:
-                self.fade_timer += self.game.clock.get_time()
+                self.fade_timer += dt * 1000
                 if self.fade_timer >= self.fade_duration:
                     self.fade_direction = 0
                     self.fade_timer = self.fade_duration
@@ -105,7 +100,7 @@ class StoryScreen(Screen):
                     self.fade_timer = self.fade_duration
             # Fade out
             elif self.fade_direction == -1:
-                self.fade_timer -= self.game.clock.get_time()
+                self.fade_timer -= dt * 1000
                 if self.fade_timer <= 0:
                     self.fade_direction = 1
                     self.fade_timer = 0
@@ -153,7 +148,13 @@ class StoryScreen(Screen):
             if self.current_segment == 12:  # Adjust index as needed
                 self.draw_evil_bug_lord_dialogue()
         else:
-            self.screen.blit(self.background, (0, 0))
+            background = self.get_lazy_image(
+                "assets/art/deep_space.png", (self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT)
+            )
+            if background:
+                self.screen.blit(background, (0, 0))
+            else:
+                self.screen.fill((0, 0, 0))
             self.draw_story_segment()
 
         # Apply screen shake if active
@@ -163,56 +164,7 @@ class StoryScreen(Screen):
         """
         Draw the interior of the spaceship.
         """
-        self.screen.fill(
-            (50, 50, 70)
-        )  # Darker, cooler grey for a more atmospheric feel
-
-        # Draw windows showing deep space
-        for i in range(3):
-            pygame.draw.ellipse(
-                self.screen,
-                (10, 10, 40),
-                (50 + i * (self.game.SCREEN_WIDTH // 3), 50, 200, 100),
-            )
-            for _ in range(20):
-                x = 50 + i * (self.game.SCREEN_WIDTH // 3) + random.randint(0, 200)
-                y = 50 + random.randint(0, 100)
-                pygame.draw.circle(self.screen, (255, 255, 255), (x, y), 1)
-
-        # Draw control panel with more details
-        panel_width = self.game.SCREEN_WIDTH - 100
-        pygame.draw.rect(
-            self.screen,
-            (70, 70, 80),
-            (50, self.game.SCREEN_HEIGHT - 120, panel_width, 80),
-        )
-        for i in range(5):
-            pygame.draw.circle(
-                self.screen,
-                (200, 50, 50),
-                (100 + i * (panel_width // 5), self.game.SCREEN_HEIGHT - 80),
-                15,
-            )
-            pygame.draw.circle(
-                self.screen,
-                (50, 200, 50),
-                (130 + i * (panel_width // 5), self.game.SCREEN_HEIGHT - 100),
-                10,
-            )
-
-        # Draw character "stations" instead of seats
-        station_width = (self.game.SCREEN_WIDTH - 150) // 4
-        for i in range(4):
-            pygame.draw.rect(
-                self.screen,
-                (60, 60, 80),
-                (50 + i * (station_width + 25), 250, station_width, 200),
-            )
-            pygame.draw.rect(
-                self.screen,
-                (80, 80, 100),
-                (60 + i * (station_width + 25), 260, station_width - 20, 50),
-            )
+        draw_spaceship_interior(self.game, self.screen)
 
     def draw_current_dialogue(self):
         """
@@ -378,3 +330,66 @@ class StoryScreen(Screen):
     #     Resume the story screen.
     #     """
     #     self.initialize_sounds()
+
+
+def draw_spaceship_interior(game, screen):
+    """
+    Draw the interior of the spaceship.
+    This lives outside StoryScreen so the character selector can share the background
+    without building a whole story screen.
+    Args:
+        game (Game): The game object
+        screen (pygame.Surface): The surface to draw on
+    """
+    screen.fill(
+        (50, 50, 70)
+    )  # Darker, cooler grey for a more atmospheric feel
+
+    # Draw windows showing deep space
+    for i in range(3):
+        pygame.draw.ellipse(
+            screen,
+            (10, 10, 40),
+            (50 + i * (game.SCREEN_WIDTH // 3), 50, 200, 100),
+        )
+        if not game.quality.allows(STARS):
+            continue  # The quality manager gave up the stars to save frame time
+        for _ in range(20):
+            x = 50 + i * (game.SCREEN_WIDTH // 3) + game.render_rng.randint(0, 200)
+            y = 50 + game.render_rng.randint(0, 100)
+            pygame.draw.circle(screen, (255, 255, 255), (x, y), 1)
+
+    # Draw control panel with more details
+    panel_width = game.SCREEN_WIDTH - 100
+    pygame.draw.rect(
+        screen,
+        (70, 70, 80),
+        (50, game.SCREEN_HEIGHT - 120, panel_width, 80),
+    )
+    for i in range(5):
+        pygame.draw.circle(
+            screen,
+            (200, 50, 50),
+            (100 + i * (panel_width // 5), game.SCREEN_HEIGHT - 80),
+            15,
+        )
+        pygame.draw.circle(
+            screen,
+            (50, 200, 50),
+            (130 + i * (panel_width // 5), game.SCREEN_HEIGHT - 100),
+            10,
+        )
+
+    # Draw character "stations" instead of seats
+    station_width = (game.SCREEN_WIDTH - 150) // 4
+    for i in range(4):
+        pygame.draw.rect(
+            screen,
+            (60, 60, 80),
+            (50 + i * (station_width + 25), 250, station_width, 200),
+        )
+        pygame.draw.rect(
+            screen,
+            (80, 80, 100),
+            (60 + i * (station_width + 25), 260, station_width - 20, 50),
+        )